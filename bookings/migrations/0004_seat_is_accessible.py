@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_combo_comboticket'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seat',
+            name='is_accessible',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_seat_is_accessible'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticket',
+            name='issued_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
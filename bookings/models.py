@@ -15,6 +15,7 @@ class Seat(models.Model):
     row = models.CharField(max_length=5)
     number = models.IntegerField()
     seat_available = models.BooleanField(default=True) # Si el asiento esta disponible se puede seleccionar en la compra
+    is_accessible = models.BooleanField(default=False) # Asiento para personas con movilidad reducida
 
 
 class Booking(models.Model):
@@ -41,7 +42,7 @@ class Ticket(models.Model):
     booking = models.ForeignKey(Booking, on_delete=CASCADE, related_name='tickets')
     seat = models.ForeignKey(Seat, on_delete=CASCADE)
     ticket_code = models.CharField(max_length=100, unique=True) # Codigo unico para generar codigo QR
-    issued_at = models.DateTimeField(auto_now_add=True)
+    issued_at = models.DateTimeField(auto_now_add=True, db_index=True)   # indexado para agregar las ventas recientes
     is_scanned = models.BooleanField(default=False)
 
 
@@ -1,5 +1,6 @@
 from django.contrib.auth import authenticate
 from rest_framework import serializers
+from core.serializers import ValuesSerializer
 from .models import Seat, Ticket, Combo, ComboTicket, Booking
 from movies.models import Hall
 from movies.serializers import HallSerializer
@@ -328,3 +329,5 @@ class ComboTicketSerializer(serializers.Serializer):
         return instance
 
 
+# Lectura rápida para listados: misma salida que BookingSerializer, sin instanciar modelos
+booking_values = ValuesSerializer(BookingSerializer, Booking)
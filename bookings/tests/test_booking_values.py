@@ -0,0 +1,19 @@
+from decimal import Decimal
+
+import pytest
+
+from bookings.models import Booking
+from bookings.serializers import BookingSerializer, booking_values
+
+pytestmark = pytest.mark.django_db
+
+
+def test_bookings_match_drf_serializer(user, function):
+    for status in ('pending', 'paid', 'cancelled'):
+        Booking.objects.create(user=user, function=function, total_price=Decimal('21'), status=status)
+
+    queryset = Booking.objects.order_by('pk')
+    data = booking_values.serialize(queryset)
+    assert data == BookingSerializer(queryset, many=True).data
+    assert data[0]['total_price'] == '21.00'
+    assert data[0]['created_at'].endswith('Z')
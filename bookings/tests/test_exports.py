@@ -0,0 +1,74 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from bookings.models import Booking
+from bookings.serializers import BookingSerializer
+from core.renderers import FastJSONRenderer, stream_json_array
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bookings(user, function):
+    other = CustomUser.objects.create_user(username='luis', email='luis@example.com', password='x')
+    return [
+        Booking.objects.create(user=owner, function=function, total_price=Decimal('21'), status=status)
+        for owner, status in ((user, 'paid'), (user, 'cancelled'), (other, 'paid'))
+    ]
+
+
+class TestFastJSONRenderer:
+    def test_output_matches_drf_renderer(self):
+        data = {
+            'price': Decimal('10.50'),
+            'when': datetime.datetime(2024, 5, 20, 18, 30, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2024, 5, 20),
+            'title': 'Amélie  ',
+            'items': [1, None, True],
+        }
+        fast = FastJSONRenderer().render(data)
+        assert json.loads(fast) == json.loads(JSONRenderer().render(data))
+        assert b'\\u2028' in fast
+
+    def test_indented_output_uses_standard_renderer(self):
+        rendered = FastJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        assert rendered == b'{\n    "a": 1\n}'
+
+
+class TestStreamingExports:
+    def test_stream_json_array_batches_items(self):
+        chunks = list(stream_json_array(({'n': n} for n in range(5)), batch_size=2))
+        assert len(chunks) == 5
+        assert json.loads(b''.join(chunks)) == [{'n': n} for n in range(5)]
+        assert b''.join(stream_json_array([])) == b'[]'
+
+    def test_my_bookings_export_streams_own_history(self, user, bookings):
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.get('/api/bookings/my-bookings/export/')
+
+        assert response.streaming
+        expected = BookingSerializer(
+            Booking.objects.filter(user=user).order_by('-created_at', '-id'), many=True
+        ).data
+        assert json.loads(b''.join(response.streaming_content)) == expected
+
+    def test_report_is_admin_only_and_filtered(self, user, bookings):
+        client = APIClient()
+        client.force_authenticate(user)
+        assert client.get('/api/bookings/report/').status_code == 403
+
+        client.force_authenticate(CustomUser.objects.create_user(username='admin', email='admin@example.com', password='x', is_admin=True))
+        today = timezone.now().date().isoformat()
+        response = client.get('/api/bookings/report/', {'since': today, 'status': 'paid'})
+        rows = json.loads(b''.join(response.streaming_content))
+        assert [row['id'] for row in rows] == [bookings[0].id, bookings[2].id]
+
+        assert client.get('/api/bookings/report/', {'since': 'ayer'}).status_code == 400
@@ -4,6 +4,8 @@ from .views import (
     SelectSeatsView,
     AddComboView,
     MyBookingsView,
+    MyBookingsExportView,
+    BookingsReportView,
     CancelBookingView
 )
 
@@ -21,6 +23,12 @@ urlpatterns = [
     
     # Ver reservas del usuario
     path('my-bookings/', MyBookingsView.as_view(), name='my-bookings'),
+
+    # Exportar el historial completo de reservas del usuario
+    path('my-bookings/export/', MyBookingsExportView.as_view(), name='my-bookings-export'),
+
+    # Reporte de reservas para administradores
+    path('report/', BookingsReportView.as_view(), name='bookings-report'),
     
     # Cancelar una reserva
     path('cancel/<int:booking_id>/', CancelBookingView.as_view(), name='cancel-booking'),
@@ -3,6 +3,7 @@ Views for handling cinema booking operations including creating bookings,
 selecting seats, adding combos, viewing bookings and cancelling them.
 """
 
+import datetime
 from xmlrpc.client import Fault
 from django.forms import ValidationError
 from rest_framework import status
@@ -12,9 +13,13 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from core.renderers import StreamingJSONResponse
 from movies.models import Function
+from movies.permissions import IsAdminGroupUser
+from users.authentication import TokenClaimsAuthentication
 from .models import Seat, Ticket, Combo, ComboTicket, Booking
-from .serializers import BookingSerializer, SeatSerializer, TicketSerializer, ComboSerializer, ComboTicketSerializer
+from .serializers import (BookingSerializer, SeatSerializer, TicketSerializer, ComboSerializer, ComboTicketSerializer,
+                          booking_values)
 from .services import (
     check_seat_availability, 
     generate_ticket_code, 
@@ -174,6 +179,7 @@ class MyBookingsView(APIView):
     Requires authentication.
     Returns all bookings associated with the authenticated user.
     """
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -183,14 +189,65 @@ class MyBookingsView(APIView):
         Returns:
             Response with list of bookings or no content message if none exist
         """
-        bookings = Booking.objects.filter(user=request.user)
-        if not bookings.exists():
+        data = booking_values.serialize(Booking.objects.filter(user=request.user))
+        if not data:
             return Response({
                 'message': 'No tienes reservas registradas'
             }, status=status.HTTP_204_NO_CONTENT)
 
-        serializer = BookingSerializer(bookings, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
+
+class MyBookingsExportView(APIView):
+    """
+    View for exporting the authenticated user's full booking history.
+
+    Requires authentication.
+    The history can be long, so it is streamed as a JSON array while rows are
+    read from the database instead of being built and rendered in memory.
+    """
+    authentication_classes = [TokenClaimsAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Stream all bookings of the authenticated user, newest first.
+        """
+        bookings = Booking.objects.filter(user=request.user).order_by('-created_at', '-id')
+        return StreamingJSONResponse(booking_values.iter_representation(bookings))
+
+class BookingsReportView(APIView):
+    """
+    View for the admin bookings report.
+
+    Requires authentication and admin group user permissions.
+    Streams every booking matching the optional filters as a JSON array:
+    - since / until: creation date range (YYYY-MM-DD, inclusive)
+    - status: booking status
+    """
+    permission_classes = [IsAuthenticated, IsAdminGroupUser]
+
+    def get(self, request):
+        """
+        Stream the bookings matching the report filters, in creation order.
+        """
+        bookings = Booking.objects.order_by('id')
+        try:
+            since = request.query_params.get('since')
+            if since:
+                bookings = bookings.filter(created_at__date__gte=datetime.date.fromisoformat(since))
+            until = request.query_params.get('until')
+            if until:
+                bookings = bookings.filter(created_at__date__lte=datetime.date.fromisoformat(until))
+        except ValueError:
+            return Response({
+                'message': 'Las fechas deben tener el formato YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        booking_status = request.query_params.get('status')
+        if booking_status:
+            bookings = bookings.filter(status=booking_status)
+
+        return StreamingJSONResponse(booking_values.iter_representation(bookings))
 
 class CancelBookingView(APIView):
     """
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
     'django_filters',
     'bookings',
     'cms',
@@ -50,11 +51,15 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -133,6 +138,23 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: the first hasher hashes new passwords; passwords hashed by the
+# others, or with other parameters, are rehashed transparently on the next login.
+# Measure the cost of each setting on the production CPU with
+# `python manage.py benchmark_password_hashers --target-ms <login budget>`
+PASSWORD_HASHERS = [
+    'users.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'users.hashers.TunedScryptPasswordHasher',
+]
+PASSWORD_HASHER_PARAMS = {
+    'pbkdf2_sha256': {'iterations': 600000},
+    'scrypt': {'work_factor': 2 ** 14, 'block_size': 8, 'parallelism': 1},
+    'argon2': {'time_cost': 2, 'memory_cost': 102400, 'parallelism': 8},
+}
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -159,6 +181,38 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'users.CustomUser'
 AUTHENTICATION_BACKENDS = ['users.backends.CustomAuthBackend']
 
+# Brute-force protection (users.services.LoginProtectionService): failed logins
+# are counted per username and per client IP in 15-minute sliding windows. The
+# account is locked (one write to the users table) after 3 failures; beyond the
+# per-username / per-IP limits attempts are rejected before any password hashing
+LOGIN_MAX_FAILED_ATTEMPTS = 3
+LOGIN_LOCKOUT_MINUTES = 15
+LOGIN_USERNAME_MAX_FAILURES = 10
+LOGIN_IP_MAX_FAILURES = 30
+# Request header with the client IP (e.g. 'HTTP_X_FORWARDED_FOR' behind a trusted proxy)
+LOGIN_CLIENT_IP_HEADER = 'REMOTE_ADDR'
+
+# Seconds an authenticated user is served from the cache (users.authentication);
+# the entry is invalidated whenever the user is saved
+AUTH_USER_CACHE_TIMEOUT = 60
+
+SIMPLE_JWT = {
+    # Issues refresh tokens without an OutstandingToken insert, as LoginView does
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.TokenObtainPairSerializer',
+    # Checks the refresh token blacklist through a Bloom filter before the database
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.TokenRefreshSerializer',
+}
+
+# Refresh token blacklist (users.services.TokenBlacklistService): login issues
+# refresh tokens without an OutstandingToken row (users.tokens.RefreshToken), the
+# row is written when a token is blacklisted. Expired OutstandingToken rows and
+# their blacklist entries are pruned daily in batches, pausing between batches;
+# the Bloom filter is sized for the blacklisted tokens that have not expired yet
+TOKEN_BLACKLIST_BLOOM_CAPACITY = 1000000
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_PRUNE_BATCH_SIZE = 5000
+TOKEN_BLACKLIST_PRUNE_PAUSE = 0.5
+
 # Email
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
@@ -185,6 +239,79 @@ CACHES = {
 # Cache time to live is 15 minutes
 CACHE_TTL = 60 * 15
 
+# Cached response bodies from 1 KB up are stored compressed
+CACHE_COMPRESS_MIN_SIZE = 1024
+
+# Stampede protection: expired entries are served for up to a minute while a
+# single worker recomputes them; a cold miss waits up to half a second for it
+CACHE_STALE_TTL = 60
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_WAIT = 0.5
+
+# Host the cache warm-up (manage.py warm_cache) addresses its in-process requests
+# to; set it to the public host, it must be in ALLOWED_HOSTS
+CACHE_WARMUP_HOST = 'localhost'
+
+# Per-process tier in front of Redis for hot public endpoints: entries kept in
+# each worker's memory, tag versions re-checked against Redis every second
+LOCAL_CACHE_MAX_ENTRIES = 256
+CACHE_TAG_VERSION_LOCAL_TTL = 1
+
+# Cache lookups are measured per key prefix (see /api/metrics/cache/); only
+# recomputes slower than a second or larger than 1 MB are logged
+CACHE_SLOW_COMPUTE_TIME = 1.0
+CACHE_LARGE_PAYLOAD_SIZE = 1024 * 1024
+
+# Celery: Redis as broker; periodic tasks run by the celery-beat service
+CELERY_BROKER_URL = REDIS_URL
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'refresh-movie-popularity': {
+        'task': 'movies.tasks.refresh_movie_popularity_task',
+        'schedule': 60 * 15,
+    },
+    # Expired OutstandingToken rows, with their BlacklistedToken entries
+    'prune-token-blacklist': {
+        'task': 'users.tasks.prune_token_blacklist_task',
+        'schedule': 60 * 60 * 24,
+    },
+    'repair-unread-notification-counts': {
+        'task': 'notifications.tasks.repair_unread_counts_task',
+        'schedule': 60 * 60 * 24,
+    },
+    'apply-notification-retention': {
+        'task': 'notifications.tasks.apply_notification_retention_task',
+        'schedule': 60 * 60 * 24,
+    },
+}
+
+# Trending ranking: ticket sales of the last 30 days, weight halved every 3 days
+TRENDING_WINDOW_DAYS = 30
+TRENDING_HALF_LIFE_DAYS = 3
+
+# Notifications: fan-out to many users is written by celery workers in bulk
+# inserts of this size; broadcasts (promos) are stored once and delivered to
+# each user when they next read their notifications, for 30 days by default
+NOTIFICATION_FAN_OUT_BATCH_SIZE = 2000
+NOTIFICATION_BROADCAST_DAYS = 30
+# Per-user unread counters are kept in the cache and adjusted atomically; a daily
+# job fixes any drift
+NOTIFICATION_UNREAD_COUNT_TTL = 60 * 60 * 24
+# Retention (daily job): read notifications are archived after 14 days and archived
+# ones deleted 30 days after being sent, in primary-key batches with a pause between them
+NOTIFICATION_ARCHIVE_READ_DAYS = 14
+NOTIFICATION_RETENTION_DAYS = 30
+NOTIFICATION_RETENTION_BATCH_SIZE = 5000
+NOTIFICATION_RETENTION_PAUSE = 0.5
+# Server-Sent Events stream (served by cine.asgi): keep-alive comment every 25s,
+# connections closed after 5 minutes and reopened by the client after 3s
+NOTIFICATION_STREAM_HEARTBEAT = 25
+NOTIFICATION_STREAM_MAX_AGE = 60 * 5
+NOTIFICATION_STREAM_RETRY = 3000
+# A broadcast wakes every open stream: each one waits a random delay of up to 5s
+# before delivering its user's copy, so the inserts are spread out
+NOTIFICATION_STREAM_BROADCAST_JITTER = 5
+
 # Spectacular API documentation settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'CineApp API',
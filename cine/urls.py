@@ -18,6 +18,7 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from core.views import CacheMetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -37,6 +38,9 @@ urlpatterns = [
     # URLs de la app notifications
     path('api/notifications/', include('notifications.urls')),
 
+    # Métricas de la caché de respuestas
+    path('api/metrics/cache/', CacheMetricsView.as_view(), name='cache-metrics'),
+
     # API Schema documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
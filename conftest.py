@@ -0,0 +1,30 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.cache import local_cache
+from users.models import CustomUser
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    local_cache.clear()
+
+
+@pytest.fixture
+def user():
+    return CustomUser.objects.create_user(username='ana', email='ana@example.com', password='secreta123')
+
+
+@pytest.fixture
+def token(user):
+    return str(AccessToken.for_user(user))
+
+
+@pytest.fixture
+def auth_client(token):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    return client
@@ -0,0 +1,44 @@
+import time
+from collections import Counter
+
+
+def pk_batches(queryset, batch_size, pause=0):
+    """
+    Yield the primary keys of the rows of queryset, ascending, batch_size at a time.
+
+    Each batch is read with a range on the primary key after the previous one
+    (no OFFSET), and the generator sleeps pause seconds before reading the next
+    batch, once the caller has processed the current one. Jobs that change
+    millions of rows thus run as many short statements, each in its own
+    transaction, without holding long locks nor saturating the database.
+    """
+    last_pk = None
+    while True:
+        batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(batch.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        yield pks
+        if len(pks) < batch_size:
+            return
+        last_pk = pks[-1]
+        time.sleep(pause)
+
+
+def delete_in_batches(queryset, batch_size, pause=0, progress=None):
+    """
+    Delete the rows of queryset in primary-key batches (see pk_batches).
+
+    Each batch is a QuerySet.delete() of its rows, so cascades and signals work
+    as usual, and models without them are deleted with a single DELETE by id.
+    progress, if given, is called after each batch with the running totals.
+    Returns the totals like QuerySet.delete(): (deleted, {model label: deleted}).
+    """
+    deleted, per_model = 0, Counter()
+    for pks in pk_batches(queryset, batch_size, pause):
+        count, counts = queryset.filter(pk__in=pks).delete()
+        deleted += count
+        per_model.update(counts)
+        if progress is not None:
+            progress(deleted, dict(per_model))
+    return deleted, dict(per_model)
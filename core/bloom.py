@@ -0,0 +1,128 @@
+import hashlib
+import math
+import threading
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+
+
+class BloomFilter:
+    """
+    Bloom filter shared by every worker, kept as a Redis bitmap in the default cache.
+
+    Answers "might value be in the set?" with no false negatives and a false
+    positive rate close to error_rate while the set holds at most capacity
+    values, so a negative answer lets the caller skip the authoritative lookup.
+
+    A filter that has not been built (or whose key Redis lost) answers True for
+    everything: callers fall back to the authoritative lookup until rebuild()
+    runs (check() tells them apart, so a caller can rebuild it on demand). Values can be added but not removed; rebuild() from the source of
+    truth to drop stale ones.
+
+    With a cache backend other than Redis (local development, tests) the bitmap
+    lives in the process memory, so it is not shared between processes.
+    """
+
+    def __init__(self, key, capacity, error_rate=0.001):
+        self.key = key
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = None
+        self._lock = threading.Lock()
+
+    def positions(self, value):
+        # Double hashing (Kirsch-Mitzenmacher): k positions from one digest
+        digest = hashlib.sha256(str(value).encode()).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, *values):
+        positions = [position for value in values for position in self.positions(value)]
+        client = self._client()
+        if client is None:
+            with self._lock:
+                if self._bits is not None:
+                    for position in positions:
+                        self._bits[position >> 3] |= 1 << (position & 7)
+            return
+        pipe = client.pipeline(transaction=False)
+        for position in positions:
+            pipe.setbit(self._redis_key(), position, 1)
+        pipe.execute()
+
+    def might_contain(self, value):
+        built, found = self.check(value)
+        return not built or found
+
+    def check(self, value):
+        """
+        Look value up in one round trip: (filter built?, value possibly in the set?).
+
+        The second item is only meaningful when the filter is built.
+        """
+        positions = self.positions(value)
+        client = self._client()
+        if client is None:
+            bits = self._bits
+            if bits is None:
+                return False, True
+            return True, all(bits[position >> 3] & (1 << (position & 7)) for position in positions)
+        pipe = client.pipeline(transaction=False)
+        pipe.getbit(self._redis_key(), self.size)
+        for position in positions:
+            pipe.getbit(self._redis_key(), position)
+        built, *found = pipe.execute()
+        return bool(built), all(found)
+
+    def rebuild(self, values, batch_size=10000):
+        """
+        Replace the filter with one holding exactly values (any iterable).
+
+        The new bitmap is filled under a temporary key and swapped in atomically,
+        so lookups keep working on the old one meanwhile. Values added with add()
+        during the rebuild must be added again afterwards.
+        """
+        client = self._client()
+        if client is None:
+            bits = bytearray((self.size + 7) // 8)
+            for value in values:
+                for position in self.positions(value):
+                    bits[position >> 3] |= 1 << (position & 7)
+            with self._lock:
+                self._bits = bits
+            return
+
+        building = f'{self._redis_key()}:building'
+        client.delete(building)
+        pipe = client.pipeline(transaction=False)
+        for count, value in enumerate(values, 1):
+            for position in self.positions(value):
+                pipe.setbit(building, position, 1)
+            if count % batch_size == 0:
+                pipe.execute()
+        # The bit after the filter marks it as built: add() on a missing key (e.g. evicted)
+        # creates a bitmap without it, which is still treated as not built
+        pipe.setbit(building, self.size, 1)
+        pipe.execute()
+        client.rename(building, self._redis_key())
+
+    def clear(self):
+        """
+        Forget the filter; lookups answer True until the next rebuild().
+        """
+        client = self._client()
+        if client is None:
+            with self._lock:
+                self._bits = None
+            return
+        client.delete(self._redis_key())
+
+    def _client(self):
+        backend = caches['default']
+        if not isinstance(backend, RedisCache):
+            return None
+        return backend._cache.get_client(self.key, write=True)
+
+    def _redis_key(self):
+        return caches['default'].make_key(self.key)
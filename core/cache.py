@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger('cine')
+
+TAG_VERSION_PREFIX = 'cache:tag'
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU cache with a TTL per entry.
+
+    It sits in front of the shared cache for the hottest keys, so each gunicorn
+    worker keeps its own copy for a few seconds and skips the network round-trip.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout):
+        if timeout <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + timeout)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalCache(max_entries=getattr(settings, 'LOCAL_CACHE_MAX_ENTRIES', 256))
+
+
+def tag_version_key(tag):
+    return f'{TAG_VERSION_PREFIX}:{tag}'
+
+
+def _initial_version():
+    # Start from a clock-based value so that, if Redis evicts a version key,
+    # the new version never matches entries cached under the old one
+    return int(time.time() * 1000)
+
+
+def format_tags(tags, kwargs, request=None):
+    """
+    Fill tag placeholders with the view kwargs; '{today}' is the current local date,
+    for responses that change with the date even when no data changed, and '{user}'
+    the id of the authenticated user, for responses about the user making the request.
+    """
+    user = getattr(request, 'user', None)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    return [tag.format(today=timezone.localdate().isoformat(), user=user_id, **kwargs) for tag in tags]
+
+
+def get_tag_state(tags, local_ttl=0):
+    """
+    Return (versions, last_modified) for the given tags with one cache round-trip.
+
+    versions holds the current version of each tag, in the same order.
+    last_modified is the timestamp of the latest bump among them (or of the
+    moment the tag was first seen), usable as a Last-Modified validator.
+
+    With local_ttl, the state is also kept in the in-process cache for that many
+    seconds: entries depending on those tags may then be served up to local_ttl
+    seconds after a bump made by another process (bumps made by this process
+    are seen immediately).
+    """
+    if not tags:
+        return (), None
+
+    keys = [tag_version_key(tag) for tag in tags]
+    local_key = ':'.join(keys)
+    if local_ttl:
+        state = local_cache.get(local_key)
+        if state is not None:
+            return state
+
+    found = cache.get_many(keys + [f'{key}:modified' for key in keys])
+    for key in keys:
+        if key not in found:
+            initial = _initial_version()
+            # add() never overwrites a version created concurrently by another process
+            if not cache.add(key, initial, None):
+                initial = cache.get(key, initial)
+            found[key] = initial
+        if f'{key}:modified' not in found:
+            found[f'{key}:modified'] = time.time()
+            cache.add(f'{key}:modified', found[f'{key}:modified'], None)
+    state = (
+        tuple(found[key] for key in keys),
+        max(found[f'{key}:modified'] for key in keys),
+    )
+
+    if local_ttl:
+        local_cache.set(local_key, state, local_ttl)
+    return state
+
+
+def get_tag_versions(tags, local_ttl=0):
+    """
+    Return the current version of each tag, in the same order (see get_tag_state).
+    """
+    return get_tag_state(tags, local_ttl)[0]
+
+
+def bump_tag_versions(*tags):
+    """
+    Invalidate every cached entry that depends on any of the given tags.
+
+    The bump runs after the current transaction commits, so a concurrent request
+    cannot recompute an entry from uncommitted data and store it under the new version.
+    """
+    if tags:
+        transaction.on_commit(lambda: _bump(tags))
+
+
+def _bump(tags):
+    for tag in tags:
+        key = tag_version_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), None)
+        except Exception as e:
+            logger.error(f'Error bumping cache tag {tag}: {e}', exc_info=True)
+    cache.set_many({f'{tag_version_key(tag)}:modified': time.time() for tag in tags}, None)
+    # Versions cached in this process are stale now
+    local_cache.clear()
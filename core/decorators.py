@@ -1,16 +1,75 @@
 from functools import wraps
 from django.core.cache import cache
 from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, urlencode
+from .cache import format_tags, get_tag_state, get_tag_versions, local_cache
+from .metrics import cache_metrics
 import hashlib
 import logging
+import math
+import random
+import time
+import zlib
 
 logger = logging.getLogger('cine')
 
-def cache_response(timeout=None, key_prefix=''):
+# Rendered bodies at least this large are stored zlib-compressed
+COMPRESS_MIN_SIZE = getattr(settings, 'CACHE_COMPRESS_MIN_SIZE', 1024)
+
+# Seconds an expired entry may still be served while one worker recomputes it
+STALE_TTL = getattr(settings, 'CACHE_STALE_TTL', 60)
+
+# Seconds a recompute lock is held at most, and how long a miss waits for another worker
+LOCK_TIMEOUT = getattr(settings, 'CACHE_LOCK_TIMEOUT', 10)
+LOCK_WAIT = getattr(settings, 'CACHE_LOCK_WAIT', 0.5)
+LOCK_POLL_INTERVAL = 0.05
+
+# Seconds tag versions are trusted in-process when the local tier is enabled
+TAG_VERSION_LOCAL_TTL = getattr(settings, 'CACHE_TAG_VERSION_LOCAL_TTL', 1)
+
+# Recomputes slower or larger than this are logged as warnings
+SLOW_COMPUTE_TIME = getattr(settings, 'CACHE_SLOW_COMPUTE_TIME', 1.0)
+LARGE_PAYLOAD_SIZE = getattr(settings, 'CACHE_LARGE_PAYLOAD_SIZE', 1024 * 1024)
+
+def cache_response(timeout=None, key_prefix='', tags=(), stale_ttl=None, beta=1.0, local_timeout=None,
+                   vary_on_user=True, vary_on_params=None):
     """
     Cache the response of a view for a specified time.
+
+    Each view declares what its response varies on: vary_on_user=False shares
+    one entry between all users (for public data), and vary_on_params lists the
+    query parameters that change the response (None means all of them, () none).
+    Query strings are canonicalized, so parameter order does not split entries.
+
+    The cached entry holds the rendered body (compressed when large), content
+    type, status and ETag, so a hit is written back as a plain HttpResponse
+    without unpickling or re-rendering a DRF Response. Only 200 responses are cached.
+
+    Tags name the data the response depends on (e.g. 'movies', 'movie:{pk}' or 'user:{user}',
+    formatted with the view kwargs; see core.cache.format_tags). Their current versions are part of the cache
+    key, so bumping a tag with core.cache.bump_tag_versions invalidates every
+    entry that depends on it.
+
+    To avoid stampedes when a hot key expires, only one worker recomputes an
+    entry at a time (single-flight lock): the others keep serving the previous
+    entry for up to stale_ttl seconds after it expired, or wait briefly for the
+    new one on a cold miss. Entries are also refreshed early with a probability
+    that grows as expiry approaches and with the time the view takes to compute
+    (scaled by beta), so most refreshes happen before the entry expires at all.
+
+    With local_timeout, fresh entries are also kept for that many seconds in a
+    bounded per-process LRU (core.cache.local_cache) in front of the shared cache,
+    and tag versions are trusted locally for CACHE_TAG_VERSION_LOCAL_TTL seconds,
+    so most hits skip Redis entirely. Meant for hot public endpoints.
+
+    Lookups and recomputes are recorded per key prefix in core.metrics.cache_metrics
+    (hit ratio, compute time, payload size); only anomalies such as slow or very
+    large recomputes are logged.
     """
     def decorator(view_func):
+        metrics_prefix = key_prefix or view_func.__name__
+
         @wraps(view_func)
         def _wrapped_view(self, request, *args, **kwargs):
             # Generate cache key based on the request
@@ -19,28 +78,235 @@ def cache_response(timeout=None, key_prefix=''):
                 key_prefix,
                 view_func.__name__,
                 args,
-                kwargs
+                kwargs,
+                vary_on_user=vary_on_user,
+                vary_on_params=vary_on_params,
+                versions=get_tag_versions(
+                    format_tags(tags, kwargs, request),
+                    local_ttl=TAG_VERSION_LOCAL_TTL if local_timeout else 0
+                )
             )
+            cache_timeout = timeout or settings.CACHE_TTL
+            stale_timeout = STALE_TTL if stale_ttl is None else stale_ttl
 
-            # Try to get the response from cache
-            response = cache.get(cache_key)
-            if response is not None:
-                logger.info(f'Cache hit for key: {cache_key}')
+            def keep_local(entry):
+                if local_timeout:
+                    local_cache.set(cache_key, entry, min(local_timeout, entry['expires_at'] - time.time()))
+
+            def compute():
+                started = time.monotonic()
+                response = render_response(self, request, view_func(self, request, *args, **kwargs), args, kwargs)
+                record_compute(metrics_prefix, cache_key, response, time.monotonic() - started)
+
+                # Cache the rendered response
+                if response.status_code == 200 and not response.streaming:
+                    entry = entry_from_response(response, cache_timeout, time.monotonic() - started)
+                    cache.set(cache_key, entry, cache_timeout + stale_timeout)
+                    keep_local(entry)
+                    response['ETag'] = entry['etag']
                 return response
 
+            # Try the in-process tier first
+            if local_timeout:
+                entry = local_cache.get(cache_key)
+                if entry is not None:
+                    cache_metrics.record(metrics_prefix, 'local_hit')
+                    return response_from_entry(entry)
+
+            # Try to get the response from cache
+            entry = cache.get(cache_key)
+            if entry is not None:
+                if not should_refresh(entry, beta):
+                    cache_metrics.record(metrics_prefix, 'hit')
+                    keep_local(entry)
+                    return response_from_entry(entry)
+
+                # Expired (or picked for early refresh): one worker recomputes,
+                # the rest keep serving the entry they already have
+                if not acquire_lock(cache_key):
+                    cache_metrics.record(metrics_prefix, 'stale_hit')
+                    return response_from_entry(entry)
+                cache_metrics.record(metrics_prefix, 'refresh')
+                try:
+                    return compute()
+                finally:
+                    release_lock(cache_key)
+
             # If not in cache, generate response
-            logger.info(f'Cache miss for key: {cache_key}')
-            response = view_func(self, request, *args, **kwargs)
+            if acquire_lock(cache_key):
+                cache_metrics.record(metrics_prefix, 'miss')
+                try:
+                    return compute()
+                finally:
+                    release_lock(cache_key)
 
-            # Cache the response
-            cache_timeout = timeout or settings.CACHE_TTL
-            cache.set(cache_key, response, cache_timeout)
+            # Another worker is computing this entry: wait briefly for it
+            entry = wait_for_entry(cache_key)
+            if entry is not None:
+                cache_metrics.record(metrics_prefix, 'wait_hit')
+                return response_from_entry(entry)
+            cache_metrics.record(metrics_prefix, 'miss')
+            cache_metrics.record(metrics_prefix, 'wait_timeout')
+            logger.warning(f'Gave up waiting {LOCK_WAIT}s for another worker to compute {cache_key}')
+            return compute()
+        return _wrapped_view
+    return decorator
+
+def conditional_response(tags=(), vary_on_user=True, vary_on_params=None, local_versions=False):
+    """
+    Answer conditional GETs (If-None-Match / If-Modified-Since) with 304 before running the view.
+
+    The validators come from the cache tag versions the response depends on, so
+    checking them costs one cache round-trip and no queries or serialization:
+    the ETag hashes the tag versions with everything the response varies on, and
+    Last-Modified is the time of the latest bump of those tags. With
+    local_versions, tag versions are trusted in-process for
+    CACHE_TAG_VERSION_LOCAL_TTL seconds (as cache_response does with local_timeout).
+
+    Place it above cache_response so its ETag is the one sent to clients.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(self, request, *args, **kwargs)
+
+            versions, modified = get_tag_state(
+                format_tags(tags, kwargs, request),
+                local_ttl=TAG_VERSION_LOCAL_TTL if local_versions else 0
+            )
+            etag = 'W/"%s"' % generate_cache_key(
+                request, 'etag', view_func.__name__, args, kwargs,
+                versions=versions, vary_on_user=vary_on_user, vary_on_params=vary_on_params
+            )
+            last_modified = int(min(modified, time.time())) if modified else None
 
+            if not_modified(request, etag, last_modified):
+                response = HttpResponseNotModified()
+            else:
+                response = view_func(self, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
             return response
         return _wrapped_view
     return decorator
 
-def generate_cache_key(request, prefix, view_name, args, kwargs):
+def record_compute(prefix, cache_key, response, seconds):
+    """
+    Record a recompute in the cache metrics and log it if it looks abnormal.
+    """
+    size = 0 if response.streaming else len(response.content)
+    cache_metrics.record_compute(prefix, seconds, size)
+    if seconds >= SLOW_COMPUTE_TIME:
+        logger.warning(f'Slow cache recompute for {cache_key}: {seconds:.2f}s')
+    if size >= LARGE_PAYLOAD_SIZE:
+        logger.warning(f'Large cached response for {cache_key}: {size} bytes')
+    if response.status_code >= 500:
+        logger.warning(f'Not caching {cache_key}: view returned {response.status_code}')
+
+def not_modified(request, etag, last_modified):
+    """
+    Evaluate the request preconditions; If-None-Match takes precedence over If-Modified-Since.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        if if_none_match.strip() == '*':
+            return True
+        # Weak comparison, as required for If-None-Match
+        opaque_tag = etag[2:] if etag.startswith('W/') else etag
+        return any(
+            (tag[2:] if tag.startswith('W/') else tag) == opaque_tag
+            for tag in parse_etags(if_none_match)
+        )
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return bool(last_modified and if_modified_since and last_modified <= if_modified_since)
+
+def should_refresh(entry, beta):
+    """
+    Decide whether an entry must be recomputed now.
+
+    Expired entries are always refreshed. Fresh ones are refreshed early with
+    probability growing as expiry approaches (probabilistic early expiration):
+    now - delta * beta * log(random()) >= expires_at.
+    """
+    expires_at = entry.get('expires_at')
+    if expires_at is None:
+        return False
+    jitter = entry.get('delta', 0) * beta * -math.log(1.0 - random.random())
+    return time.time() + jitter >= expires_at
+
+def acquire_lock(cache_key):
+    return cache.add(f'{cache_key}:lock', 1, LOCK_TIMEOUT)
+
+def release_lock(cache_key):
+    cache.delete(f'{cache_key}:lock')
+
+def wait_for_entry(cache_key):
+    """
+    Poll for an entry being computed by another worker, for up to LOCK_WAIT seconds.
+    """
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            return entry
+    return None
+
+def render_response(view, request, response, args, kwargs):
+    """
+    Render a DRF Response the same way APIView.dispatch would, so its bytes can be cached.
+    """
+    if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+        if hasattr(view, 'finalize_response'):
+            response = view.finalize_response(request, response, *args, **kwargs)
+        response.render()
+    return response
+
+def entry_from_response(response, timeout, delta=0):
+    """
+    Build the cache entry for a rendered response.
+
+    expires_at is the soft expiry (the entry itself lives stale_ttl seconds longer)
+    and delta is the time it took to compute, used for early refreshes.
+    """
+    content = response.content
+    compressed = len(content) >= COMPRESS_MIN_SIZE
+    return {
+        'status': response.status_code,
+        'content_type': response.get('Content-Type'),
+        'etag': '"%s"' % hashlib.md5(content).hexdigest(),
+        'compressed': compressed,
+        'content': zlib.compress(content) if compressed else content,
+        'expires_at': time.time() + timeout,
+        'delta': delta,
+    }
+
+def response_from_entry(entry):
+    """
+    Write a cache entry back as an HttpResponse.
+    """
+    content = zlib.decompress(entry['content']) if entry['compressed'] else entry['content']
+    response = HttpResponse(content, status=entry['status'], content_type=entry['content_type'])
+    response['ETag'] = entry['etag']
+    return response
+
+def canonical_query_string(query, params=None):
+    """
+    Serialize a QueryDict with its keys sorted, optionally keeping only some params.
+    """
+    return urlencode(sorted(
+        (key, values) for key, values in query.lists()
+        if params is None or key in params
+    ), doseq=True)
+
+def generate_cache_key(request, prefix, view_name, args, kwargs, versions=(),
+                       vary_on_user=True, vary_on_params=None):
     """
     Generate a unique cache key based on the request parameters.
     """
@@ -50,14 +316,17 @@ def generate_cache_key(request, prefix, view_name, args, kwargs):
         view_name,
         request.path,
         request.method,
-        str(request.GET),
+        canonical_query_string(request.GET, vary_on_params),
         str(args),
-        str(kwargs)
+        str(kwargs),
+        str(versions),
+        # The cached bytes depend on the negotiated renderer (JSON, browsable API...)
+        getattr(request, 'accepted_media_type', '') or ''
     ]
 
-    if hasattr(request, 'user') and request.user.is_authenticated:
+    if vary_on_user and hasattr(request, 'user') and request.user.is_authenticated:
         key_components.append(str(request.user.id))
 
     # Join all components and create a hash
     key_string = ':'.join(key_components)
-    return hashlib.md5(key_string.encode()).hexdigest() 
\ No newline at end of file
+    return hashlib.md5(key_string.encode()).hexdigest()
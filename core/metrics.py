@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+# Histogram bucket upper bounds: compute time in seconds, payload size in bytes
+COMPUTE_TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PAYLOAD_SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Lookups that were answered from a cached entry
+HIT_OUTCOMES = ('local_hit', 'hit', 'stale_hit', 'wait_hit')
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; not thread-safe on its own (CacheMetrics holds the lock).
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        # Cumulative counts per upper bound, as Prometheus exposes them
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'avg': self.sum / self.count if self.count else None,
+            'buckets': buckets,
+        }
+
+
+class CacheMetrics:
+    """
+    In-process counters and histograms for cache_response, grouped by key prefix.
+
+    Every lookup is counted by outcome (local_hit, hit, stale_hit, wait_hit, miss,
+    refresh), and every recompute records how long the view took and the size of
+    the rendered body, so TTLs can be tuned per endpoint. hit_ratio is the share
+    of lookups answered from a cached entry (refreshes count as misses).
+
+    Recording only takes a lock and a few additions; nothing is written to disk
+    or sent over the network.
+
+    Metrics are per process: with several gunicorn workers each one keeps its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._counters = defaultdict(lambda: defaultdict(int))
+            self._compute_time = defaultdict(lambda: Histogram(COMPUTE_TIME_BUCKETS))
+            self._payload_size = defaultdict(lambda: Histogram(PAYLOAD_SIZE_BUCKETS))
+
+    def record(self, prefix, outcome):
+        with self._lock:
+            self._counters[prefix][outcome] += 1
+
+    def record_compute(self, prefix, seconds, size):
+        with self._lock:
+            self._compute_time[prefix].observe(seconds)
+            self._payload_size[prefix].observe(size)
+
+    def snapshot(self):
+        with self._lock:
+            prefixes = {}
+            for prefix in sorted(set(self._counters) | set(self._compute_time)):
+                counters = dict(self._counters[prefix])
+                hits = sum(counters.get(outcome, 0) for outcome in HIT_OUTCOMES)
+                lookups = hits + counters.get('miss', 0) + counters.get('refresh', 0)
+                prefixes[prefix] = {
+                    'counters': counters,
+                    'hit_ratio': hits / lookups if lookups else None,
+                    'compute_time': self._compute_time[prefix].snapshot(),
+                    'payload_size': self._payload_size[prefix].snapshot(),
+                }
+            return {
+                'pid': os.getpid(),
+                'uptime': time.time() - self.started_at,
+                'prefixes': prefixes,
+            }
+
+
+cache_metrics = CacheMetrics()
@@ -0,0 +1,167 @@
+import base64
+import datetime
+import json
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor pagination over a unique ordering (keyset / seek method).
+
+    The cursor holds the ordering values of the last row of the page, and the
+    next page is read with a WHERE on those values instead of an OFFSET, so every
+    page costs the same index range scan however deep it is. No count query is
+    run: one extra row is fetched to know whether there is a next page.
+
+    The ordering must end in a unique field (usually 'id'). It can be passed to
+    the constructor or declared on a subclass.
+
+    Pages may hold model instances, values() dicts or values_list() tuples; for
+    tuples the ordering fields must be the last columns (see key_fields).
+    """
+    ordering = ('id',)
+    page_size = api_settings.PAGE_SIZE or 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, ordering=None, page_size=None):
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+        if page_size is not None:
+            self.page_size = page_size
+
+    @property
+    def key_fields(self):
+        return tuple(field.lstrip('-') for field in self.ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.after(position))
+
+        rows = list(queryset.order_by(*self.ordering)[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        # Relative link: the page may be cached and served to clients on any host
+        url = self.request.get_full_path()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param, 'required': False, 'in': 'query',
+                'description': 'Cursor returned in the "next" link of the previous page',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param, 'required': False, 'in': 'query',
+                'description': f'Number of results per page (at most {self.max_page_size})',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def after(self, position):
+        """
+        Build the WHERE clause selecting the rows after position in the ordering:
+        (a > x) OR (a = x AND b > y) OR ... with < for descending fields.
+        """
+        condition, equal = Q(), Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            lookup = f'{name}__lt' if field.startswith('-') else f'{name}__gt'
+            condition |= equal & Q(**{lookup: value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def row_position(self, row):
+        if isinstance(row, tuple):
+            return row[-len(self.ordering):]
+        if isinstance(row, dict):
+            return [row[name] for name in self.key_fields]
+        return [getattr(row, self.model._meta.get_field(name).attname) for name in self.key_fields]
+
+    def encode_cursor(self, row):
+        values = [
+            value.isoformat() if isinstance(value, (datetime.date, datetime.time))
+            else str(value) if isinstance(value, Decimal) else value
+            for value in self.row_position(row)
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':')).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.model._meta.get_field(name).to_python(value)
+                for name, value in zip(self.key_fields, values)
+            ]
+        except (ValueError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class RelativePageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination with relative 'next' / 'previous' links.
+
+    The default links are absolute, built from the request host: a cached page
+    would carry the host of whoever computed it (e.g. the cache warm-up) to every
+    client. As in KeysetPagination, links keep only the path and query string.
+    """
+
+    def get_next_link(self):
+        if not self.page.has_next():
+            return None
+        url = self.request.get_full_path()
+        return replace_query_param(url, self.page_query_param, self.page.next_page_number())
+
+    def get_previous_link(self):
+        if not self.page.has_previous():
+            return None
+        url = self.request.get_full_path()
+        page_number = self.page.previous_page_number()
+        if page_number == 1:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, page_number)
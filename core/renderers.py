@@ -0,0 +1,84 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup: without orjson the standard encoder is used
+    orjson = None
+else:
+    ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_fallback_encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _default(obj):
+    # Decimal, lazy translations, timedelta, querysets... as DRF's encoder renders them
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data):
+    """
+    Encode data as compact UTF-8 JSON bytes, with orjson when it is installed.
+
+    Types orjson does not know (Decimal, lazy strings...) are encoded as DRF's
+    JSONEncoder would; datetimes in UTC use the 'Z' suffix, as DRF fields do.
+    """
+    if orjson is not None:
+        ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+    else:
+        ret = _fallback_encoder.encode(data).encode()
+    # Escape the line separators that are valid JSON but not valid javascript, as DRF does
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson for compact output.
+
+    Indented output (requested with '; indent=N' or by the browsable API) is not
+    a hot path and goes through the standard renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+def stream_json_array(items, batch_size=500):
+    """
+    Yield a JSON array chunk by chunk, encoding batch_size items per chunk.
+
+    Items are consumed lazily, so a queryset iterator is never held in memory.
+    """
+    items = iter(items)
+    yield b'['
+    separator = b''
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            break
+        yield separator + b','.join(dumps(item) for item in batch)
+        separator = b','
+    yield b']'
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    Stream a large list (exports, reports) as a JSON array while it is produced.
+
+    Meant for iterables such as ValuesSerializer.iter_representation(), so rows
+    are encoded and sent as they come from the database cursor.
+    """
+
+    def __init__(self, items, batch_size=500, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(stream_json_array(items, batch_size), **kwargs)
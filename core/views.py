@@ -0,0 +1,24 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from movies.permissions import IsAdminGroupUser
+from .metrics import cache_metrics
+
+
+class CacheMetricsView(APIView):
+    """
+    Expose the cache_response metrics of the worker process serving the request.
+
+    GET returns hit ratio, lookup counters and compute time / payload size
+    histograms per key prefix; DELETE resets them to start a new measurement window.
+    """
+    permission_classes = [IsAuthenticated, IsAdminGroupUser]
+
+    def get(self, request):
+        return Response(cache_metrics.snapshot(), status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        cache_metrics.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
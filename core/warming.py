@@ -0,0 +1,59 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import resolve
+
+logger = logging.getLogger('cine')
+
+# Marks internal warm-up requests (useful to tell them apart in logs and middleware)
+WARMUP_HEADER = 'HTTP_X_CACHE_WARMUP'
+
+
+def warm_path(path, host=None):
+    """
+    Request a GET endpoint in-process so its cache_response entry is computed and stored.
+
+    The request is dispatched through the URL resolver to the real view, so the
+    cache key is exactly the one client requests will use. Entries that are
+    already cached are left as they are. The request is addressed to host
+    (CACHE_WARMUP_HOST by default), which must be in ALLOWED_HOSTS.
+
+    Returns (path, status_code, elapsed_seconds); status_code is None on errors.
+    """
+    started = time.monotonic()
+    try:
+        request = RequestFactory().get(
+            path, HTTP_HOST=host or settings.CACHE_WARMUP_HOST, **{WARMUP_HEADER: '1'}
+        )
+        match = resolve(request.path_info)
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+        return path, response.status_code, time.monotonic() - started
+    except Exception as e:
+        logger.error(f'Error warming cache for {path}: {e}', exc_info=True)
+        return path, None, time.monotonic() - started
+
+
+def _warm_in_thread(path, host=None):
+    try:
+        return warm_path(path, host)
+    finally:
+        # Each pool thread opens its own database connection
+        connections.close_all()
+
+
+def warm_paths(paths, max_workers=4, host=None):
+    """
+    Warm the given paths concurrently with at most max_workers threads.
+
+    The pool is bounded so warming after a deploy does not flood the database.
+    Results (see warm_path) are yielded in the order of paths.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cache-warmup') as executor:
+        for result in executor.map(_warm_in_thread, paths, [host] * len(paths)):
+            yield result
@@ -0,0 +1,114 @@
+"""
+Este módulo define el formato compacto de distribución de asientos de una sala.
+
+Cada fila de la sala se describe con una etiqueta seguida de ':' y una lista de
+bloques separados por espacios. Las filas se separan con saltos de línea o '|':
+
+    A: 10
+    B: 4 _2 4
+    C: a2 _ 6 _ a2
+
+Bloques disponibles:
+- N: N asientos comunes consecutivos
+- aN: N asientos accesibles consecutivos
+- _N: pasillo o hueco de N posiciones ('_' equivale a '_1')
+
+Los asientos se numeran desde 1 dentro de cada fila, sin contar los huecos;
+la posición x de cada asiento sí cuenta los huecos, y la posición y es el índice
+de la fila. A partir de esto se generan los asientos de la sala y la geometría
+del mapa de asientos, sin consultar la tabla de asientos.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from django.core.exceptions import ValidationError
+
+LayoutSeat = namedtuple('LayoutSeat', ['row', 'number', 'x', 'y', 'accessible'])
+
+ROW_SEPARATOR = re.compile(r'[\n|]')
+BLOCK = re.compile(r'^(?P<kind>[aA_]?)(?P<count>\d*)$')
+MAX_ROW_LABEL_LENGTH = 5    # Seat.row
+MAX_BLOCK_SIZE = 500
+
+
+@lru_cache(maxsize=256)
+def parse_layout(layout):
+    """
+    Interpreta una distribución de asientos.
+
+    Args:
+        layout (str): Distribución en el formato compacto del módulo
+
+    Returns:
+        tuple: Asientos (LayoutSeat) en orden de fila y número
+
+    Raises:
+        ValidationError: Si la distribución tiene errores de formato
+    """
+    seats = []
+    rows = set()
+    lines = [line.strip() for line in ROW_SEPARATOR.split(layout or '')]
+
+    for y, line in enumerate(line for line in lines if line):
+        label, separator, blocks = line.partition(':')
+        label = label.strip()
+        if not separator or not label:
+            raise ValidationError(f"Fila inválida '{line}': se espera '<fila>: <bloques>'")
+        if len(label) > MAX_ROW_LABEL_LENGTH:
+            raise ValidationError(f"La etiqueta de fila '{label}' supera los {MAX_ROW_LABEL_LENGTH} caracteres")
+        if label in rows:
+            raise ValidationError(f"La fila '{label}' está repetida")
+        rows.add(label)
+
+        x = number = 0
+        for block in blocks.split():
+            match = BLOCK.match(block)
+            if not match or (match.group('kind') != '_' and not match.group('count')):
+                raise ValidationError(f"Bloque inválido '{block}' en la fila '{label}'")
+            count = int(match.group('count') or 1)
+            if not 0 < count <= MAX_BLOCK_SIZE:
+                raise ValidationError(f"Cantidad inválida '{block}' en la fila '{label}'")
+
+            if match.group('kind') == '_':
+                x += count
+                continue
+            accessible = match.group('kind') in ('a', 'A')
+            for _ in range(count):
+                number += 1
+                seats.append(LayoutSeat(label, number, x, y, accessible))
+                x += 1
+
+        if not number:
+            raise ValidationError(f"La fila '{label}' no tiene asientos")
+
+    return tuple(seats)
+
+
+def layout_geometry(layout):
+    """
+    Genera la geometría del mapa de asientos a partir de la distribución.
+
+    La interpretación de la distribución se cachea (parse_layout devuelve tuplas
+    inmutables); el diccionario se arma en cada llamada, así quien lo recibe
+    puede modificarlo sin afectar a otras respuestas.
+
+    Args:
+        layout (str): Distribución en el formato compacto del módulo
+
+    Returns:
+        dict: Ancho y alto de la grilla, total de asientos y asientos por fila
+    """
+    rows = []
+    for seat in parse_layout(layout):
+        if not rows or rows[-1]['row'] != seat.row:
+            rows.append({'row': seat.row, 'y': seat.y, 'seats': []})
+        rows[-1]['seats'].append({'number': seat.number, 'x': seat.x, 'accessible': seat.accessible})
+
+    return {
+        'width': max((seat['x'] + 1 for row in rows for seat in row['seats']), default=0),
+        'height': len(rows),
+        'total_seats': sum(len(row['seats']) for row in rows),
+        'rows': rows,
+    }
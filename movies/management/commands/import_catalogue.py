@@ -0,0 +1,102 @@
+import csv
+import json
+import sys
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from movies.services import CatalogueImporter
+
+
+class Command(BaseCommand):
+    help = (
+        'Imports a distributor catalogue feed (JSONL or CSV) of movies, halls, seats and functions '
+        'using batched validation and bulk writes'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Path to the feed file, or '-' to read from stdin")
+        parser.add_argument(
+            '--format', choices=['jsonl', 'csv'],
+            help='Feed format (defaults to the file extension)'
+        )
+        parser.add_argument(
+            '--type', dest='row_type', choices=CatalogueImporter.ROW_TYPES,
+            help="Row type for feeds without a 'type' column"
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows validated and written per batch')
+        parser.add_argument('--dry-run', action='store_true', help='Validate the feed and roll back all writes')
+        parser.add_argument('--max-errors', type=int, default=50, help='Rejected rows to print in the report')
+
+    def handle(self, *args, **options):
+        feed_format = options['format'] or self._guess_format(options['path'])
+        importer = CatalogueImporter(batch_size=options['batch_size'])
+
+        stream = sys.stdin if options['path'] == '-' else self._open(options['path'])
+        # Cada lote se escribe en su propia transacción; solo el dry run
+        # envuelve la importación completa para poder descartarla
+        atomic = transaction.atomic() if options['dry_run'] else nullcontext()
+        try:
+            with atomic:
+                for line_number, row in self._read(stream, feed_format):
+                    if options['row_type']:
+                        row.setdefault('type', options['row_type'])
+                    importer.add(row, line_number)
+                importer.finish()
+                if options['dry_run']:
+                    transaction.set_rollback(True)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self._report(importer, options)
+
+    def _guess_format(self, path):
+        if path.endswith('.csv'):
+            return 'csv'
+        if path.endswith(('.jsonl', '.ndjson', '.json')):
+            return 'jsonl'
+        raise CommandError('Cannot infer the feed format, use --format')
+
+    def _open(self, path):
+        try:
+            return open(path, newline='', encoding='utf-8')
+        except OSError as e:
+            raise CommandError(f'Cannot open feed: {e}')
+
+    def _read(self, stream, feed_format):
+        """
+        Yields (line_number, row) pairs without loading the whole feed in memory.
+        """
+        if feed_format == 'csv':
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, row
+            return
+
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f'Invalid JSON on line {line_number}: {e}')
+
+    def _report(self, importer, options):
+        for row_type, counts in importer.stats.items():
+            self.stdout.write(
+                f"{row_type}: {counts['created']} created, {counts['updated']} updated, "
+                f"{counts['rejected']} rejected"
+            )
+
+        for line_number, row_type, message in importer.errors[:options['max_errors']]:
+            self.stderr.write(f'line {line_number} ({row_type}): {message}')
+        if len(importer.errors) > options['max_errors']:
+            self.stderr.write(f'... {len(importer.errors) - options["max_errors"]} more rejected rows')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry run: no changes were saved'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Catalogue import finished'))
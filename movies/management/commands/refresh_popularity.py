@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from movies.services import refresh_movie_popularity
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the daily ticket sales rollup for recent days and recomputes the time-decayed '
+        'popularity used by the trending endpoint (normally run periodically by celery beat)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=2,
+            help='Recent days (including today) to re-aggregate; use the full window to backfill'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days must be positive')
+
+        scored = refresh_movie_popularity(recompute_days=options['days'])
+        self.stdout.write(self.style.SUCCESS(f'Popularity refreshed for {scored} movies'))
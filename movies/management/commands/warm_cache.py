@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.warming import warm_paths
+from movies.services import catalogue_warm_paths
+
+
+class Command(BaseCommand):
+    help = (
+        'Precomputes the cached responses of the public catalogue and showtime endpoints '
+        '(active movies, upcoming functions, trending/upcoming and seat maps), e.g. after a deploy'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7, help='Days of functions to warm, starting today')
+        parser.add_argument('--workers', type=int, default=4, help='Maximum number of concurrent requests')
+        parser.add_argument(
+            '--host', help='Host the warm-up requests are addressed to (CACHE_WARMUP_HOST by default)'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='List the paths without requesting them')
+        parser.add_argument(
+            '--fail-on-error', action='store_true',
+            help='Exit with an error if any path could not be warmed (for deploy pipelines)'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1 or options['workers'] < 1:
+            raise CommandError('--days and --workers must be positive')
+
+        paths = catalogue_warm_paths(days=options['days'])
+        if options['dry_run']:
+            for path in paths:
+                self.stdout.write(path)
+            self.stdout.write(self.style.WARNING(f'Dry run: {len(paths)} paths would be warmed'))
+            return
+
+        started = time.monotonic()
+        failed = []
+        for path, status_code, elapsed in warm_paths(paths, max_workers=options['workers'], host=options['host']):
+            if status_code is None or status_code >= 500:
+                failed.append(path)
+                self.stderr.write(f'{path}: failed ({elapsed:.2f}s)')
+            elif options['verbosity'] > 1:
+                self.stdout.write(f'{path}: {status_code} ({elapsed:.2f}s)')
+
+        self.stdout.write(
+            f'{len(paths) - len(failed)} of {len(paths)} paths warmed in {time.monotonic() - started:.2f}s'
+        )
+        if failed and options['fail_on_error']:
+            raise CommandError(f'{len(failed)} paths could not be warmed')
+        self.stdout.write(self.style.SUCCESS('Cache warm-up finished'))
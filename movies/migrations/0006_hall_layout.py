@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_alter_movie_genre'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hall',
+            name='layout',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
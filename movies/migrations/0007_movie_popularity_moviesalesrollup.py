@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_hall_layout'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='popularity',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-popularity'], name='movies_movi_popular_3c541f_idx'),
+        ),
+        migrations.CreateModel(
+            name='MovieSalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('tickets', models.PositiveIntegerField(default=0)),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_rollups', to='movies.movie')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day'], name='movies_movi_day_c24f48_idx')],
+                'constraints': [models.UniqueConstraint(fields=('movie', 'day'), name='unique_movie_sales_day')],
+            },
+        ),
+    ]
@@ -5,6 +5,7 @@ Define las estructuras de datos para:
 - Películas (Movie): Información detallada de cada película
 - Salas (Hall): Características de las salas de proyección
 - Funciones (Function): Programación de proyecciones de películas
+- Ventas diarias (MovieSalesRollup): Entradas vendidas por película y día, para el ranking de tendencias
 """
 
 import datetime
@@ -36,6 +37,7 @@ class Movie(models.Model):
         rating (DecimalField): Calificación de la película
         genre (CharField): Género de la película (seleccionable de GENRE_CHOICES)
         is_active (BooleanField): Estado de disponibilidad de la película
+        popularity (FloatField): Popularidad según las ventas recientes (ver refresh_movie_popularity)
         created_at (DateTimeField): Fecha y hora de creación del registro
         updated_at (DateTimeField): Fecha y hora de última actualización del registro
     """
@@ -70,6 +72,7 @@ class Movie(models.Model):
     rating = models.DecimalField(max_digits=3, decimal_places=1)
     genre = models.CharField(max_length=50, choices=GENRE_CHOICES)            # genero (accion, comedia, animacion...)
     is_active = models.BooleanField(default=True)
+    popularity = models.FloatField(default=0)           # entradas vendidas con decaimiento temporal, se recalcula periódicamente
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -80,6 +83,7 @@ class Movie(models.Model):
             models.Index(fields=['genre']),
             models.Index(fields=['rating']),
             models.Index(fields=['is_active']),
+            models.Index(fields=['-popularity']),
         ]
         ordering = ['-release_date']
 
@@ -107,11 +111,13 @@ class Hall(models.Model):
         name (CharField): Nombre identificador de la sala
         total_seats (IntegerField): Número total de asientos disponibles
         available (BooleanField): Estado de disponibilidad de la sala
+        layout (TextField): Distribución de asientos en el formato de movies.layouts
     """
 
     name = models.CharField(max_length=50)  # nombre de la sala (sala 1, sala 2, ...)
     total_seats = models.IntegerField()     # total de asientos disponibles
     available = models.BooleanField(default=True)   # la sala puede estar inhabilitada ciertos dias
+    layout = models.TextField(blank=True, default='')   # si se define, los asientos se generan a partir de ella
 
     def __str__(self):
         """Retorna el nombre de la sala como representación en string."""
@@ -160,3 +166,31 @@ class Function(models.Model):
         return f"{self.movie.title} - {self.hall.name} - {self.function_date} {self.function_time_start}"
 
 
+class MovieSalesRollup(models.Model):
+    """
+    Entradas vendidas por película y día.
+
+    Es un agregado de los tickets que se recalcula periódicamente para los días
+    recientes, de modo que el ranking de tendencias se obtiene de unas pocas filas
+    por película en lugar de recorrer todos los tickets.
+
+    Attributes:
+        movie (ForeignKey): Película
+        day (DateField): Día de emisión de los tickets
+        tickets (PositiveIntegerField): Tickets emitidos ese día para reservas no canceladas
+    """
+
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='sales_rollups')
+    day = models.DateField()
+    tickets = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['movie', 'day'], name='unique_movie_sales_day'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"{self.movie_id} - {self.day}: {self.tickets}"
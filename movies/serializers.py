@@ -10,11 +10,15 @@ Cada serializador incluye validaciones específicas y métodos para crear y actu
 """
 
 from django.contrib.auth import authenticate
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from rest_framework import serializers
 from rest_framework.exceptions import PermissionDenied
 
+from core.serializers import ValuesSerializer
+from .layouts import parse_layout
 from .models import Movie, Hall, Function
-from .services import check_movie_upload, check_function_upload
+from .services import check_movie_upload, check_function_upload, apply_hall_layout
 
 
 class HallSerializer(serializers.Serializer):
@@ -23,18 +27,32 @@ class HallSerializer(serializers.Serializer):
 
     Maneja la serialización y deserialización de datos de salas de proyección,
     incluyendo validaciones específicas para nombres duplicados y número de asientos.
+    Si se envía una distribución (layout), el total de asientos se calcula a partir
+    de ella y los asientos de la sala se generan en bloque.
 
     Attributes:
         id (IntegerField): Identificador único de la sala (solo lectura)
         name (CharField): Nombre identificador de la sala
         total_seats (IntegerField): Número total de asientos
         available (BooleanField): Estado de disponibilidad de la sala
+        layout (CharField): Distribución de asientos en el formato de movies.layouts
     """
 
     id = serializers.IntegerField(read_only=True)
     name = serializers.CharField(max_length=100)
-    total_seats = serializers.IntegerField()
+    total_seats = serializers.IntegerField(required=False)
     available = serializers.BooleanField(default=True)
+    layout = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_layout(self, value):
+        """
+        Valida el formato de la distribución de asientos.
+        """
+        try:
+            parse_layout(value)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
+        return value
 
     def validate(self, data):
         """
@@ -49,10 +67,20 @@ class HallSerializer(serializers.Serializer):
         Raises:
             ValidationError: Si el nombre de la sala ya existe o el número de asientos es inválido
         """
-        if Hall.objects.filter(name=data['name']).exists():
-            raise serializers.ValidationError("El nombre de la sala ya existe")
+        if 'name' in data:
+            # Al editar (partial=True) el nombre puede faltar o ser el de la propia sala
+            halls = Hall.objects.filter(name=data['name'])
+            if self.instance is not None:
+                halls = halls.exclude(pk=self.instance.pk)
+            if halls.exists():
+                raise serializers.ValidationError("El nombre de la sala ya existe")
+
+        if data.get('layout'):
+            data['total_seats'] = len(parse_layout(data['layout']))
+        elif 'total_seats' not in data and not self.partial:
+            raise serializers.ValidationError("Se requiere el numero de asientos o la distribucion de la sala")
         
-        if data['total_seats'] <= 0:
+        if 'total_seats' in data and data['total_seats'] <= 0:
             raise serializers.ValidationError("El numero de asientos debe ser mayor que 0")
         
         return data
@@ -60,7 +88,7 @@ class HallSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         """
-        Crea una nueva instancia de Hall.
+        Crea una nueva instancia de Hall y, si tiene distribución, sus asientos.
 
         Args:
             validated_data (dict): Datos validados para crear la sala
@@ -68,7 +96,11 @@ class HallSerializer(serializers.Serializer):
         Returns:
             Hall: Nueva instancia de sala creada
         """
-        hall = Hall.objects.create(**validated_data)
+        layout = validated_data.pop('layout', '')
+        with transaction.atomic():
+            hall = Hall.objects.create(**validated_data)
+            if layout:
+                apply_hall_layout(hall, layout)
         return hall
 
 
@@ -83,9 +115,16 @@ class HallSerializer(serializers.Serializer):
         Returns:
             Hall: Instancia de sala actualizada
         """
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        layout = validated_data.pop('layout', None)
+        with transaction.atomic():
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            if layout == '':
+                # Quitar la distribución no modifica los asientos existentes
+                instance.layout = ''
+            instance.save()
+            if layout:
+                apply_hall_layout(instance, layout)
         return instance
 
 
@@ -94,33 +133,29 @@ class MovieSerializer(serializers.Serializer):
     Serializador para el modelo Movie.
 
     Maneja la serialización y deserialización de datos de películas,
-    incluyendo validaciones para títulos duplicados y fechas de exhibición.
+    incluyendo la validación de títulos duplicados.
 
     Attributes:
         id (IntegerField): Identificador único de la película (solo lectura)
         title (CharField): Título de la película
-        poster (ImageField): Imagen de portada
-        synopsis (CharField): Descripción de la película
+        slug (SlugField): Identificador para URLs, generado a partir del título (solo lectura)
+        description (CharField): Descripción de la película
         duration (IntegerField): Duración en minutos
+        release_date (DateField): Fecha de inicio de exhibición
+        rating (DecimalField): Calificación de la película
         genre (ChoiceField): Género de la película (opciones predefinidas)
-        classification (CharField): Clasificación por edad
-        trailer_url (URLField): Enlace al trailer
-        date_release (DateField): Fecha de inicio de exhibición
-        date_finish (DateField): Fecha de fin de exhibición
-        available (BooleanField): Estado de disponibilidad
+        is_active (BooleanField): Estado de disponibilidad
     """
 
     id = serializers.IntegerField(read_only=True)
     title = serializers.CharField(max_length=255)
-    poster = serializers.ImageField()
-    synopsis = serializers.CharField()
+    slug = serializers.SlugField(read_only=True)
+    description = serializers.CharField()
     duration = serializers.IntegerField()
+    release_date = serializers.DateField()
+    rating = serializers.DecimalField(max_digits=3, decimal_places=1)
     genre = serializers.ChoiceField(choices=Movie.GENRE_CHOICES)
-    classification = serializers.CharField(max_length=50)
-    trailer_url = serializers.URLField()
-    date_release = serializers.DateField()
-    date_finish = serializers.DateField()
-    available = serializers.BooleanField(default=True)
+    is_active = serializers.BooleanField(default=True)
 
     def validate(self, data):
         """
@@ -133,13 +168,14 @@ class MovieSerializer(serializers.Serializer):
             dict: Datos validados
 
         Raises:
-            ValidationError: Si el título ya existe o las fechas son inválidas
+            ValidationError: Si ya existe otra película con el mismo título
         """
-        if Movie.objects.filter(title=data['title']).exists():
-            raise serializers.ValidationError("Esta pelicula ya existe")
-        
-        if data['date_release'] > data['date_finish']:
-            raise serializers.ValidationError("La fecha de fin no puede ser anterior a la fecha de inicio")
+        if 'title' in data:
+            duplicates = Movie.objects.filter(title=data['title'])
+            if self.instance is not None:
+                duplicates = duplicates.exclude(pk=self.instance.pk)
+            if duplicates.exists():
+                raise serializers.ValidationError("Esta pelicula ya existe")
         
         return data
     
@@ -253,9 +289,9 @@ class FunctionSerializer(serializers.Serializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
-        return instance 
-    
-    
-    
-    
-    
\ No newline at end of file
+        return instance
+
+
+# Lectura rápida para listados: misma salida que los serializadores, sin instanciar modelos
+movie_values = ValuesSerializer(MovieSerializer, Movie)
+function_values = ValuesSerializer(FunctionSerializer, Function)
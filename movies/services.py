@@ -1,5 +1,19 @@
+import datetime
+
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from .models import Movie, Hall, Function
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlencode
+from django.utils.text import slugify
+
+from bookings.models import Seat, Ticket
+from core.cache import bump_tag_versions
+from .layouts import parse_layout
+from .models import Movie, Hall, Function, MovieSalesRollup
 
 """
 No permitir cargar dos veces la misma película en la misma fecha y sala:
@@ -39,4 +53,557 @@ def check_function_upload(movie, function, hall, function_date, function_time_st
         function_time_end=function_time_end
     )
     if overlapping_functions.exists():
-        raise ValidationError("El horario de esta función se superpone con otra.")
\ No newline at end of file
+        raise ValidationError("El horario de esta función se superpone con otra.")
+
+def apply_hall_layout(hall, layout):
+    """
+    Aplica una distribución de asientos a una sala con el mínimo de cambios.
+
+    Compara los asientos que describe la distribución con los existentes y, en una
+    sola transacción, crea los que faltan, actualiza los que cambian de tipo y quita
+    los que ya no forman parte de la sala. Los asientos quitados que tienen tickets
+    emitidos no se borran (se perderían los tickets): se marcan como no disponibles,
+    y se vuelven a habilitar si una distribución posterior los incluye de nuevo. Los
+    asientos que siguen en la sala conservan su disponibilidad.
+
+    Args:
+        hall (Hall): Sala a actualizar
+        layout (str): Distribución en el formato de movies.layouts
+
+    Returns:
+        dict: Cantidad de asientos creados, actualizados, borrados y deshabilitados
+
+    Raises:
+        ValidationError: Si la distribución tiene errores de formato
+    """
+    desired = {(seat.row, seat.number): seat.accessible for seat in parse_layout(layout)}
+
+    with transaction.atomic():
+        # Bloquear la sala para que dos ediciones simultáneas no dupliquen asientos
+        previous_layout = Hall.objects.select_for_update().values_list('layout', flat=True).get(pk=hall.pk)
+        existing = {
+            (row, number): (seat_id, is_accessible, seat_available)
+            for seat_id, row, number, is_accessible, seat_available in Seat.objects.filter(hall=hall).values_list(
+                'id', 'row', 'number', 'is_accessible', 'seat_available'
+            )
+        }
+        # Los asientos que ya formaban parte de la sala (sin distribución previa, todos
+        # los existentes) conservan su disponibilidad: pueden estar deshabilitados a mano
+        previous = (
+            {(seat.row, seat.number) for seat in parse_layout(previous_layout)} if previous_layout else set(existing)
+        )
+
+        creates = [
+            Seat(hall=hall, row=row, number=number, is_accessible=accessible)
+            for (row, number), accessible in desired.items()
+            if (row, number) not in existing
+        ]
+        updates = [
+            Seat(pk=seat_id, is_accessible=desired[key], seat_available=seat_available or key not in previous)
+            for key, (seat_id, is_accessible, seat_available) in existing.items()
+            if key in desired and (desired[key] != is_accessible or (not seat_available and key not in previous))
+        ]
+        removed = [seat_id for key, (seat_id, _, _) in existing.items() if key not in desired]
+        with_tickets = set(
+            Ticket.objects.filter(seat_id__in=removed).values_list('seat_id', flat=True)
+        ) if removed else set()
+
+        Seat.objects.bulk_create(creates)
+        Seat.objects.bulk_update(updates, ['is_accessible', 'seat_available'])
+        Seat.objects.filter(id__in=with_tickets).update(seat_available=False)
+        deleted = Seat.objects.filter(id__in=set(removed) - with_tickets).delete()[0] if removed else 0
+
+        hall.layout = layout
+        hall.total_seats = len(desired)
+        hall.save(update_fields=['layout', 'total_seats'])
+
+    return {
+        'created': len(creates),
+        'updated': len(updates),
+        'deleted': deleted,
+        'disabled': len(with_tickets),
+    }
+
+
+def refresh_movie_popularity(recompute_days=2, window_days=None, half_life_days=None):
+    """
+    Recalcula el agregado de ventas diarias y la popularidad de las películas.
+
+    Solo se vuelven a agregar los tickets de los últimos recompute_days días (una
+    consulta agrupada por película y día sobre el índice de issued_at), de modo que
+    el costo no crece con el histórico y las cancelaciones recientes se reflejan.
+    La popularidad suma las entradas de cada día de la ventana ponderadas con
+    decaimiento exponencial (se reduce a la mitad cada half_life_days días) y se
+    guarda en Movie.popularity, para que tendencias sea una lectura ordenada.
+
+    Args:
+        recompute_days (int): Días recientes (incluido hoy) a volver a agregar
+        window_days (int): Días de ventas que cuentan para la popularidad
+        half_life_days (float): Días en los que el peso de una venta se reduce a la mitad
+
+    Returns:
+        int: Cantidad de películas con ventas en la ventana
+    """
+    window_days = window_days or getattr(settings, 'TRENDING_WINDOW_DAYS', 30)
+    half_life_days = half_life_days or getattr(settings, 'TRENDING_HALF_LIFE_DAYS', 3)
+    today = timezone.localdate()
+    since = today - datetime.timedelta(days=recompute_days - 1)
+
+    sales = (
+        Ticket.objects
+        .filter(issued_at__gte=timezone.make_aware(datetime.datetime.combine(since, datetime.time.min)))
+        .exclude(booking__status__in=('cancelled', 'expired'))
+        .annotate(day=TruncDate('issued_at'))
+        .values('booking__function__movie_id', 'day')
+        .annotate(tickets=Count('id'))
+    )
+    rollups = [
+        MovieSalesRollup(movie_id=row['booking__function__movie_id'], day=row['day'], tickets=row['tickets'])
+        for row in sales
+    ]
+
+    with transaction.atomic():
+        MovieSalesRollup.objects.filter(day__gte=since).delete()
+        MovieSalesRollup.objects.bulk_create(rollups)
+
+        scores = {}
+        window = MovieSalesRollup.objects.filter(day__gt=today - datetime.timedelta(days=window_days))
+        for movie_id, day, tickets in window.values_list('movie_id', 'day', 'tickets'):
+            weight = 0.5 ** ((today - day).days / half_life_days)
+            scores[movie_id] = scores.get(movie_id, 0) + tickets * weight
+
+        # update()/bulk_update no disparan los signals: solo cambia el ranking de tendencias
+        Movie.objects.exclude(pk__in=scores).exclude(popularity=0).update(popularity=0)
+        movies = [Movie(pk=movie_id, popularity=score) for movie_id, score in scores.items()]
+        Movie.objects.bulk_update(movies, ['popularity'], batch_size=500)
+        bump_tag_versions('trending')
+
+    return len(scores)
+
+
+def catalogue_warm_paths(days=7):
+    """
+    Enumera los endpoints públicos más consultados, para precalcular sus respuestas cacheadas.
+
+    Incluye el catálogo de películas activas (listado, detalle, tendencias y
+    estrenos), la cartelera de los próximos días (por fecha y por película) y
+    el mapa de asientos de las salas con funciones en ese período.
+
+    Args:
+        days (int): Cantidad de días de cartelera a incluir, a partir de hoy
+
+    Returns:
+        list: Rutas (con query string) a solicitar con GET
+    """
+    today = timezone.localdate()
+    dates = [today + datetime.timedelta(days=offset) for offset in range(days)]
+    functions = Function.objects.filter(function_date__range=(dates[0], dates[-1]))
+
+    def with_query(name, **params):
+        return f'{reverse(name)}?{urlencode(params)}' if params else reverse(name)
+
+    paths = [
+        with_query('list-movies'),
+        with_query('catalog-list'),
+        with_query('catalog-trending'),
+        with_query('catalog-upcoming'),
+        with_query('list-functions'),
+    ]
+    paths += [
+        reverse('catalog-detail', kwargs={'pk': pk})
+        for pk in Movie.objects.filter(is_active=True).order_by('pk').values_list('pk', flat=True)
+    ]
+    paths += [with_query('list-functions', date=day.isoformat()) for day in dates]
+    paths += [
+        with_query('list-functions', movie_id=movie_id)
+        for movie_id in functions.order_by('movie_id').values_list('movie_id', flat=True).distinct()
+    ]
+    paths += [
+        reverse('hall-seat-map', kwargs={'pk': pk})
+        for pk in Hall.objects.filter(pk__in=functions.values('hall_id')).exclude(layout='')
+        .order_by('pk').values_list('pk', flat=True)
+    ]
+    return paths
+
+
+class CatalogueImporter:
+    """
+    Importa el catálogo de un distribuidor (películas, salas, asientos y funciones).
+
+    Las filas se acumulan por tipo y se procesan en lotes: cada lote se valida
+    en memoria contra diccionarios de búsqueda que se cargan con una sola consulta
+    por lote (en lugar de un exists() por fila) y se escribe con bulk_create /
+    bulk_update dentro de una transacción.
+
+    Las filas que ya existen en la base (mismo título, mismo nombre de sala,
+    misma posición de asiento o misma función) se actualizan, escribiendo solo los
+    campos presentes en la fila; las filas repetidas
+    dentro del mismo feed se rechazan. Los asientos y funciones cuya sala o película
+    todavía no apareció en el feed se reintentan al final de la importación.
+
+    Attributes:
+        ROW_TYPES (tuple): Tipos de fila soportados, en orden de dependencia
+        stats (dict): Cantidad de filas creadas, actualizadas y rechazadas por tipo
+        errors (list): Tuplas (línea, tipo, mensaje) de las filas rechazadas
+    """
+
+    ROW_TYPES = ('movie', 'hall', 'seat', 'function')
+
+    # Tipos que deben escribirse antes de procesar un lote de cada tipo
+    DEPENDENCIES = {
+        'movie': (),
+        'hall': (),
+        'seat': ('hall',),
+        'function': ('movie', 'hall'),
+    }
+
+    # Al actualizar se escriben solo los campos presentes en cada fila
+    MOVIE_UPDATE_FIELDS = ['description', 'duration', 'release_date', 'rating', 'genre', 'is_active']
+    # La distribución la escribe apply_hall_layout, que la compara con la anterior
+    HALL_UPDATE_FIELDS = ['total_seats', 'available']
+    SEAT_UPDATE_FIELDS = ['seat_available', 'is_accessible']
+    FUNCTION_UPDATE_FIELDS = ['function_time_end', 'price', 'language', 'format']
+
+    def __init__(self, batch_size=500):
+        self.batch_size = batch_size
+        self.buffers = {row_type: [] for row_type in self.ROW_TYPES}
+        self.stats = {
+            row_type: {'created': 0, 'updated': 0, 'rejected': 0}
+            for row_type in self.ROW_TYPES
+        }
+        self.errors = []
+
+        # Diccionarios de búsqueda, se completan por lote
+        self.movie_ids = {}         # título -> id
+        self.movie_slugs = None     # slugs en uso, se cargan al crear la primera película
+        self.hall_ids = {}          # nombre -> id
+        self.seat_ids = {}          # (hall_id, fila, número) -> id
+        self.loaded_seat_halls = set()
+        self.function_ids = {}      # (movie_id, hall_id, fecha, inicio) -> id
+        self.function_slots = {}    # (hall_id, fecha) -> [(inicio, fin, id)]
+
+        # Claves ya vistas en el feed, para detectar duplicados
+        self.seen = {row_type: set() for row_type in self.ROW_TYPES}
+
+        # Filas que referencian una sala o película desconocida
+        self.deferred = {row_type: [] for row_type in self.ROW_TYPES}
+        self.finishing = False
+
+    def add(self, row, line_number=None):
+        """
+        Agrega una fila del feed al lote correspondiente.
+
+        Args:
+            row (dict): Fila del feed; debe incluir la clave 'type'
+            line_number (int): Número de línea en el feed, para reportar errores
+        """
+        row_type = (row.get('type') or '').strip().lower()
+        if row_type not in self.ROW_TYPES:
+            self._reject(line_number, row_type or '?', f"Tipo de fila desconocido: '{row_type}'")
+            return
+
+        values = {
+            key: value for key, value in row.items()
+            if key != 'type' and value not in (None, '')
+        }
+        self.buffers[row_type].append((line_number, values))
+        if len(self.buffers[row_type]) >= self.batch_size:
+            self.flush(row_type)
+
+    def finish(self):
+        """
+        Escribe todos los lotes pendientes, respetando el orden de dependencias.
+        """
+        for row_type in self.ROW_TYPES:
+            self.flush(row_type)
+
+        self.finishing = True
+        for row_type in self.ROW_TYPES:
+            self.buffers[row_type], self.deferred[row_type] = self.deferred[row_type], []
+            self.flush(row_type)
+
+    def flush(self, row_type):
+        """
+        Valida y escribe el lote pendiente de un tipo de fila.
+
+        Args:
+            row_type (str): Tipo de fila a escribir
+        """
+        for dependency in self.DEPENDENCIES[row_type]:
+            self.flush(dependency)
+
+        rows, self.buffers[row_type] = self.buffers[row_type], []
+        if rows:
+            getattr(self, f'_flush_{row_type}s')(rows)
+
+    def _reject(self, line_number, row_type, message):
+        self.errors.append((line_number, row_type, message))
+        if row_type in self.stats:
+            self.stats[row_type]['rejected'] += 1
+
+    def _build(self, model, row_type, line_number, values, exclude=()):
+        """
+        Construye una instancia sin guardar y ejecuta las validaciones de campo
+        del modelo (tipos, choices, longitudes), sin consultas a la base.
+        """
+        try:
+            instance = model(**values)
+            instance.full_clean(exclude=list(exclude), validate_unique=False)
+        except (TypeError, ValidationError) as e:
+            message = '; '.join(
+                f'{field}: {" ".join(errors)}' for field, errors in e.message_dict.items()
+            ) if hasattr(e, 'message_dict') else str(e)
+            self._reject(line_number, row_type, message)
+            return None
+        return instance
+
+    def _missing_parent(self, row_type, line_number, values, message):
+        """
+        Difiere la fila hasta el final de la importación, o la rechaza si ya
+        se están procesando las filas diferidas.
+        """
+        if self.finishing:
+            self._reject(line_number, row_type, message)
+        else:
+            self.deferred[row_type].append((line_number, values))
+
+    def _is_duplicate(self, row_type, key, line_number, label):
+        if key in self.seen[row_type]:
+            self._reject(line_number, row_type, f'{label} repetido en el feed')
+            return True
+        self.seen[row_type].add(key)
+        return False
+
+    def _resolve(self, model, lookup, field, names):
+        """
+        Completa un diccionario de búsqueda (nombre -> id) con una sola consulta
+        para los nombres que todavía no se conocen.
+        """
+        missing = {name for name in names if name not in lookup}
+        if missing:
+            lookup.update(model.objects.filter(**{f'{field}__in': missing}).values_list(field, 'id'))
+
+    @staticmethod
+    def _present_fields(values, update_fields, always=()):
+        """
+        Campos a escribir al actualizar una fila existente: solo los presentes en
+        la fila, porque bulk_update pisaría los demás con los valores por defecto
+        del modelo (por ejemplo, volvería a activar una película dada de baja).
+        """
+        return tuple(field for field in update_fields if field in values) + tuple(always)
+
+    def _write(self, model, row_type, creates, updates):
+        """
+        Escribe un lote: un bulk_create y un bulk_update por cada combinación de
+        campos presentes (updates es un diccionario campos -> instancias).
+        """
+        updated = [instance for group in updates.values() for instance in group]
+        with transaction.atomic():
+            if creates:
+                model.objects.bulk_create(creates, batch_size=self.batch_size)
+            for fields, group in updates.items():
+                model.objects.bulk_update(group, list(fields), batch_size=self.batch_size)
+            # bulk_create/bulk_update no disparan los signals que invalidan la caché
+            if model is Movie and (creates or updated):
+                bump_tag_versions('movies', *[f'movie:{movie.pk}' for movie in updated])
+            elif model is Function and (creates or updated):
+                bump_tag_versions('functions')
+            elif model is Hall and updated:
+                bump_tag_versions(*[f'hall:{hall.pk}' for hall in updated])
+        self.stats[row_type]['created'] += len(creates)
+        self.stats[row_type]['updated'] += len(updated)
+
+    def _flush_movies(self, rows):
+        movies = []
+        for line_number, values in rows:
+            movie = self._build(Movie, 'movie', line_number, values, exclude=['slug'])
+            if movie is None or self._is_duplicate('movie', movie.title, line_number, 'Título'):
+                continue
+            movies.append((movie, self._present_fields(values, self.MOVIE_UPDATE_FIELDS, always=['updated_at'])))
+
+        self._resolve(Movie, self.movie_ids, 'title', [movie.title for movie, _ in movies])
+
+        creates, updates = [], {}
+        now = timezone.now()
+        for movie, fields in movies:
+            if movie.title in self.movie_ids:
+                movie.pk = self.movie_ids[movie.title]
+                movie.updated_at = now
+                updates.setdefault(fields, []).append(movie)
+            else:
+                movie.slug = self._unique_slug(movie.title)
+                creates.append(movie)
+
+        self._write(Movie, 'movie', creates, updates)
+        # MySQL no devuelve las claves primarias de bulk_create
+        self._resolve(Movie, self.movie_ids, 'title', [movie.title for movie in creates])
+
+    def _unique_slug(self, title):
+        if self.movie_slugs is None:
+            self.movie_slugs = set(Movie.objects.values_list('slug', flat=True))
+        base = slugify(title)
+        slug, suffix = base, 2
+        while slug in self.movie_slugs:
+            slug = f'{base}-{suffix}'
+            suffix += 1
+        self.movie_slugs.add(slug)
+        return slug
+
+    def _flush_halls(self, rows):
+        halls = []
+        for line_number, values in rows:
+            # Con distribución, el total de asientos se calcula a partir de ella
+            exclude = ['total_seats'] if values.get('layout') else []
+            fields = self._present_fields(
+                dict(values, total_seats=True) if 'total_seats' in exclude else values, self.HALL_UPDATE_FIELDS
+            )
+            hall = self._build(Hall, 'hall', line_number, values, exclude=exclude)
+            if hall is None or self._is_duplicate('hall', hall.name, line_number, 'Nombre de sala'):
+                continue
+            if hall.layout:
+                try:
+                    hall.total_seats = len(parse_layout(hall.layout))
+                except ValidationError as e:
+                    self._reject(line_number, 'hall', ' '.join(e.messages))
+                    continue
+            if hall.total_seats <= 0:
+                self._reject(line_number, 'hall', 'El numero de asientos debe ser mayor que 0')
+                continue
+            halls.append((hall, fields))
+
+        self._resolve(Hall, self.hall_ids, 'name', [hall.name for hall, _ in halls])
+
+        creates, updates = [], {}
+        for hall, fields in halls:
+            if hall.name in self.hall_ids:
+                hall.pk = self.hall_ids[hall.name]
+                updates.setdefault(fields, []).append(hall)
+            else:
+                creates.append(hall)
+
+        self._write(Hall, 'hall', creates, updates)
+        self._resolve(Hall, self.hall_ids, 'name', [hall.name for hall in creates])
+
+        # Las salas con distribución generan sus asientos en bloque
+        for hall, _ in halls:
+            if hall.layout:
+                hall.pk = self.hall_ids[hall.name]
+                apply_hall_layout(hall, hall.layout)
+                self.loaded_seat_halls.discard(hall.pk)
+
+    def _flush_seats(self, rows):
+        self._resolve(Hall, self.hall_ids, 'name', [values.get('hall') for _, values in rows])
+
+        seats = []
+        for line_number, row in rows:
+            values = dict(row)
+            hall_name = values.pop('hall', None)
+            if hall_name not in self.hall_ids:
+                self._missing_parent('seat', line_number, row, f"La sala '{hall_name}' no existe")
+                continue
+            values['hall_id'] = self.hall_ids[hall_name]
+            seat = self._build(Seat, 'seat', line_number, values, exclude=['hall'])
+            if seat is None:
+                continue
+            key = (seat.hall_id, str(seat.row), seat.number)
+            if self._is_duplicate('seat', key, line_number, 'Asiento'):
+                continue
+            seats.append((key, seat, self._present_fields(values, self.SEAT_UPDATE_FIELDS)))
+
+        hall_ids = {seat.hall_id for _, seat, _ in seats} - self.loaded_seat_halls
+        if hall_ids:
+            for seat_id, hall_id, row, number in Seat.objects.filter(
+                hall_id__in=hall_ids
+            ).values_list('id', 'hall_id', 'row', 'number'):
+                self.seat_ids[(hall_id, row, number)] = seat_id
+            self.loaded_seat_halls |= hall_ids
+
+        creates, updates = [], {}
+        for key, seat, fields in seats:
+            if key not in self.seat_ids:
+                creates.append(seat)
+            elif fields:
+                # Un asiento existente sin campos que actualizar queda como está
+                seat.pk = self.seat_ids[key]
+                updates.setdefault(fields, []).append(seat)
+
+        self._write(Seat, 'seat', creates, updates)
+        if creates:
+            # Se recargan los asientos de las salas afectadas en la próxima búsqueda
+            self.loaded_seat_halls -= {seat.hall_id for seat in creates}
+
+    def _flush_functions(self, rows):
+        self._resolve(Movie, self.movie_ids, 'title', [values.get('movie') for _, values in rows])
+        self._resolve(Hall, self.hall_ids, 'name', [values.get('hall') for _, values in rows])
+
+        functions = []
+        for line_number, row in rows:
+            values = dict(row)
+            title = values.pop('movie', None)
+            hall_name = values.pop('hall', None)
+            if title not in self.movie_ids:
+                self._missing_parent('function', line_number, row, f"La película '{title}' no existe")
+                continue
+            if hall_name not in self.hall_ids:
+                self._missing_parent('function', line_number, row, f"La sala '{hall_name}' no existe")
+                continue
+            values['movie_id'] = self.movie_ids[title]
+            values['hall_id'] = self.hall_ids[hall_name]
+            function = self._build(Function, 'function', line_number, values, exclude=['movie', 'hall'])
+            if function is None:
+                continue
+            if function.function_time_end <= function.function_time_start:
+                self._reject(line_number, 'function', 'La hora de fin debe ser posterior a la hora de inicio')
+                continue
+            key = (function.movie_id, function.hall_id, function.function_date, function.function_time_start)
+            if self._is_duplicate('function', key, line_number, 'Función'):
+                continue
+            functions.append((line_number, key, function, self._present_fields(values, self.FUNCTION_UPDATE_FIELDS)))
+
+        self._load_function_slots({(function.hall_id, function.function_date) for _, _, function, _ in functions})
+
+        creates, updates = [], {}
+        for line_number, key, function, fields in functions:
+            function.pk = self.function_ids.get(key)
+            slot = (function.hall_id, function.function_date)
+            if self._overlaps(self.function_slots[slot], function):
+                self._reject(line_number, 'function', 'El horario de esta función se superpone con otra.')
+                continue
+            self.function_slots[slot] = [
+                interval for interval in self.function_slots[slot]
+                if function.pk is None or interval[2] != function.pk
+            ] + [(function.function_time_start, function.function_time_end, function.pk)]
+            if function.pk:
+                updates.setdefault(fields, []).append(function)
+            else:
+                creates.append(function)
+
+        self._write(Function, 'function', creates, updates)
+
+    def _load_function_slots(self, slots):
+        """
+        Carga con una sola consulta las funciones existentes de las salas y fechas
+        del lote, para detectar duplicados y solapamientos.
+        """
+        slots = slots - set(self.function_slots)
+        if not slots:
+            return
+        for slot in slots:
+            self.function_slots[slot] = []
+        existing = Function.objects.filter(
+            hall_id__in={hall_id for hall_id, _ in slots},
+            function_date__in={function_date for _, function_date in slots},
+        ).values_list('id', 'movie_id', 'hall_id', 'function_date', 'function_time_start', 'function_time_end')
+        for function_id, movie_id, hall_id, function_date, start, end in existing:
+            slot = (hall_id, function_date)
+            if slot in slots:
+                self.function_ids[(movie_id, hall_id, function_date, start)] = function_id
+                self.function_slots[slot].append((start, end, function_id))
+
+    @staticmethod
+    def _overlaps(intervals, function):
+        return any(
+            start < function.function_time_end and function.function_time_start < end
+            for start, end, function_id in intervals
+            if function.pk is None or function_id != function.pk
+        )
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.cache import bump_tag_versions
+from movies.models import Movie, Hall, Function
+
+
+@receiver([post_save, post_delete], sender=Movie)
+def invalidate_movie_cache(sender, instance, **kwargs):
+    """
+    Invalida las respuestas cacheadas que dependen de la película modificada
+    """
+    bump_tag_versions('movies', f'movie:{instance.pk}')
+
+
+@receiver([post_save, post_delete], sender=Function)
+def invalidate_function_cache(sender, instance, **kwargs):
+    """
+    Invalida las respuestas cacheadas que dependen de la cartelera de funciones
+    """
+    bump_tag_versions('functions')
+
+
+@receiver([post_save, post_delete], sender=Hall)
+def invalidate_hall_cache(sender, instance, **kwargs):
+    """
+    Invalida el mapa de asientos cacheado de la sala modificada
+    """
+    bump_tag_versions(f'hall:{instance.pk}')
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .services import refresh_movie_popularity
+
+
+@shared_task
+def refresh_movie_popularity_task():
+    """
+    Tarea periódica que recalcula el ranking de tendencias a partir de las ventas recientes
+    """
+    return refresh_movie_popularity()
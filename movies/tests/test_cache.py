@@ -0,0 +1,285 @@
+import datetime
+import json
+import pickle
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from core import decorators
+from core.cache import LocalCache
+from core.decorators import cache_response, conditional_response, generate_cache_key, should_refresh
+from core.metrics import cache_metrics
+from core.views import CacheMetricsView
+from movies.models import Movie
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+class CountingView(APIView):
+    authentication_classes = []
+    permission_classes = []
+    calls = 0
+
+    @cache_response(timeout=60, key_prefix='test_movies', tags=('movies', 'movie:{pk}'))
+    def get(self, request, pk):
+        CountingView.calls += 1
+        return Response({'calls': CountingView.calls, 'padding': 'x' * int(request.GET.get('size', 0))})
+
+
+class LocalCountingView(CountingView):
+    @cache_response(timeout=60, key_prefix='test_movies_local', tags=('movies',), local_timeout=5)
+    def get(self, request, pk):
+        CountingView.calls += 1
+        return Response({'calls': CountingView.calls})
+
+
+class ConditionalView(CountingView):
+    @conditional_response(tags=('movie:{pk}',), vary_on_user=False)
+    @cache_response(timeout=60, key_prefix='test_movies_conditional', tags=('movie:{pk}',), vary_on_user=False)
+    def get(self, request, pk):
+        CountingView.calls += 1
+        return Response({'calls': CountingView.calls})
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    cache_metrics.reset()
+    CountingView.calls = 0
+
+
+@pytest.fixture
+def movie():
+    return Movie.objects.create(
+        title='Inception', description='d', duration=148,
+        release_date=datetime.date(2024, 5, 1), rating=8.8, genre='drama'
+    )
+
+
+def get(pk, view=CountingView, headers=None, **params):
+    request = APIRequestFactory().get(f'/movies/{pk}/', params, **(headers or {}))
+    response = view.as_view()(request, pk=pk)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+def calls(response):
+    return json.loads(response.content)['calls']
+
+
+class TestTaggedCache:
+    def test_hit_until_tag_is_bumped(self, movie, django_capture_on_commit_callbacks):
+        assert calls(get(movie.pk)) == 1
+        assert calls(get(movie.pk)) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            movie.rating = 9
+            movie.save()
+
+        assert calls(get(movie.pk)) == 2
+        assert calls(get(movie.pk)) == 2
+
+    def test_bump_waits_for_commit(self, movie, django_capture_on_commit_callbacks):
+        get(movie.pk)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            movie.save()
+            assert calls(get(movie.pk)) == 1
+
+        assert len(callbacks) == 1
+
+
+class TestRenderedCache:
+    def test_hit_returns_rendered_bytes(self, movie):
+        miss = get(movie.pk)
+        hit = get(movie.pk)
+
+        assert hit.content == miss.content
+        assert hit['Content-Type'] == miss['Content-Type'] == 'application/json'
+        assert hit['ETag'] == miss['ETag']
+        assert not isinstance(hit, Response)
+
+    def test_large_payloads_are_compressed(self, movie):
+        miss = get(movie.pk, size=5000)
+        hit = get(movie.pk, size=5000)
+
+        assert hit.content == miss.content
+        entries = [pickle.loads(value) for value in cache._cache.values()]
+        assert any(isinstance(entry, dict) and entry['compressed'] for entry in entries)
+
+
+def stored_entry():
+    return next(
+        entry for entry in (pickle.loads(value) for value in cache._cache.values())
+        if isinstance(entry, dict) and 'expires_at' in entry
+    )
+
+
+def expire_entries():
+    for key, value in list(cache._cache.items()):
+        entry = pickle.loads(value)
+        if isinstance(entry, dict) and 'expires_at' in entry:
+            entry['expires_at'] = 0
+            cache._cache[key] = pickle.dumps(entry)
+
+
+class TestStampedeProtection:
+    def test_expired_entry_is_recomputed(self, movie):
+        get(movie.pk)
+        expire_entries()
+
+        assert calls(get(movie.pk)) == 2
+        assert calls(get(movie.pk)) == 2
+
+    def test_stale_entry_served_while_another_worker_refreshes(self, movie, monkeypatch):
+        get(movie.pk)
+        expire_entries()
+        monkeypatch.setattr('core.decorators.acquire_lock', lambda cache_key: False)
+
+        assert calls(get(movie.pk)) == 1
+        assert CountingView.calls == 1
+
+    def test_cold_miss_waits_for_other_worker(self, movie, monkeypatch):
+        monkeypatch.setattr('core.decorators.acquire_lock', lambda cache_key: False)
+        monkeypatch.setattr('core.decorators.LOCK_WAIT', 0.01)
+
+        # Nothing arrives while waiting: the request computes the response itself
+        assert calls(get(movie.pk)) == 1
+
+    def test_early_refresh_depends_on_compute_time(self, movie):
+        get(movie.pk)
+        entry = stored_entry()
+
+        assert not should_refresh(entry, beta=1.0)
+        assert should_refresh(dict(entry, delta=10 ** 9), beta=1.0)
+
+
+class TestLocalTier:
+    def test_lru_eviction_and_ttl(self):
+        local = LocalCache(max_entries=2)
+        local.set('a', 1, 10)
+        local.set('b', 2, 10)
+        local.get('a')
+        local.set('c', 3, 10)
+
+        assert local.get('b') is None
+        assert local.get('a') == 1
+        local.set('d', 4, 0)
+        assert local.get('d') is None
+
+    def test_local_hit_skips_shared_cache(self, movie, monkeypatch):
+        assert calls(get(movie.pk, view=LocalCountingView)) == 1
+
+        def unreachable(*args, **kwargs):
+            raise AssertionError('shared cache was queried')
+
+        monkeypatch.setattr(cache, 'get', unreachable)
+        monkeypatch.setattr(cache, 'get_many', unreachable)
+        assert calls(get(movie.pk, view=LocalCountingView)) == 1
+
+    def test_bump_in_process_invalidates_local_tier(self, movie, django_capture_on_commit_callbacks):
+        get(movie.pk, view=LocalCountingView)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            movie.save()
+
+        assert calls(get(movie.pk, view=LocalCountingView)) == 2
+
+
+class TestCacheKeyVariance:
+    def key(self, query, user=None, **options):
+        request = APIRequestFactory().get(f'/movies/?{query}')
+        request.user = user or AnonymousUser()
+        return generate_cache_key(request, 'movie_list', 'list', (), {}, **options)
+
+    def test_query_string_is_canonicalized(self):
+        assert self.key('search=a&page=2') == self.key('page=2&search=a')
+        assert self.key('page=2') != self.key('page=3')
+
+    def test_only_declared_params_vary(self):
+        options = {'vary_on_params': ('page',)}
+        assert self.key('page=2&utm_source=x', **options) == self.key('page=2', **options)
+
+    def test_public_views_share_entries_between_users(self):
+        alice = CustomUser(pk=1, username='alice')
+        bob = CustomUser(pk=2, username='bob')
+
+        assert self.key('', user=alice) != self.key('', user=bob)
+        assert self.key('', user=alice, vary_on_user=False) == self.key('', user=bob, vary_on_user=False)
+
+
+class TestConditionalGet:
+    def test_matching_etag_returns_304_without_running_view(self, movie):
+        response = get(movie.pk, ConditionalView)
+        etag = response['ETag']
+        assert etag.startswith('W/"')
+
+        response = get(movie.pk, ConditionalView, headers={'HTTP_IF_NONE_MATCH': etag})
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert CountingView.calls == 1
+
+    def test_etag_changes_when_tag_is_bumped(self, movie, django_capture_on_commit_callbacks):
+        etag = get(movie.pk, ConditionalView)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            movie.rating = 9
+            movie.save()
+
+        response = get(movie.pk, ConditionalView, headers={'HTTP_IF_NONE_MATCH': etag})
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert calls(response) == 2
+
+    def test_if_modified_since_uses_last_bump(self, movie, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            movie.save()
+
+        last_modified = get(movie.pk, ConditionalView)['Last-Modified']
+        response = get(movie.pk, ConditionalView, headers={'HTTP_IF_MODIFIED_SINCE': last_modified})
+        assert response.status_code == 304
+
+        response = get(movie.pk, ConditionalView, headers={
+            'HTTP_IF_MODIFIED_SINCE': 'Mon, 01 Jan 2001 00:00:00 GMT'
+        })
+        assert response.status_code == 200
+
+
+class TestCacheMetrics:
+    def test_lookups_and_recomputes_are_recorded_per_prefix(self, movie):
+        get(movie.pk, size=2000)
+        get(movie.pk, size=2000)
+        get(movie.pk, size=2000)
+
+        metrics = cache_metrics.snapshot()['prefixes']['test_movies']
+        assert metrics['counters'] == {'miss': 1, 'hit': 2}
+        assert metrics['hit_ratio'] == pytest.approx(2 / 3)
+        assert metrics['compute_time']['count'] == 1
+        assert metrics['payload_size']['count'] == 1
+        assert metrics['payload_size']['buckets']['1024'] == 0
+        assert metrics['payload_size']['buckets']['4096'] == 1
+
+    def test_only_anomalies_are_logged(self, movie, monkeypatch, caplog):
+        with caplog.at_level('INFO', logger='cine'):
+            get(movie.pk)
+            get(movie.pk)
+        assert not caplog.records
+
+        monkeypatch.setattr(decorators, 'SLOW_COMPUTE_TIME', 0)
+        with caplog.at_level('INFO', logger='cine'):
+            get(movie.pk, size=1)
+        assert 'Slow cache recompute' in caplog.text
+
+    def test_metrics_endpoint_is_admin_only(self, client):
+        assert client.get('/api/metrics/cache/').status_code == 401
+
+        request = APIRequestFactory().get('/api/metrics/cache/')
+        force_authenticate(request, user=CustomUser(pk=1, username='admin', is_admin=True))
+        response = CacheMetricsView.as_view()(request)
+        assert response.status_code == 200
+        assert 'prefixes' in response.data
@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+from core.serializers import ValuesSerializer
+from movies.models import Movie, Hall, Function
+from movies.serializers import MovieSerializer, FunctionSerializer, movie_values, function_values
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalogue():
+    inception = Movie.objects.create(
+        title='Inception', description='d', duration=148,
+        release_date=datetime.date(2024, 5, 1), rating=Decimal('8.8'), genre='drama'
+    )
+    Movie.objects.create(
+        title='Up', description='d', duration=96, is_active=False,
+        release_date=datetime.date(2009, 5, 29), rating=Decimal('8'), genre='animacion'
+    )
+    hall = Hall.objects.create(name='Sala 1', total_seats=10)
+    for hour in (14, 17, 20):
+        Function.objects.create(
+            movie=inception, hall=hall, function_date=datetime.date(2024, 5, 20),
+            function_time_start=datetime.time(hour), function_time_end=datetime.time(hour + 2, 30),
+            price=Decimal('10.5'), language='subtitulada', format='2D'
+        )
+
+
+class TestValuesSerializer:
+    def test_movies_match_drf_serializer(self, catalogue):
+        queryset = Movie.objects.order_by('pk')
+        assert movie_values.serialize(queryset) == MovieSerializer(queryset, many=True).data
+
+    def test_functions_match_drf_serializer(self, catalogue):
+        queryset = Function.objects.order_by('pk')
+        data = function_values.serialize(queryset)
+        assert data == FunctionSerializer(queryset, many=True).data
+        assert data[0]['price'] == '10.50'
+        assert data[0]['function_time_start'] == '14:00:00'
+
+    def test_reads_only_serialized_columns(self, catalogue, django_assert_num_queries):
+        assert 'movie_id' in function_values.columns
+        assert 'created_at' not in movie_values.columns
+        with django_assert_num_queries(1):
+            function_values.serialize(Function.objects.all())
+
+    def test_nulls_are_not_converted(self, catalogue):
+        class NullableSerializer(serializers.Serializer):
+            id = serializers.IntegerField()
+            release_date = serializers.DateField(allow_null=True)
+
+        values = ValuesSerializer(NullableSerializer, Movie)
+        assert values.to_representation([(1, None)]) == [{'id': 1, 'release_date': None}]
+
+    def test_nested_serializers_are_rejected(self):
+        class NestedSerializer(serializers.Serializer):
+            movie = MovieSerializer()
+
+        with pytest.raises(ImproperlyConfigured):
+            ValuesSerializer(NestedSerializer, Function).columns
+
+
+class TestListEndpoints:
+    def test_catalog_list_is_paginated(self, client, catalogue):
+        response = client.get('/api/movies/catalog/')
+
+        active = Movie.objects.filter(is_active=True)
+        assert response.status_code == 200
+        assert response.json()['count'] == 1
+        assert response.json()['results'] == MovieSerializer(active, many=True).data
+
+    def test_function_list_by_date(self, client, catalogue):
+        response = client.get('/api/movies/functions/list/', {'date': '2024-05-20'})
+
+        assert response.status_code == 200
+        assert len(response.json()['results']) == 3
+        assert client.get('/api/movies/functions/list/', {'date': '2024-05-21'}).status_code == 204
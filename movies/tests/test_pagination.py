@@ -0,0 +1,69 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from movies.models import Movie, Hall, Function
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def movies():
+    # Varias películas por fecha, para que el desempate por id importe
+    return [
+        Movie.objects.create(
+            title=f'Película {n}', description='d', duration=100, genre='drama', rating=Decimal('7'),
+            release_date=datetime.date(2024, 1, 1) + datetime.timedelta(days=n // 3)
+        )
+        for n in range(25)
+    ]
+
+
+def collect(client, path, **params):
+    pages, url = [], path
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == 200
+        pages.append(response.json()['results'])
+        url = response.json()['next']
+        if url is None:
+            return pages
+        response = client.get(url)
+
+
+class TestKeysetPagination:
+    def test_movies_follow_release_date_then_id(self, client, movies):
+        pages = collect(client, '/api/movies/movies/list/', page_size=10)
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        expected = sorted(movies, key=lambda movie: (-movie.release_date.toordinal(), movie.id))
+        assert [movie['id'] for page in pages for movie in page] == [movie.id for movie in expected]
+
+    def test_functions_follow_date_time_then_id(self, client, movies):
+        hall = Hall.objects.create(name='Sala 1', total_seats=10)
+        for day in (2, 1):
+            for hour in (20, 14, 14):
+                Function.objects.create(
+                    movie=movies[0], hall=hall, function_date=datetime.date(2024, 5, day),
+                    function_time_start=datetime.time(hour), function_time_end=datetime.time(hour + 2),
+                    price=Decimal('10'), language='subtitulada', format='2D'
+                )
+
+        pages = collect(client, '/api/movies/functions/list/', page_size=4)
+
+        rows = [(f['function_date'], f['function_time_start']) for page in pages for f in page]
+        assert len(rows) == 6
+        assert rows == sorted(rows)
+
+    def test_pages_cost_one_query(self, client, movies, django_assert_num_queries):
+        next_url = client.get('/api/movies/movies/list/', {'page_size': 5}).json()['next']
+        with django_assert_num_queries(1):
+            client.get(next_url)
+
+    def test_invalid_cursor_is_rejected(self, client, movies):
+        assert client.get('/api/movies/movies/list/', {'cursor': 'nope'}).status_code == 404
+
+    @pytest.mark.parametrize('params', [{'date': 'tomorrow'}, {'date': '2024-13-01'}, {'movie_id': 'abc'}])
+    def test_invalid_function_filters_are_rejected(self, client, params):
+        assert client.get('/api/movies/functions/list/', params).status_code == 400
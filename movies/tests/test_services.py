@@ -0,0 +1,234 @@
+import datetime
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from bookings.models import Seat, Booking, Ticket
+from movies.layouts import parse_layout, layout_geometry
+from movies.models import Movie, Hall, Function
+from movies.services import CatalogueImporter, apply_hall_layout
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+def movie_row(title, **overrides):
+    row = {
+        'type': 'movie',
+        'title': title,
+        'description': 'Descripción',
+        'duration': '120',
+        'release_date': '2024-05-01',
+        'rating': '7.5',
+        'genre': 'drama',
+    }
+    row.update(overrides)
+    return row
+
+
+def function_row(start, end, **overrides):
+    row = {
+        'type': 'function',
+        'movie': 'Inception',
+        'hall': 'Sala 1',
+        'function_date': '2024-05-20',
+        'function_time_start': start,
+        'function_time_end': end,
+        'price': '10.00',
+        'language': 'subtitulada',
+        'format': '2D',
+    }
+    row.update(overrides)
+    return row
+
+
+def run_import(rows, batch_size=2):
+    importer = CatalogueImporter(batch_size=batch_size)
+    for line_number, row in enumerate(rows, start=1):
+        importer.add(row, line_number)
+    importer.finish()
+    return importer
+
+
+class TestCatalogueImporter:
+    def test_creates_catalogue_with_dependencies(self):
+        rows = [
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '1'},
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '2'},
+            {'type': 'hall', 'name': 'Sala 1', 'total_seats': '2'},
+            movie_row('Inception'),
+            function_row('18:00', '20:30'),
+        ]
+        importer = run_import(rows)
+
+        assert importer.errors == []
+        assert Movie.objects.get(title='Inception').slug == 'inception'
+        hall = Hall.objects.get(name='Sala 1')
+        assert Seat.objects.filter(hall=hall).count() == 2
+        assert Function.objects.get().function_time_start == datetime.time(18, 0)
+
+    def test_updates_existing_rows(self):
+        run_import([movie_row('Inception'), {'type': 'hall', 'name': 'Sala 1', 'total_seats': '50'}])
+
+        importer = run_import([
+            movie_row('Inception', rating='9.0'),
+            {'type': 'hall', 'name': 'Sala 1', 'total_seats': '80'},
+        ])
+
+        assert importer.stats['movie'] == {'created': 0, 'updated': 1, 'rejected': 0}
+        assert Movie.objects.get().rating == 9
+        assert Hall.objects.get().total_seats == 80
+
+    def test_rejects_duplicates_and_invalid_rows(self):
+        rows = [
+            movie_row('Inception'),
+            movie_row('Inception'),
+            movie_row('Tenet', genre='no-existe'),
+            {'type': 'hall', 'name': 'Sala 1', 'total_seats': '2'},
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '1'},
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '1'},
+            {'type': 'seat', 'hall': 'Sala 9', 'row': 'A', 'number': '1'},
+        ]
+        importer = run_import(rows)
+
+        assert sorted(line for line, _, _ in importer.errors) == [2, 3, 6, 7]
+        assert Movie.objects.count() == 1
+        assert Seat.objects.count() == 1
+
+    def test_rejects_overlapping_functions(self):
+        run_import([movie_row('Inception'), {'type': 'hall', 'name': 'Sala 1', 'total_seats': '2'}])
+
+        importer = run_import([
+            function_row('18:00', '20:30'),
+            function_row('19:00', '21:00'),
+            function_row('21:00', '23:00'),
+        ])
+
+        assert importer.stats['function'] == {'created': 2, 'updated': 0, 'rejected': 1}
+        assert importer.errors[0][0] == 2
+
+
+    def test_hall_layout_generates_seats(self):
+        importer = run_import([{'type': 'hall', 'name': 'Sala 1', 'layout': 'A: 3|B: a1 _ 2'}])
+
+        assert importer.errors == []
+        hall = Hall.objects.get()
+        assert hall.total_seats == 6
+        assert Seat.objects.filter(hall=hall, is_accessible=True).count() == 1
+
+    def test_hall_update_keeps_fields_missing_from_the_row(self):
+        run_import([{'type': 'hall', 'name': 'Sala 1', 'layout': 'A: 3', 'available': 'False'}])
+
+        importer = run_import([
+            {'type': 'hall', 'name': 'Sala 1', 'total_seats': '3'},
+            {'type': 'hall', 'name': 'Sala 2', 'total_seats': '10'},
+        ])
+
+        assert importer.stats['hall'] == {'created': 1, 'updated': 1, 'rejected': 0}
+        hall = Hall.objects.get(name='Sala 1')
+        assert (hall.layout, hall.available) == ('A: 3', False)
+
+    def test_updates_write_only_fields_present_in_the_row(self):
+        run_import([
+            movie_row('Inception', is_active='False'),
+            {'type': 'hall', 'name': 'Sala 1', 'total_seats': '2'},
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '1', 'seat_available': 'False'},
+        ])
+
+        importer = run_import([
+            movie_row('Inception', duration='150'),
+            {'type': 'seat', 'hall': 'Sala 1', 'row': 'A', 'number': '1', 'is_accessible': 'True'},
+        ])
+
+        assert importer.stats['movie']['updated'] == 1
+        assert importer.stats['seat']['updated'] == 1
+        movie = Movie.objects.get()
+        assert (movie.duration, movie.is_active) == (150, False)
+        seat = Seat.objects.get()
+        assert (seat.is_accessible, seat.seat_available) == (True, False)
+
+
+class TestHallLayout:
+    def test_parse_layout(self):
+        seats = parse_layout('A: 2 _2 a1\nB: 1')
+
+        assert [(seat.row, seat.number, seat.x, seat.y, seat.accessible) for seat in seats] == [
+            ('A', 1, 0, 0, False),
+            ('A', 2, 1, 0, False),
+            ('A', 3, 4, 0, True),
+            ('B', 1, 0, 1, False),
+        ]
+        assert layout_geometry('A: 2 _2 a1\nB: 1')['width'] == 5
+
+    @pytest.mark.parametrize('layout', ['A 10', 'A: x3', 'A: _2', 'A: 2|A: 3', 'FILA_LARGA: 2'])
+    def test_parse_layout_errors(self, layout):
+        with pytest.raises(ValidationError):
+            parse_layout(layout)
+
+    def test_apply_layout_diffs_existing_seats(self):
+        user = CustomUser.objects.create_user(username='testuser', email='test@example.com', password='testpass123')
+        hall = Hall.objects.create(name='Sala 1', total_seats=0)
+        movie = Movie.objects.create(
+            title='Inception', description='d', duration=120,
+            release_date=datetime.date(2024, 5, 1), rating=8, genre='drama'
+        )
+        function = Function.objects.create(
+            movie=movie, hall=hall, function_date=datetime.date(2024, 5, 20),
+            price=10, language='subtitulada', format='2D'
+        )
+        apply_hall_layout(hall, 'A: 3\nB: 2')
+        booking = Booking.objects.create(user=user, function=function, total_price=10, status='paid')
+        Ticket.objects.bulk_create([
+            Ticket(booking=booking, seat=Seat.objects.get(hall=hall, row='B', number=2), ticket_code='T-1')
+        ])
+
+        result = apply_hall_layout(hall, 'A: 2 a1\nB: 1')
+
+        assert result == {'created': 0, 'updated': 1, 'deleted': 0, 'disabled': 1}
+        assert hall.total_seats == 4
+        assert Seat.objects.get(hall=hall, row='A', number=3).is_accessible
+        assert not Seat.objects.get(hall=hall, row='B', number=2).seat_available
+
+        result = apply_hall_layout(hall, 'A: 2 a1 1')
+        assert result == {'created': 1, 'updated': 0, 'deleted': 1, 'disabled': 1}
+
+        # B2 vuelve a la sala: se reutiliza y se habilita de nuevo
+        result = apply_hall_layout(hall, 'A: 2 a1 1\nB: 2')
+        assert result == {'created': 1, 'updated': 1, 'deleted': 0, 'disabled': 0}
+        assert Seat.objects.get(hall=hall, row='B', number=2).seat_available
+
+    def test_apply_layout_keeps_seats_disabled_by_hand(self):
+        hall = Hall.objects.create(name='Sala 1', total_seats=0)
+        apply_hall_layout(hall, 'A: 3')
+        Seat.objects.filter(hall=hall, row='A', number=1).update(seat_available=False)
+
+        result = apply_hall_layout(hall, 'A: 3\nB: 1')
+        assert result == {'created': 1, 'updated': 0, 'deleted': 0, 'disabled': 0}
+        assert not Seat.objects.get(hall=hall, row='A', number=1).seat_available
+
+        run_import([{'type': 'hall', 'name': 'Sala 1', 'layout': 'A: 3'}])
+        assert not Seat.objects.get(hall=hall, row='A', number=1).seat_available
+        assert Hall.objects.get().layout == 'A: 3'
+
+    def test_layout_is_edited_through_the_api(self, auth_client, user):
+        user.is_admin = True
+        user.save()
+        hall = Hall.objects.create(name='Sala 1', total_seats=0)
+        other = Hall.objects.create(name='Sala 2', total_seats=10)
+        apply_hall_layout(hall, 'A: 3')
+        url = f'/api/movies/halls/update/{hall.pk}/'
+
+        response = auth_client.put(url, {'layout': 'A: 4'}, format='json')
+        assert response.status_code == 200
+        hall.refresh_from_db()
+        assert (hall.layout, hall.total_seats) == ('A: 4', 4)
+        assert Seat.objects.filter(hall=hall).count() == 4
+
+        assert auth_client.put(url, {'name': 'Sala 1', 'layout': 'A: 2'}, format='json').status_code == 200
+        assert Seat.objects.filter(hall=hall).count() == 2
+        assert auth_client.put(url, {'name': other.name}, format='json').status_code == 400
+
+    def test_layout_geometry_returns_a_new_structure(self):
+        layout_geometry('A: 2')['rows'][0]['seats'].clear()
+
+        assert len(layout_geometry('A: 2')['rows'][0]['seats']) == 2
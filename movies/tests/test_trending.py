@@ -0,0 +1,85 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from bookings.models import Booking, Seat, Ticket
+from movies.models import Movie, Hall, Function, MovieSalesRollup
+from movies.services import refresh_movie_popularity
+from movies.tasks import refresh_movie_popularity_task
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def hall():
+    hall = Hall.objects.create(name='Sala 1', total_seats=50)
+    Seat.objects.bulk_create(Seat(hall=hall, row='A', number=n) for n in range(1, 51))
+    return hall
+
+
+def make_movie(title, rating='5'):
+    return Movie.objects.create(
+        title=title, description='d', duration=100, genre='drama',
+        rating=Decimal(rating), release_date=datetime.date(2024, 1, 1)
+    )
+
+
+def sell(movie, hall, user, tickets, status='paid'):
+    function = Function.objects.create(
+        movie=movie, hall=hall, function_date=timezone.localdate(),
+        price=Decimal('10'), language='subtitulada', format='2D'
+    )
+    booking = Booking.objects.create(user=user, function=function, total_price=Decimal('10') * tickets, status=status)
+    seats = Seat.objects.filter(hall=hall)[:tickets]
+    Ticket.objects.bulk_create(
+        Ticket(booking=booking, seat=seat, ticket_code=f'{booking.pk}-{seat.pk}') for seat in seats
+    )
+
+
+class TestMoviePopularity:
+    def test_ranks_by_recent_sales(self, hall, user):
+        blockbuster, indie, classic = make_movie('A'), make_movie('B'), make_movie('C', rating='9.9')
+        sell(blockbuster, hall, user, 5)
+        sell(indie, hall, user, 2)
+        sell(classic, hall, user, 10, status='cancelled')
+
+        assert refresh_movie_popularity() == 2
+
+        blockbuster.refresh_from_db()
+        assert blockbuster.popularity == pytest.approx(5)
+        assert MovieSalesRollup.objects.get(movie=indie).tickets == 2
+        assert not MovieSalesRollup.objects.filter(movie=classic).exists()
+
+    def test_older_sales_decay(self, user):
+        movie = make_movie('A')
+        today = timezone.localdate()
+        MovieSalesRollup.objects.create(movie=movie, day=today - datetime.timedelta(days=3), tickets=8)
+        MovieSalesRollup.objects.create(movie=movie, day=today - datetime.timedelta(days=45), tickets=100)
+
+        # Solo se recalculan los días recientes; los agregados anteriores se conservan
+        refresh_movie_popularity(recompute_days=2, window_days=30, half_life_days=3)
+
+        movie.refresh_from_db()
+        assert movie.popularity == pytest.approx(4)
+        assert MovieSalesRollup.objects.count() == 2
+
+    def test_movies_without_sales_are_reset(self, hall, user):
+        movie = make_movie('A')
+        Movie.objects.filter(pk=movie.pk).update(popularity=12)
+
+        refresh_movie_popularity_task()
+
+        movie.refresh_from_db()
+        assert movie.popularity == 0
+
+    def test_trending_endpoint_uses_popularity(self, client, hall, user, django_capture_on_commit_callbacks):
+        top_rated, best_seller = make_movie('A', rating='9.5'), make_movie('B', rating='6')
+        assert client.get('/api/movies/catalog/trending/').json()[0]['id'] == top_rated.pk
+
+        sell(best_seller, hall, user, 3)
+        with django_capture_on_commit_callbacks(execute=True):
+            refresh_movie_popularity()
+
+        assert [m['id'] for m in client.get('/api/movies/catalog/trending/').json()] == [best_seller.pk, top_rated.pk]
@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.warming import warm_path
+from movies.models import Movie, Hall, Function
+from movies.services import catalogue_warm_paths
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def showtime():
+    movie = Movie.objects.create(
+        title='Inception', description='d', duration=148,
+        release_date=datetime.date(2024, 5, 1), rating=8.8, genre='drama'
+    )
+    hall = Hall.objects.create(name='Sala 1', total_seats=4, layout='A: 4')
+    Hall.objects.create(name='Sala 2', total_seats=4, layout='A: 4')
+    return Function.objects.create(
+        movie=movie, hall=hall, function_date=timezone.localdate() + datetime.timedelta(days=2),
+        function_time_start=datetime.time(18), function_time_end=datetime.time(20, 30),
+        price='10.00', language='subtitulada', format='2D'
+    )
+
+
+class TestCatalogueWarmPaths:
+    def test_enumerates_hot_endpoints(self, showtime):
+        paths = catalogue_warm_paths(days=3)
+        today = timezone.localdate()
+
+        assert '/api/movies/catalog/trending/' in paths
+        assert '/api/movies/catalog/upcoming/' in paths
+        assert f'/api/movies/catalog/{showtime.movie_id}/' in paths
+        assert [p for p in paths if '?date=' in p] == [
+            f'/api/movies/functions/list/?date={today + datetime.timedelta(days=offset)}'
+            for offset in range(3)
+        ]
+        assert f'/api/movies/functions/list/?movie_id={showtime.movie_id}' in paths
+        # Solo las salas con funciones en el período
+        assert [p for p in paths if 'seat-map' in p] == [f'/api/movies/halls/{showtime.hall_id}/seat-map/']
+
+    def test_functions_outside_window_are_skipped(self, showtime):
+        assert not [p for p in catalogue_warm_paths(days=2) if 'seat-map' in p or 'movie_id' in p]
+
+
+class TestWarmPath:
+    def test_warmed_response_is_served_from_cache(self, client, showtime):
+        path = f'/api/movies/halls/{showtime.hall_id}/seat-map/'
+        assert warm_path(path)[1] == 200
+
+        # update() no dispara signals: la respuesta solo puede venir de la caché precalculada
+        Hall.objects.filter(pk=showtime.hall_id).update(layout='A: 2')
+        assert client.get(path).json()['total_seats'] == 4
+
+    def test_seat_map_is_invalidated_when_hall_changes(self, client, showtime, django_capture_on_commit_callbacks):
+        path = f'/api/movies/halls/{showtime.hall_id}/seat-map/'
+        warm_path(path)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            hall = Hall.objects.get(pk=showtime.hall_id)
+            hall.layout = 'A: 2'
+            hall.save()
+
+        response = client.get(path)
+        assert response.json()['total_seats'] == 2
+        assert 'public' in response['Cache-Control']
+        assert client.get(path, HTTP_IF_NONE_MATCH=response['ETag']).status_code == 304
+
+    def test_cached_catalogue_pages_link_relatively(self, settings, client):
+        settings.ALLOWED_HOSTS = ['cine.example.com']
+        settings.CACHE_WARMUP_HOST = 'cine.example.com'
+        for n in range(12):
+            Movie.objects.create(
+                title=f'Película {n}', description='d', duration=100,
+                release_date=datetime.date(2024, 5, 1), rating=7, genre='drama'
+            )
+
+        assert warm_path('/api/movies/catalog/')[1] == 200
+        assert warm_path('/api/movies/catalog/?page=2')[1] == 200
+
+        first = client.get('/api/movies/catalog/', HTTP_HOST='cine.example.com').json()
+        second = client.get('/api/movies/catalog/?page=2', HTTP_HOST='cine.example.com').json()
+        assert first['next'] == '/api/movies/catalog/?page=2'
+        assert second['previous'] == '/api/movies/catalog/'
+        assert second['next'] is None
+
+    def test_errors_are_reported(self):
+        assert warm_path('/api/movies/does-not-exist/')[1] is None
+
+
+@pytest.mark.django_db(transaction=True)
+class TestWarmCacheCommand:
+    def test_warms_paths_with_thread_pool(self, capsys):
+        call_command('warm_cache', '--days', '2', '--workers', '2', '--fail-on-error')
+
+        out = capsys.readouterr().out
+        assert '7 of 7 paths warmed' in out
+
+    def test_dry_run_lists_paths(self, capsys):
+        call_command('warm_cache', '--days', '1', '--dry-run')
+
+        out = capsys.readouterr().out
+        assert '/api/movies/functions/list/?date=' in out
+        assert 'Dry run: 6 paths would be warmed' in out
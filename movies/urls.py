@@ -1,15 +1,22 @@
 from django.urls import path
+from rest_framework.routers import DefaultRouter
 from .views import (
     CreateMovieView,
     ListMovieView,
     UpdateMovieView,
     CreateHallView,
     UpdateHallView,
+    HallSeatMapView,
     CreateFunctionView,
     ListFunctionView,
-    UpdateFunctionView
+    UpdateFunctionView,
+    MovieViewSet
 )
 
+# Catálogo de películas (lectura pública y cacheada)
+router = DefaultRouter()
+router.register('catalog', MovieViewSet, basename='catalog')
+
 urlpatterns = [
     # Rutas para películas
     path('movies/create/', CreateMovieView.as_view(), name='create-movie'),
@@ -19,9 +26,10 @@ urlpatterns = [
     # Rutas para salas
     path('halls/create/', CreateHallView.as_view(), name='create-hall'),
     path('halls/update/<int:pk>/', UpdateHallView.as_view(), name='update-hall'),
+    path('halls/<int:pk>/seat-map/', HallSeatMapView.as_view(), name='hall-seat-map'),
     
     # Rutas para funciones
     path('functions/create/', CreateFunctionView.as_view(), name='create-function'),
     path('functions/list/', ListFunctionView.as_view(), name='list-functions'),
     path('functions/update/<int:pk>/', UpdateFunctionView.as_view(), name='update-function'),
-]
+] + router.urls
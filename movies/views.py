@@ -13,8 +13,10 @@ Cada vista está implementada como una APIView independiente, lo que permite:
 - Documentación específica por endpoint
 """
 
+import datetime
 from xmlrpc.client import Fault
 from django.db.models import Q
+from django.utils.cache import patch_cache_control
 from rest_framework import viewsets, status, filters
 from rest_framework.views import APIView
 from rest_framework.decorators import action
@@ -23,10 +25,12 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from .permissions import IsAdminGroupUser
+from .layouts import layout_geometry
 from .models import Movie, Hall, Function
-from .serializers import MovieSerializer, HallSerializer, FunctionSerializer
+from .serializers import MovieSerializer, HallSerializer, FunctionSerializer, movie_values, function_values
 from django_filters.rest_framework import DjangoFilterBackend
-from core.decorators import cache_response
+from core.decorators import cache_response, conditional_response
+from core.pagination import KeysetPagination, RelativePageNumberPagination
 import logging
 
 logger = logging.getLogger('cine')
@@ -72,25 +76,35 @@ class ListMovieView(APIView):
     """
     View para listar películas.
     
-    Permite obtener la lista de todas las películas con opción de búsqueda.
+    Permite obtener la lista de todas las películas con opción de búsqueda,
+    paginada por cursor (de la más reciente a la más antigua).
     No requiere autenticación.
 
     Methods:
-        get: Retorna la lista de películas con opción de búsqueda
+        get: Retorna una página de películas con opción de búsqueda
     """
     permission_classes = [AllowAny]
+    ordering = ('-release_date', 'id')
 
+    @conditional_response(tags=('movies',), vary_on_user=False, vary_on_params=('search', 'cursor', 'page_size'))
+    @cache_response(timeout=60 * 60 * 6, key_prefix='list_movies', tags=('movies',),
+                    vary_on_user=False, vary_on_params=('search', 'cursor', 'page_size'))
     def get(self, request):
         """
-        Retorna la lista de películas con opción de búsqueda.
+        Retorna una página de películas con opción de búsqueda.
+        Responde 304 si la lista no cambió desde la versión que tiene el cliente.
 
         Args:
             request: HTTP request que puede contener parámetros de búsqueda
+                - search: Texto a buscar en el título o la descripción
+                - cursor: Posición devuelta en el enlace 'next' de la página anterior
+                - page_size: Cantidad de películas por página
 
         Returns:
             Response:
-                - 200 OK: Lista de películas
+                - 200 OK: Página de películas ('results') y enlace a la siguiente ('next')
                 - 204 No Content: Si no hay películas registradas
+                - 404 Not Found: Si el cursor no es válido
         """
         queryset = Movie.objects.all()
         
@@ -99,17 +113,18 @@ class ListMovieView(APIView):
         if search:
             queryset = queryset.filter(
                 Q(title__icontains=search) |
-                Q(synopsis__icontains=search)
+                Q(description__icontains=search)
             )
 
-        if not queryset.exists():
+        paginator = KeysetPagination(ordering=self.ordering)
+        page = paginator.paginate_queryset(movie_values.values(queryset, extra=paginator.key_fields), request, self)
+        if not page:
             return Response(
                 {'message': 'No hay películas registradas'}, 
                 status=status.HTTP_204_NO_CONTENT
             )
 
-        serializer = MovieSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(movie_values.to_representation(page))
 
 
 class UpdateMovieView(APIView):
@@ -225,6 +240,54 @@ class UpdateHallView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class HallSeatMapView(APIView):
+    """
+    View para obtener el mapa de asientos de una sala.
+
+    La geometría se calcula a partir de la distribución de la sala (sin consultar
+    la tabla de asientos), se cachea hasta que la sala cambie y se sirve con ETag
+    y Cache-Control para que los clientes y la CDN puedan reutilizarla.
+    No requiere autenticación.
+
+    Methods:
+        get: Retorna la geometría del mapa de asientos
+    """
+    permission_classes = [AllowAny]
+    max_age = 60 * 60
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            patch_cache_control(response, public=True, max_age=self.max_age)
+        return response
+
+    @conditional_response(tags=('hall:{pk}',), vary_on_user=False, vary_on_params=())
+    @cache_response(timeout=60 * 60 * 24, key_prefix='hall_seat_map', tags=('hall:{pk}',),
+                    vary_on_user=False, vary_on_params=())
+    def get(self, request, pk):
+        """
+        Retorna la geometría del mapa de asientos de una sala.
+
+        Args:
+            request: HTTP request
+            pk: ID de la sala
+
+        Returns:
+            Response:
+                - 200 OK: Geometría del mapa de asientos
+                - 304 Not Modified: Si la distribución no cambió desde la última consulta
+                - 404 Not Found: Si la sala no existe o no tiene distribución
+        """
+        layout = Hall.objects.filter(pk=pk).values_list('layout', flat=True).first()
+        if not layout:
+            return Response(
+                {'message': 'La sala no tiene una distribución de asientos'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response({'hall': pk, **layout_geometry(layout)}, status=status.HTTP_200_OK)
+
+
 class CreateFunctionView(APIView):
     """ 
     View para crear una nueva función.
@@ -264,48 +327,65 @@ class ListFunctionView(APIView):
     """
     View para listar funciones.
     
-    Permite obtener la lista de todas las funciones con opciones de filtrado.
+    Permite obtener la lista de todas las funciones con opciones de filtrado,
+    paginada por cursor en orden cronológico.
     No requiere autenticación.
 
     Methods:
-        get: Retorna la lista de funciones con opciones de filtrado
+        get: Retorna una página de funciones con opciones de filtrado
     """
     permission_classes = [AllowAny]
+    ordering = ('function_date', 'function_time_start', 'id')
 
+    @conditional_response(tags=('movies', 'functions'), vary_on_user=False,
+                          vary_on_params=('movie_id', 'date', 'cursor', 'page_size'))
+    @cache_response(timeout=60 * 60, key_prefix='list_functions', tags=('movies', 'functions'),
+                    vary_on_user=False, vary_on_params=('movie_id', 'date', 'cursor', 'page_size'))
     def get(self, request):
         """
         Retorna la lista de funciones con opciones de filtrado.
+        Responde 304 si la cartelera no cambió desde la versión que tiene el cliente.
 
         Args:
             request: HTTP request que puede contener parámetros de filtrado:
                 - movie_id: ID de la película para filtrar
                 - date: Fecha para filtrar
+                - cursor: Posición devuelta en el enlace 'next' de la página anterior
+                - page_size: Cantidad de funciones por página
 
         Returns:
             Response:
-                - 200 OK: Lista de funciones
+                - 200 OK: Página de funciones ('results') y enlace a la siguiente ('next')
                 - 204 No Content: Si no hay funciones registradas
+                - 400 Bad Request: Si movie_id o date no tienen un formato válido
+                - 404 Not Found: Si el cursor no es válido
         """
         queryset = Function.objects.all()
-        
-        # Filtrar por pelicula        
-        movie_id = request.query_params.get('movie_id')
-        if movie_id:
-            queryset = queryset.filter(movie_id=movie_id)
 
-        # Filtrar por fecha
-        date = request.query_params.get('date')
-        if date:
-            queryset = queryset.filter(date=date)
+        try:
+            # Filtrar por pelicula
+            movie_id = request.query_params.get('movie_id')
+            if movie_id:
+                queryset = queryset.filter(movie_id=int(movie_id))
+
+            # Filtrar por fecha
+            date = request.query_params.get('date')
+            if date:
+                queryset = queryset.filter(function_date=datetime.date.fromisoformat(date))
+        except ValueError:
+            return Response({
+                'message': 'movie_id debe ser un número y date una fecha con formato YYYY-MM-DD'
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-        if not queryset.exists():
+        paginator = KeysetPagination(ordering=self.ordering)
+        page = paginator.paginate_queryset(function_values.values(queryset, extra=paginator.key_fields), request, self)
+        if not page:
             return Response(
                 {'message': 'No hay funciones registradas'},
                 status=status.HTTP_204_NO_CONTENT
             )
         
-        serializer = FunctionSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(function_values.to_representation(page))
     
 
 class UpdateFunctionView(APIView):
@@ -353,11 +433,21 @@ class MovieViewSet(viewsets.ModelViewSet):
     """
     queryset = Movie.objects.filter(is_active=True)
     serializer_class = MovieSerializer
+    # List pages are cached for every client: links must not carry the request host
+    pagination_class = RelativePageNumberPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['genre', 'release_date']
     search_fields = ['title', 'description']
     ordering_fields = ['release_date', 'rating']
 
+    def get_permissions(self):
+        """
+        Reads are public (and cached for everyone); writes require an admin.
+        """
+        if self.action in ('list', 'retrieve', 'trending', 'upcoming'):
+            return [AllowAny()]
+        return [IsAuthenticated(), IsAdminGroupUser()]
+
     def get_queryset(self):
         """
         Optionally restricts the returned movies,
@@ -370,14 +460,26 @@ class MovieViewSet(viewsets.ModelViewSet):
         
         return queryset
 
-    @cache_response(timeout=300, key_prefix='movie_list')
+    @conditional_response(tags=('movies',), vary_on_user=False, local_versions=True,
+                          vary_on_params=('page', 'search', 'ordering', 'genre', 'release_date'))
+    @cache_response(timeout=60 * 60 * 6, key_prefix='movie_list', tags=('movies',), local_timeout=5,
+                    vary_on_user=False, vary_on_params=('page', 'search', 'ordering', 'genre', 'release_date'))
     def list(self, request, *args, **kwargs):
         """
         List all movies with caching.
-        """
-        return super().list(request, *args, **kwargs)
 
-    @cache_response(timeout=3600, key_prefix='movie_detail')
+        Rows are read with values_list() and serialized by movie_values, which
+        produces the same output as MovieSerializer without building instances.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(movie_values.values(queryset))
+        if page is not None:
+            return self.get_paginated_response(movie_values.to_representation(page))
+        return Response(movie_values.serialize(queryset))
+
+    @conditional_response(tags=('movie:{pk}',), vary_on_user=False, vary_on_params=())
+    @cache_response(timeout=60 * 60 * 24, key_prefix='movie_detail', tags=('movie:{pk}',),
+                    vary_on_user=False, vary_on_params=())
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a movie with caching.
@@ -399,17 +501,25 @@ class MovieViewSet(viewsets.ModelViewSet):
         super().perform_update(serializer)
 
     @action(detail=False, methods=['get'])
-    @cache_response(timeout=300, key_prefix='trending_movies')
+    @conditional_response(tags=('movies', 'trending'), vary_on_user=False, vary_on_params=(), local_versions=True)
+    @cache_response(timeout=60 * 60, key_prefix='trending_movies', tags=('movies', 'trending'), local_timeout=5,
+                    vary_on_user=False, vary_on_params=())
     def trending(self, request):
         """
-        Get trending movies based on rating.
+        Get trending movies by recent ticket sales, with time decay.
+
+        Popularity is pre-aggregated by a periodic job (see
+        movies.services.refresh_movie_popularity), so this is an indexed sorted
+        read; movies without recent sales are ranked by rating.
         """
-        movies = self.get_queryset().order_by('-rating')[:10]
-        serializer = self.get_serializer(movies, many=True)
-        return Response(serializer.data)
+        movies = self.get_queryset().order_by('-popularity', '-rating')[:10]
+        return Response(movie_values.serialize(movies))
 
     @action(detail=False, methods=['get'])
-    @cache_response(timeout=300, key_prefix='upcoming_movies')
+    @conditional_response(tags=('movies', 'day:{today}'), vary_on_user=False, vary_on_params=(),
+                          local_versions=True)
+    @cache_response(timeout=60 * 60, key_prefix='upcoming_movies', tags=('movies', 'day:{today}'), local_timeout=5,
+                    vary_on_user=False, vary_on_params=())
     def upcoming(self, request):
         """
         Get upcoming movie releases.
@@ -418,5 +528,4 @@ class MovieViewSet(viewsets.ModelViewSet):
         movies = self.get_queryset().filter(
             release_date__gt=timezone.now().date()
         ).order_by('release_date')[:10]
-        serializer = self.get_serializer(movies, many=True)
-        return Response(serializer.data)
+        return Response(movie_values.serialize(movies))
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Notification
+from .models import Broadcast, Notification
 # Register your models here.
 
 admin.site.register(Notification)
+admin.site.register(Broadcast)
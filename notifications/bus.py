@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+
+import redis
+import redis.asyncio
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+
+logger = logging.getLogger('cine')
+
+BROADCAST_CHANNEL = 'notifications:broadcast'
+
+
+def user_channel(user_id):
+    return f'notifications:user:{user_id}'
+
+
+class LocalSubscription:
+    def __init__(self, bus, channels):
+        self.bus = bus
+        self.channels = channels
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+
+    async def wait(self, timeout):
+        """
+        Wait for a message on any of the channels.
+
+        Returns the set of channels that received messages, empty if none arrived within timeout.
+        """
+        try:
+            channels = {await asyncio.wait_for(self.queue.get(), timeout)}
+        except asyncio.TimeoutError:
+            return set()
+        # Several messages in a row wake the subscriber once
+        while not self.queue.empty():
+            channels.add(self.queue.get_nowait())
+        return channels
+
+    async def close(self):
+        await self.bus.unsubscribe(self)
+
+
+class LocalNotificationBus:
+    """
+    In-process stand-in for the Redis bus, for development and tests.
+
+    Messages only reach subscribers of the same process.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish_many(self, channels):
+        self._dispatch(channels)
+
+    async def subscribe(self, channels):
+        subscription = LocalSubscription(self, channels)
+        self._add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription):
+        self._remove(subscription)
+
+    def _dispatch(self, channels):
+        with self._lock:
+            deliveries = [
+                (subscription, channel) for channel in channels for subscription in self._subscriptions.get(channel, ())
+            ]
+        for subscription, channel in deliveries:
+            # Publishers run in other threads (sync views, workers)
+            subscription.loop.call_soon_threadsafe(subscription.queue.put_nowait, channel)
+
+    def _add(self, subscription):
+        """
+        Register subscription; returns the channels that had no subscribers yet.
+        """
+        with self._lock:
+            added = [channel for channel in subscription.channels if not self._subscriptions.get(channel)]
+            for channel in subscription.channels:
+                self._subscriptions[channel].add(subscription)
+        return added
+
+    def _remove(self, subscription):
+        """
+        Unregister subscription; returns the channels left without subscribers.
+        """
+        with self._lock:
+            removed = []
+            for channel in subscription.channels:
+                self._subscriptions[channel].discard(subscription)
+                if not self._subscriptions[channel]:
+                    del self._subscriptions[channel]
+                    removed.append(channel)
+        return removed
+
+
+class RedisNotificationBus(LocalNotificationBus):
+    """
+    Redis pub/sub bus telling open notification streams that there is something new.
+
+    Messages carry no data: they only wake the subscribers, which then read the
+    new rows from the database, so a message lost while a client reconnects
+    costs nothing (see notifications.streaming).
+
+    Each process holds a single pub/sub connection shared by all its streams: a
+    channel is subscribed on it while some local stream listens to it, and a
+    listener task hands every message to the local subscriptions' queues.
+    """
+
+    # Seconds between reads of the shared connection; idle connections are pinged at this interval
+    LISTEN_TIMEOUT = 30
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self._client = redis.Redis.from_url(url)
+        self._loop = None
+        self._pubsub = None
+        self._pubsub_lock = None
+        self._listener = None
+
+    def publish_many(self, channels):
+        pipe = self._client.pipeline(transaction=False)
+        for channel in channels:
+            pipe.publish(channel, b'')
+        pipe.execute()
+
+    async def subscribe(self, channels):
+        subscription = LocalSubscription(self, channels)
+        pubsub, lock = self._shared_pubsub()
+        # Serialized so SUBSCRIBE / UNSUBSCRIBE reach Redis in bookkeeping order
+        async with lock:
+            added = self._add(subscription)
+            try:
+                if added:
+                    await pubsub.subscribe(*added)
+            except BaseException:
+                self._remove(subscription)
+                raise
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen(pubsub))
+        return subscription
+
+    async def unsubscribe(self, subscription):
+        pubsub, lock = self._shared_pubsub()
+        async with lock:
+            removed = self._remove(subscription)
+            if removed:
+                await pubsub.unsubscribe(*removed)
+
+    def _shared_pubsub(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The connection belongs to the event loop: one per process under the ASGI server
+            with self._lock:
+                self._subscriptions.clear()
+            self._loop = loop
+            self._pubsub = redis.asyncio.Redis.from_url(
+                self.url, health_check_interval=self.LISTEN_TIMEOUT
+            ).pubsub(ignore_subscribe_messages=True)
+            self._pubsub_lock = asyncio.Lock()
+            self._listener = None
+        return self._pubsub, self._pubsub_lock
+
+    async def _listen(self, pubsub):
+        while True:
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.LISTEN_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The next read reconnects and subscribes the channels again
+                logger.error(f'Error reading notification events: {e}', exc_info=True)
+                await asyncio.sleep(1)
+                continue
+            if message is not None:
+                self._dispatch([message['channel'].decode()])
+
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def get_notification_bus():
+    """
+    Redis bus on the default cache's server, or the local bus with other cache backends.
+    """
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                backend = caches['default']
+                if isinstance(backend, RedisCache):
+                    _bus = RedisNotificationBus(backend._servers[0])
+                else:
+                    _bus = LocalNotificationBus()
+    return _bus
+
+
+def publish(channels):
+    """
+    Wake the streams listening on channels; a bus failure is logged, never raised.
+    """
+    if not channels:
+        return
+    try:
+        get_notification_bus().publish_many(channels)
+    except Exception as e:
+        logger.error(f'Error publishing notification events: {e}', exc_info=True)
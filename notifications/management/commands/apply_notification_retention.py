@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        'Archives old read notifications and deletes old archived ones in primary-key batches '
+        '(normally run daily by celery beat)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--archive-days', type=int, help='Archive notifications read more than this many days ago')
+        parser.add_argument('--delete-days', type=int, help='Delete archived notifications sent more than this many days ago')
+        parser.add_argument('--batch-size', type=int, help='Notifications changed per batch')
+        parser.add_argument('--pause', type=float, help='Seconds to sleep between batches')
+
+    def handle(self, *args, **options):
+        for option in ('archive_days', 'delete_days'):
+            if options[option] is not None and options[option] < 0:
+                raise CommandError(f'--{option.replace("_", "-")} cannot be negative')
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        if options['pause'] is not None and options['pause'] < 0:
+            raise CommandError('--pause cannot be negative')
+
+        def progress(step, done):
+            self.stdout.write(f'{step} {done} notifications')
+
+        archived, deleted = NotificationService.apply_retention(
+            archive_days=options['archive_days'], delete_days=options['delete_days'],
+            batch_size=options['batch_size'], pause=options['pause'], progress=progress
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} read notifications; deleted {deleted} archived ones'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the cached unread notification counters from the database and fixes '
+        'the ones that drifted (normally run daily by celery beat)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Users checked per batch')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+
+        def progress(checked, fixed):
+            self.stdout.write(f'Checked {checked} counters, fixed {fixed}')
+
+        checked, fixed = NotificationService.repair_unread_counts(
+            batch_size=options['batch_size'], progress=progress
+        )
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} cached unread counters; fixed {fixed}'))
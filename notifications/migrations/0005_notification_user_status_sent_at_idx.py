@@ -0,0 +1,26 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_broadcast_notification_broadcast_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'status', 'sent_at', 'id'], name='notificatio_user_id_827aea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'sent_at', 'id'], name='notificatio_user_id_c5484b_idx'),
+        ),
+        # Covered by the composite indexes (and by the foreign key's own index)
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_user_id_c291d5_idx',
+        ),
+    ]
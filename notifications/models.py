@@ -31,13 +31,23 @@ class Notification(models.Model):
     )
     sent_at = models.DateTimeField(auto_now_add=True)
     read_at = models.DateTimeField(null=True, blank=True)
+    # Set on the copies of a Broadcast delivered to each user
+    broadcast = models.ForeignKey(
+        'Broadcast', on_delete=models.CASCADE, null=True, blank=True, related_name='deliveries'
+    )
 
     class Meta:
         ordering = ['-sent_at']
         indexes = [
             models.Index(fields=['-sent_at']),
             models.Index(fields=['status']),
-            models.Index(fields=['user']),
+            # Keyset pages of a user's notifications, newest first (see NotificationListView):
+            # one range scan in (sent_at, id) order, for a single status or for all of them
+            models.Index(fields=['user', 'status', 'sent_at', 'id']),
+            models.Index(fields=['user', 'sent_at', 'id']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'broadcast'], name='unique_broadcast_delivery'),
         ]
 
     def __str__(self):
@@ -45,11 +55,47 @@ class Notification(models.Model):
 
     def mark_as_read(self):
         from django.utils import timezone
+        from .services import NotificationService
         if self.status == self.NotificationStatus.UNREAD:
             self.status = self.NotificationStatus.READ
             self.read_at = timezone.now()
-            self.save()
+            # Conditional update: a concurrent request cannot decrement the unread counter twice
+            updated = Notification.objects.filter(
+                pk=self.pk, status=self.NotificationStatus.UNREAD
+            ).update(status=self.status, read_at=self.read_at)
+            NotificationService.adjust_unread_count(self.user_id, -updated)
 
     def archive(self):
+        from .services import NotificationService
+        was_unread = Notification.objects.filter(
+            pk=self.pk, status=self.NotificationStatus.UNREAD
+        ).update(status=self.NotificationStatus.ARCHIVED)
+        if not was_unread:
+            Notification.objects.filter(pk=self.pk).update(status=self.NotificationStatus.ARCHIVED)
         self.status = self.NotificationStatus.ARCHIVED
-        self.save()
\ No newline at end of file
+        NotificationService.adjust_unread_count(self.user_id, -was_unread)
+
+
+class Broadcast(models.Model):
+    """
+    A notification addressed to every user (e.g. a promo), stored once.
+
+    Each user gets a Notification row for it only when they next read their
+    notifications (see NotificationService.deliver_broadcasts), so sending a promo
+    is one insert instead of one per user. Broadcasts are delivered until they expire.
+    """
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    notification_type = models.CharField(
+        max_length=20,
+        choices=Notification.NotificationType.choices,
+        default=Notification.NotificationType.PROMO
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.notification_type} - {self.title} (until {self.expires_at})"
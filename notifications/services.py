@@ -1,6 +1,26 @@
-from django.db.models import Q
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q, QuerySet
 from django.utils import timezone
-from .models import Notification
+
+from core.batches import delete_in_batches, pk_batches
+from .bus import BROADCAST_CHANNEL, publish, user_channel
+from .models import Broadcast, Notification
+
+# Id of the latest broadcast, written by NotificationService.broadcast; never expires
+BROADCAST_LATEST_KEY = 'notifications:broadcast:latest'
+
+
+def broadcast_seen_key(user_id):
+    return f'notifications:broadcast:seen:{user_id}'
+
+
+def unread_count_key(user_id):
+    return f'notifications:unread:{user_id}'
 
 
 class NotificationService:
@@ -9,18 +29,223 @@ class NotificationService:
         """
         Create a new notification for a user
         """
-        return Notification.objects.create(
+        notification = Notification.objects.create(
             user=user,
             title=title,
             message=message,
             notification_type=notification_type
         )
+        NotificationService.adjust_unread_count(notification.user_id, 1)
+        NotificationService.publish([user_channel(notification.user_id)])
+        return notification
+
+    @staticmethod
+    def fan_out(recipients, title, message, notification_type=Notification.NotificationType.SYSTEM,
+                batch_size=None):
+        """
+        Create the same notification for many users with chunked bulk inserts.
+
+        recipients is a queryset of users or an iterable of user ids, e.g.
+        Booking.objects.filter(function=function).values_list('user_id', flat=True).distinct().
+        Returns the number of notifications created.
+        """
+        created = 0
+        for user_ids in NotificationService._recipient_chunks(recipients, batch_size):
+            Notification.objects.bulk_create([
+                Notification(user_id=user_id, title=title, message=message, notification_type=notification_type)
+                for user_id in user_ids
+            ])
+            NotificationService.invalidate_unread_counts(user_ids)
+            NotificationService.publish([user_channel(user_id) for user_id in user_ids])
+            created += len(user_ids)
+        return created
+
+    @staticmethod
+    def fan_out_async(recipients, title, message, notification_type=Notification.NotificationType.SYSTEM,
+                      batch_size=None):
+        """
+        Run fan_out on the celery workers, one task per chunk of recipients.
+
+        Recipients are read and queued once the current transaction commits.
+        """
+        from .tasks import fan_out_notifications_task
+
+        def queue():
+            for user_ids in NotificationService._recipient_chunks(recipients, batch_size):
+                fan_out_notifications_task.delay(user_ids, title, message, notification_type)
+
+        transaction.on_commit(queue)
+
+    @staticmethod
+    def broadcast(title, message, notification_type=Notification.NotificationType.PROMO, expires_at=None):
+        """
+        Send a notification to every user with a single row (see Broadcast).
+
+        It is delivered to each user the next time they read their notifications,
+        until expires_at (NOTIFICATION_BROADCAST_DAYS from now by default).
+        """
+        if expires_at is None:
+            expires_at = timezone.now() + timezone.timedelta(days=settings.NOTIFICATION_BROADCAST_DAYS)
+        broadcast = Broadcast.objects.create(
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            expires_at=expires_at
+        )
+        # Readers only compare ids in the cache: the writer keeps the latest id there
+        transaction.on_commit(
+            lambda: cache.set(BROADCAST_LATEST_KEY, NotificationService._latest_broadcast_id(), None)
+        )
+        NotificationService.publish([BROADCAST_CHANNEL])
+        return broadcast
+
+    @staticmethod
+    def deliver_broadcasts(user, found=None):
+        """
+        Create the user's copies of the broadcasts they have not received yet.
+
+        In the common case (nothing new) this is a single cache read comparing the
+        latest broadcast id with the last one delivered to the user, with no query;
+        found may hold those keys already read by the caller. The latest id is only
+        read from the database after the cache lost it.
+        Returns the number of broadcasts delivered. It is an upper bound: copies
+        already present (from a concurrent delivery) are skipped by the unique
+        constraint but still counted, as bulk_create cannot tell them apart.
+        """
+        seen_key = broadcast_seen_key(user.pk)
+        if found is None:
+            found = cache.get_many([BROADCAST_LATEST_KEY, seen_key])
+        latest = found.get(BROADCAST_LATEST_KEY)
+        if latest is None:
+            latest = NotificationService._latest_broadcast_id()
+            # add: a newer id written by a broadcast meanwhile is not overwritten
+            cache.add(BROADCAST_LATEST_KEY, latest, None)
+        seen = found.get(seen_key, 0)
+        if latest <= seen:
+            return 0
+
+        # The unique (user, broadcast) constraint makes a repeated delivery a no-op
+        delivered = Notification.objects.bulk_create([
+            Notification(
+                user_id=user.pk,
+                broadcast=broadcast,
+                title=broadcast.title,
+                message=broadcast.message,
+                notification_type=broadcast.notification_type
+            )
+            for broadcast in Broadcast.objects.filter(id__gt=seen, id__lte=latest, expires_at__gt=timezone.now())
+        ], ignore_conflicts=True)
+        cache.set(seen_key, latest, settings.NOTIFICATION_BROADCAST_DAYS * 24 * 60 * 60)
+        if delivered:
+            # Ignored duplicates are not reported by every database: recount
+            NotificationService.invalidate_unread_counts([user.pk])
+        return len(delivered)
+
+    @staticmethod
+    def unread_count(user):
+        """
+        Get the number of unread notifications of a user from the cached counter.
+
+        Pending broadcasts are checked in the same cache read; the counter is
+        counted from the database only when it is not cached (or was invalidated).
+        """
+        unread_key = unread_count_key(user.pk)
+        found = cache.get_many([BROADCAST_LATEST_KEY, broadcast_seen_key(user.pk), unread_key])
+        count = found.get(unread_key)
+        if NotificationService.deliver_broadcasts(user, found) or count is None:
+            count = Notification.objects.filter(user_id=user.pk, status=Notification.NotificationStatus.UNREAD).count()
+            cache.set(unread_key, count, settings.NOTIFICATION_UNREAD_COUNT_TTL)
+        return max(count, 0)
+
+    @staticmethod
+    def adjust_unread_count(user_id, delta):
+        """
+        Atomically add delta to the user's cached unread counter once the transaction commits.
+
+        A counter that is not cached is left alone: it is counted on the next read.
+        """
+        def adjust():
+            try:
+                cache.incr(unread_count_key(user_id), delta)
+            except ValueError:
+                pass
+
+        if delta:
+            transaction.on_commit(adjust)
+
+    @staticmethod
+    def invalidate_unread_counts(user_ids):
+        """
+        Drop the cached unread counters of many users (bulk changes); they are recounted on the next read.
+        """
+        keys = [unread_count_key(user_id) for user_id in user_ids]
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @staticmethod
+    def repair_unread_counts(batch_size=None, progress=None):
+        """
+        Recompute the cached unread counters from the database and fix the ones that drifted.
+
+        Users are scanned in id chunks and only counters present in the cache are
+        checked, with one grouped count query per chunk that has any.
+        Returns (counters checked, counters fixed).
+        """
+        users = get_user_model().objects.order_by('pk').values_list('pk', flat=True)
+        checked = fixed = 0
+        for user_ids in NotificationService._recipient_chunks(users, batch_size):
+            cached = cache.get_many([unread_count_key(user_id) for user_id in user_ids])
+            if not cached:
+                continue
+            counted = dict(
+                Notification.objects.filter(user_id__in=user_ids, status=Notification.NotificationStatus.UNREAD)
+                .order_by().values_list('user_id').annotate(unread=Count('id'))
+            )
+            drifted = {
+                unread_count_key(user_id): counted.get(user_id, 0)
+                for user_id in user_ids
+                if unread_count_key(user_id) in cached and cached[unread_count_key(user_id)] != counted.get(user_id, 0)
+            }
+            cache.set_many(drifted, settings.NOTIFICATION_UNREAD_COUNT_TTL)
+            checked += len(cached)
+            fixed += len(drifted)
+            if progress is not None:
+                progress(checked, fixed)
+        return checked, fixed
+
+    @staticmethod
+    def publish(channels):
+        """
+        Wake the notification streams listening on channels once the transaction commits
+        """
+        transaction.on_commit(lambda: publish(channels))
+
+    @staticmethod
+    def _latest_broadcast_id():
+        return Broadcast.objects.aggregate(latest=Max('id'))['latest'] or 0
+
+    @staticmethod
+    def _recipient_chunks(recipients, batch_size=None):
+        """
+        Yield lists of user ids, reading querysets with iterator() one chunk at a time.
+        """
+        batch_size = batch_size or settings.NOTIFICATION_FAN_OUT_BATCH_SIZE
+        if isinstance(recipients, QuerySet):
+            if recipients.model is get_user_model():
+                recipients = recipients.values_list('pk', flat=True)
+            recipients = recipients.iterator(chunk_size=batch_size)
+        recipients = iter(recipients)
+        while True:
+            user_ids = list(islice(recipients, batch_size))
+            if not user_ids:
+                return
+            yield user_ids
 
     @staticmethod
     def get_user_notifications(user, include_archived=False):
         """
         Get all notifications for a user
         """
+        NotificationService.deliver_broadcasts(user)
         query = Q(user=user)
         if not include_archived:
             query &= ~Q(status=Notification.NotificationStatus.ARCHIVED)
@@ -32,6 +257,7 @@ class NotificationService:
         """
         Get unread notifications for a user
         """
+        NotificationService.deliver_broadcasts(user)
         return Notification.objects.filter(
             user=user,
             status=Notification.NotificationStatus.UNREAD
@@ -43,31 +269,108 @@ class NotificationService:
         Mark all unread notifications as read for a user
         """
         now = timezone.now()
-        return Notification.objects.filter(
+        updated = Notification.objects.filter(
             user=user,
             status=Notification.NotificationStatus.UNREAD
         ).update(
             status=Notification.NotificationStatus.READ,
             read_at=now
         )
+        NotificationService.adjust_unread_count(user.pk, -updated)
+        return updated
 
     @staticmethod
     def bulk_archive_notifications(user, notification_ids):
         """
         Archive multiple notifications at once
         """
-        return Notification.objects.filter(
-            user=user,
-            id__in=notification_ids
+        notifications = Notification.objects.filter(user=user, id__in=notification_ids)
+        # Unread ones apart, so the unread counter can be adjusted exactly
+        unread = notifications.filter(
+            status=Notification.NotificationStatus.UNREAD
+        ).update(status=Notification.NotificationStatus.ARCHIVED)
+        others = notifications.exclude(
+            status=Notification.NotificationStatus.ARCHIVED
         ).update(status=Notification.NotificationStatus.ARCHIVED)
+        NotificationService.adjust_unread_count(user.pk, -unread)
+        return unread + others
 
     @staticmethod
-    def delete_old_notifications(days=30):
+    def archive_read_notifications(days=None, batch_size=None, pause=None, progress=None):
         """
-        Delete notifications older than specified days
+        Archive the notifications read more than days ago (NOTIFICATION_ARCHIVE_READ_DAYS by default),
+        in primary-key batches (see core.batches). progress is called with the running total.
+        Returns the number archived.
         """
+        days = settings.NOTIFICATION_ARCHIVE_READ_DAYS if days is None else days
         threshold_date = timezone.now() - timezone.timedelta(days=days)
-        return Notification.objects.filter(
-            sent_at__lt=threshold_date,
-            status=Notification.NotificationStatus.ARCHIVED
-        ).delete()
+        read = Notification.objects.filter(
+            status=Notification.NotificationStatus.READ,
+            read_at__lt=threshold_date
+        )
+
+        archived = 0
+        for ids in pk_batches(read, *NotificationService._retention_batches(batch_size, pause)):
+            archived += read.filter(id__in=ids).update(status=Notification.NotificationStatus.ARCHIVED)
+            if progress is not None:
+                progress(archived)
+        return archived
+
+    @staticmethod
+    def delete_old_notifications(days=None, batch_size=None, pause=None, progress=None):
+        """
+        Delete the archived notifications sent more than days ago (NOTIFICATION_RETENTION_DAYS by default),
+        in primary-key batches (see core.batches). progress is called with the running total.
+        Returns the number deleted.
+        """
+        days = settings.NOTIFICATION_RETENTION_DAYS if days is None else days
+        threshold_date = timezone.now() - timezone.timedelta(days=days)
+        old = Notification.objects.filter(
+            status=Notification.NotificationStatus.ARCHIVED,
+            sent_at__lt=threshold_date
+        )
+        # Ids grow with sent_at: the first notification sent after the threshold bounds
+        # the scan, so the last batch does not walk the newer rows
+        boundary = Notification.objects.filter(
+            sent_at__gte=threshold_date
+        ).order_by('sent_at').values_list('id', flat=True).first()
+        if boundary is not None:
+            old = old.filter(id__lt=boundary)
+
+        # Nothing references notifications: each batch is a single DELETE by id
+        deleted, _ = delete_in_batches(
+            old, *NotificationService._retention_batches(batch_size, pause),
+            progress=None if progress is None else lambda deleted, _: progress(deleted)
+        )
+        return deleted
+
+    @staticmethod
+    def apply_retention(archive_days=None, delete_days=None, batch_size=None, pause=None, progress=None):
+        """
+        Archive old read notifications, then delete old archived ones.
+
+        progress, if given, is called after each batch with the step ('Archived' or
+        'Deleted') and the number of notifications it processed so far.
+        Returns (archived, deleted).
+        """
+        def step_progress(step):
+            return None if progress is None else lambda done: progress(step, done)
+
+        archived = NotificationService.archive_read_notifications(
+            archive_days, batch_size, pause, step_progress('Archived')
+        )
+        deleted = NotificationService.delete_old_notifications(
+            delete_days, batch_size, pause, step_progress('Deleted')
+        )
+        return archived, deleted
+
+    @staticmethod
+    def _retention_batches(batch_size=None, pause=None):
+        """
+        Batch size and pause of the retention job. Batch ids are read through the status
+        index, already in primary-key order within a status (InnoDB appends the key).
+        """
+        return (
+            batch_size or settings.NOTIFICATION_RETENTION_BATCH_SIZE,
+            settings.NOTIFICATION_RETENTION_PAUSE if pause is None else pause,
+        )
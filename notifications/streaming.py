@@ -0,0 +1,138 @@
+"""
+Server-Sent Events stream pushing new notifications to the authenticated user.
+
+Served by the ASGI application (cine.asgi), where an idle connection is a
+suspended coroutine instead of a busy worker. Under WSGI the endpoint degrades
+to short polling: it answers with the events pending now and closes, and the
+client reconnects after the retry interval.
+"""
+import asyncio
+import random
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Max
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from core.renderers import dumps
+from users.authentication import TokenClaimsAuthentication
+from .bus import BROADCAST_CHANNEL, get_notification_bus, user_channel
+from .models import Notification
+from .services import NotificationService
+
+BATCH_SIZE = 100
+
+EVENT_FIELDS = ('id', 'title', 'message', 'notification_type', 'status', 'sent_at', 'read_at')
+
+
+async def notification_stream(request):
+    """
+    Stream the user's new notifications as 'notification' events, with the notification id as event id.
+
+    The access token goes in the Authorization header or, for EventSource clients
+    that cannot send headers, in the access_token query parameter. Without
+    Last-Event-ID only notifications created after connecting are sent.
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    user = authenticate(request)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided or are invalid.'}, status=401)
+
+    last_id = last_event_id(request)
+    if last_id is None:
+        last_id = await sync_to_async(latest_notification_id)(user)
+
+    if isinstance(request, ASGIRequest):
+        content = event_stream(user, last_id)
+    else:
+        rows = await sync_to_async(new_notifications)(user, last_id)
+        content = [retry_field()] + [encode_event(row) for row in rows]
+
+    response = StreamingHttpResponse(content, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Tell nginx not to buffer the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def event_stream(user, last_id):
+    # Subscribe before the first read, so nothing created in between is missed
+    subscription = await get_notification_bus().subscribe([user_channel(user.pk), BROADCAST_CHANNEL])
+    try:
+        yield retry_field()
+        deadline = time.monotonic() + settings.NOTIFICATION_STREAM_MAX_AGE
+        woken = True
+        while True:
+            # Bus messages only say that there is something new: read it from the database
+            while woken:
+                rows = await sync_to_async(new_notifications)(user, last_id)
+                for row in rows:
+                    yield encode_event(row)
+                if rows:
+                    last_id = rows[-1]['id']
+                woken = len(rows) == BATCH_SIZE
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            channels = await subscription.wait(min(settings.NOTIFICATION_STREAM_HEARTBEAT, remaining))
+            if not channels:
+                yield b': keep-alive\n\n'
+            elif channels == {BROADCAST_CHANNEL}:
+                # Every open stream wakes up: spread their inserts of the user's copy
+                await asyncio.sleep(random.uniform(0, settings.NOTIFICATION_STREAM_BROADCAST_JITTER))
+            woken = bool(channels)
+    finally:
+        await subscription.close()
+
+
+def authenticate(request):
+    """
+    User from the access token claims (no database lookup), or None.
+    """
+    authentication = TokenClaimsAuthentication()
+    try:
+        header = authentication.get_header(request)
+        # A malformed header or token raises AuthenticationFailed (InvalidToken is one)
+        raw_token = authentication.get_raw_token(header) if header is not None else None
+        if raw_token is None and request.GET.get('access_token'):
+            raw_token = request.GET['access_token'].encode()
+        if raw_token is None:
+            return None
+        return authentication.get_token_user(authentication.get_validated_token(raw_token))
+    except AuthenticationFailed:
+        return None
+
+
+def last_event_id(request):
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def latest_notification_id(user):
+    NotificationService.deliver_broadcasts(user)
+    return Notification.objects.filter(user_id=user.pk).aggregate(latest=Max('id'))['latest'] or 0
+
+
+def new_notifications(user, last_id):
+    NotificationService.deliver_broadcasts(user)
+    return list(
+        Notification.objects.filter(user_id=user.pk, id__gt=last_id)
+        .order_by('id').values(*EVENT_FIELDS)[:BATCH_SIZE]
+    )
+
+
+def encode_event(row):
+    return b'id: %d\nevent: notification\ndata: %s\n\n' % (row['id'], dumps(row))
+
+
+def retry_field():
+    return b'retry: %d\n\n' % settings.NOTIFICATION_STREAM_RETRY
@@ -0,0 +1,27 @@
+from celery import shared_task
+
+from .services import NotificationService
+
+
+@shared_task
+def fan_out_notifications_task(user_ids, title, message, notification_type):
+    """
+    Create one chunk of a notification fan-out (see NotificationService.fan_out_async)
+    """
+    return NotificationService.fan_out(user_ids, title, message, notification_type)
+
+
+@shared_task
+def repair_unread_counts_task():
+    """
+    Periodic task that fixes cached unread counters that drifted from the database
+    """
+    return NotificationService.repair_unread_counts()
+
+
+@shared_task
+def apply_notification_retention_task():
+    """
+    Periodic task that archives old read notifications and deletes old archived ones, in batches
+    """
+    return NotificationService.apply_retention()
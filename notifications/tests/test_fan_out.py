@@ -0,0 +1,104 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from cine.celery import app as celery_app
+from notifications.models import Broadcast, Notification
+from notifications.services import BROADCAST_LATEST_KEY, NotificationService
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def users():
+    return [
+        CustomUser.objects.create_user(username=f'user{i}', email=f'user{i}@example.com', password='x')
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def eager_celery():
+    celery_app.conf.task_always_eager = True
+    yield
+    celery_app.conf.task_always_eager = False
+
+
+def list_notifications(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client.get('/api/notifications/list/').json()['results']
+
+
+class TestFanOut:
+    def test_inserts_in_chunks(self, users, django_assert_num_queries):
+        # One insert per chunk of two, plus the chunked read of the user ids
+        with django_assert_num_queries(4):
+            created = NotificationService.fan_out(
+                CustomUser.objects.order_by('id'), 'Función demorada', 'Empieza 30 minutos tarde', batch_size=2
+            )
+
+        assert created == 5
+        assert set(Notification.objects.values_list('user_id', flat=True)) == {user.id for user in users}
+
+    def test_accepts_user_ids(self, users):
+        NotificationService.fan_out(
+            [users[0].id, users[2].id], 'Recordatorio', 'Tu función empieza pronto',
+            Notification.NotificationType.REMINDER
+        )
+
+        assert list(Notification.objects.order_by('user_id').values_list('user_id', 'notification_type')) == [
+            (users[0].id, 'REMINDER'), (users[2].id, 'REMINDER'),
+        ]
+
+    def test_async_fan_out_runs_on_workers(self, users, eager_celery, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.fan_out_async(CustomUser.objects.all(), 'Aviso', 'Mensaje', batch_size=2)
+
+        assert Notification.objects.count() == 5
+
+
+class TestBroadcast:
+    def test_one_row_delivered_on_read(self, users, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.broadcast('2x1 los martes', 'Promo válida hasta fin de mes')
+        assert Broadcast.objects.count() == 1
+        assert not Notification.objects.exists()
+
+        assert [n['title'] for n in list_notifications(users[0])] == ['2x1 los martes']
+        assert Notification.objects.get().user == users[0]
+
+    def test_delivered_once(self, users, django_capture_on_commit_callbacks, django_assert_num_queries):
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.broadcast('Promo', 'Mensaje')
+        assert NotificationService.deliver_broadcasts(users[0]) == 1
+
+        with django_assert_num_queries(0):
+            assert NotificationService.deliver_broadcasts(users[0]) == 0
+
+        # Without the cached checkpoint the unique constraint prevents duplicates
+        cache.clear()
+        NotificationService.deliver_broadcasts(users[0])
+        assert Notification.objects.filter(user=users[0]).count() == 1
+
+    def test_readers_do_not_query_the_latest_broadcast(self, users, django_capture_on_commit_callbacks,
+                                                       django_assert_num_queries):
+        with django_capture_on_commit_callbacks(execute=True):
+            broadcast = NotificationService.broadcast('Promo', 'Mensaje')
+        assert cache.get(BROADCAST_LATEST_KEY) == broadcast.id
+        NotificationService.deliver_broadcasts(users[1])
+
+        # The latest id does not expire: checks never go back to the database
+        with django_assert_num_queries(0):
+            assert NotificationService.deliver_broadcasts(users[1]) == 0
+
+    def test_expired_broadcasts_are_not_delivered(self, users, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.broadcast('Vencida', 'Mensaje', expires_at=timezone.now() - datetime.timedelta(days=1))
+
+        assert NotificationService.deliver_broadcasts(users[0]) == 0
+        assert not Notification.objects.exists()
@@ -0,0 +1,58 @@
+import pytest
+from django.utils import timezone
+
+from notifications.models import Notification
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def notifications(user):
+    Notification.objects.bulk_create([
+        Notification(user=user, title=f'Aviso {i}', message='Mensaje', status=status)
+        for i, status in enumerate(['UNREAD', 'READ', 'ARCHIVED', 'UNREAD', 'UNREAD'])
+    ])
+    # Two notifications sent at the same instant: the id breaks the tie
+    now = timezone.now()
+    Notification.objects.filter(title__in=['Aviso 3', 'Aviso 4']).update(sent_at=now)
+    Notification.objects.exclude(title__in=['Aviso 3', 'Aviso 4']).update(sent_at=now - timezone.timedelta(hours=1))
+    return list(Notification.objects.order_by('-sent_at', '-id'))
+
+
+def read_all(client, url):
+    titles, pages = [], 0
+    while url:
+        data = client.get(url).json()
+        titles += [n['title'] for n in data['results']]
+        url, pages = data['next'], pages + 1
+    return titles, pages
+
+
+class TestNotificationListing:
+    def test_pages_follow_sent_at_and_id(self, auth_client, notifications):
+        titles, pages = read_all(auth_client, '/api/notifications/list/?page_size=2')
+
+        assert titles == ['Aviso 4', 'Aviso 3', 'Aviso 1', 'Aviso 0']
+        assert pages == 2
+
+    def test_include_archived(self, auth_client, notifications):
+        titles, _ = read_all(auth_client, '/api/notifications/list/?page_size=2&include_archived=true')
+
+        assert titles == [n.title for n in notifications]
+
+    def test_unread_pages(self, auth_client, notifications):
+        titles, pages = read_all(auth_client, '/api/notifications/unread/?page_size=1')
+
+        assert titles == ['Aviso 4', 'Aviso 3', 'Aviso 0']
+        assert pages == 3
+
+    def test_each_page_is_one_query(self, auth_client, notifications, django_assert_num_queries):
+        first = auth_client.get('/api/notifications/list/?page_size=2').json()
+
+        with django_assert_num_queries(1):
+            second = auth_client.get(first['next']).json()
+        assert [n['title'] for n in second['results']] == ['Aviso 1', 'Aviso 0']
+        assert second['next'] is None
+
+    def test_invalid_cursor(self, auth_client, notifications):
+        assert auth_client.get('/api/notifications/unread/?cursor=roto').status_code == 404
@@ -0,0 +1,81 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from notifications.models import Notification
+from notifications.services import NotificationService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr('core.batches.time.sleep', calls.append)
+    return calls
+
+
+def create(user, title, status, days_ago, read_days_ago=None):
+    notification = Notification.objects.create(user=user, title=title, message='Mensaje', status=status)
+    now = timezone.now()
+    Notification.objects.filter(pk=notification.pk).update(
+        sent_at=now - timezone.timedelta(days=days_ago),
+        read_at=None if read_days_ago is None else now - timezone.timedelta(days=read_days_ago)
+    )
+    return notification
+
+
+def titles(**filters):
+    return sorted(Notification.objects.filter(**filters).values_list('title', flat=True))
+
+
+class TestArchiveReadNotifications:
+    def test_archives_only_old_read_notifications(self, user, sleeps):
+        create(user, 'leida hace tiempo', 'READ', 40, read_days_ago=20)
+        create(user, 'leida hace poco', 'READ', 40, read_days_ago=2)
+        create(user, 'sin leer', 'UNREAD', 40)
+
+        assert NotificationService.archive_read_notifications(days=14) == 1
+        assert titles(status='ARCHIVED') == ['leida hace tiempo']
+
+
+class TestDeleteOldNotifications:
+    def test_deletes_old_archived_notifications_in_batches(self, user, sleeps, django_assert_num_queries):
+        for i in range(5):
+            create(user, f'vieja {i}', 'ARCHIVED', 40)
+        create(user, 'archivada reciente', 'ARCHIVED', 5)
+        create(user, 'vieja sin leer', 'UNREAD', 40)
+        progress = []
+
+        # Boundary lookup, then one select and one delete per batch of two
+        with django_assert_num_queries(7):
+            deleted = NotificationService.delete_old_notifications(
+                days=30, batch_size=2, pause=0.1, progress=progress.append
+            )
+
+        assert deleted == 5
+        assert progress == [2, 4, 5]
+        assert sleeps == [0.1, 0.1]
+        assert titles() == ['archivada reciente', 'vieja sin leer']
+
+    def test_nothing_to_delete(self, user, sleeps):
+        create(user, 'archivada reciente', 'ARCHIVED', 5)
+
+        assert NotificationService.delete_old_notifications(days=30) == 0
+        assert sleeps == []
+
+
+class TestApplyRetentionCommand:
+    def test_archives_then_deletes(self, user, sleeps):
+        create(user, 'leida vieja', 'READ', 40, read_days_ago=35)
+        create(user, 'leida reciente', 'READ', 20, read_days_ago=15)
+        out = StringIO()
+
+        call_command('apply_notification_retention', '--archive-days=14', '--delete-days=30', stdout=out)
+
+        assert titles() == ['leida reciente']
+        assert titles(status='ARCHIVED') == ['leida reciente']
+        assert 'Archived 2 notifications' in out.getvalue()
+        assert 'Deleted 1 notifications' in out.getvalue()
@@ -0,0 +1,195 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient
+
+from notifications.bus import BROADCAST_CHANNEL, LocalNotificationBus, LocalSubscription, user_channel
+from notifications.services import NotificationService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def stream_settings(settings):
+    settings.NOTIFICATION_STREAM_HEARTBEAT = 5
+    settings.NOTIFICATION_STREAM_MAX_AGE = 10
+    settings.NOTIFICATION_STREAM_RETRY = 3000
+    settings.NOTIFICATION_STREAM_BROADCAST_JITTER = 0
+
+
+@pytest.fixture
+def notify(user, django_capture_on_commit_callbacks):
+    def notify(title):
+        # Publishes to the bus on commit, as in production
+        with django_capture_on_commit_callbacks(execute=True):
+            return NotificationService.create_notification(user, title, 'Mensaje')
+    return sync_to_async(notify)
+
+
+def parse_event(chunk):
+    fields = dict(line.split(': ', 1) for line in chunk.decode().strip().split('\n'))
+    return int(fields['id']), fields['event'], json.loads(fields['data'])
+
+
+async def open_stream(path='/api/notifications/stream/', **headers):
+    response = await AsyncClient().get(path, headers=headers)
+    return response, response.streaming_content.__aiter__()
+
+
+async def next_chunk(stream):
+    return await asyncio.wait_for(stream.__anext__(), 5)
+
+
+class TestNotificationStream:
+    def test_requires_a_valid_token(self):
+        async def scenario():
+            assert (await AsyncClient().get('/api/notifications/stream/')).status_code == 401
+            response = await AsyncClient().get('/api/notifications/stream/', headers={'Authorization': 'Bearer nope'})
+            assert response.status_code == 401
+            # Malformed header / token values raise AuthenticationFailed in simplejwt
+            response = await AsyncClient().get('/api/notifications/stream/', headers={'Authorization': 'Bearer a b'})
+            assert response.status_code == 401
+            response = await AsyncClient().get('/api/notifications/stream/?access_token=a.b')
+            assert response.status_code == 401
+
+        async_to_sync(scenario)()
+
+    def test_pushes_new_notifications(self, token, notify):
+        async def scenario():
+            await notify('Anterior')
+            response, stream = await open_stream(Authorization=f'Bearer {token}')
+            assert response['Content-Type'] == 'text/event-stream'
+            assert response['Cache-Control'] == 'no-cache'
+            assert await next_chunk(stream) == b'retry: 3000\n\n'
+
+            notification = await notify('Nueva función')
+            event_id, event, data = parse_event(await next_chunk(stream))
+            await stream.aclose()
+            return notification, event_id, event, data
+
+        notification, event_id, event, data = async_to_sync(scenario)()
+        assert (event_id, event) == (notification.id, 'notification')
+        assert data['title'] == 'Nueva función'
+        assert data['status'] == 'UNREAD'
+
+    def test_resumes_after_last_event_id(self, token, notify):
+        async def scenario():
+            first = await notify('Uno')
+            second = await notify('Dos')
+            third = await notify('Tres')
+            # EventSource cannot send custom headers: the token may go in the query string
+            response, stream = await open_stream(
+                f'/api/notifications/stream/?access_token={token}', **{'Last-Event-ID': str(first.id)}
+            )
+            await next_chunk(stream)
+            ids = [parse_event(await next_chunk(stream))[0] for _ in range(2)]
+            await stream.aclose()
+            return ids, [second.id, third.id]
+
+        ids, expected = async_to_sync(scenario)()
+        assert ids == expected
+
+    def test_idle_stream_sends_keep_alives_and_expires(self, settings, token):
+        settings.NOTIFICATION_STREAM_HEARTBEAT = 0.05
+        settings.NOTIFICATION_STREAM_MAX_AGE = 0.2
+
+        async def scenario():
+            response, stream = await open_stream(Authorization=f'Bearer {token}')
+            return [chunk async for chunk in stream]
+
+        chunks = async_to_sync(scenario)()
+        assert chunks[0] == b'retry: 3000\n\n'
+        assert set(chunks[1:]) == {b': keep-alive\n\n'}
+
+    def test_broadcasts_reach_open_streams(self, token, django_capture_on_commit_callbacks):
+        def broadcast():
+            with django_capture_on_commit_callbacks(execute=True):
+                NotificationService.broadcast('Promo', '2x1')
+
+        async def scenario():
+            response, stream = await open_stream(Authorization=f'Bearer {token}')
+            await next_chunk(stream)
+            await sync_to_async(broadcast)()
+            data = parse_event(await next_chunk(stream))[2]
+            await stream.aclose()
+            return data
+
+        assert async_to_sync(scenario)()['title'] == 'Promo'
+
+    def test_only_broadcast_wakes_are_delayed(self, settings, token, notify, monkeypatch,
+                                              django_capture_on_commit_callbacks):
+        settings.NOTIFICATION_STREAM_BROADCAST_JITTER = 2
+        delays = []
+        monkeypatch.setattr('notifications.streaming.random.uniform', lambda low, high: delays.append(high) or 0)
+
+        def broadcast():
+            with django_capture_on_commit_callbacks(execute=True):
+                NotificationService.broadcast('Promo', '2x1')
+
+        async def wake_with(stream, publish):
+            # Publish once the stream is waiting on the bus
+            chunk = asyncio.ensure_future(next_chunk(stream))
+            await asyncio.sleep(0.1)
+            await publish()
+            await chunk
+
+        async def scenario():
+            response, stream = await open_stream(Authorization=f'Bearer {token}')
+            await next_chunk(stream)
+            await wake_with(stream, lambda: notify('Nueva función'))
+            no_delay = list(delays)
+            await wake_with(stream, sync_to_async(broadcast))
+            await stream.aclose()
+            return no_delay
+
+        assert async_to_sync(scenario)() == []
+        assert delays == [2]
+
+    def test_wsgi_answers_pending_events_and_closes(self, client, token, user):
+        first = NotificationService.create_notification(user, 'Uno', 'Mensaje')
+        second = NotificationService.create_notification(user, 'Dos', 'Mensaje')
+
+        response = client.get('/api/notifications/stream/', headers={
+            'Authorization': f'Bearer {token}', 'Last-Event-ID': str(first.id)
+        })
+
+        chunks = list(response.streaming_content)
+        assert chunks[0] == b'retry: 3000\n\n'
+        assert [parse_event(chunk)[0] for chunk in chunks[1:]] == [second.id]
+
+
+class TestLocalNotificationBus:
+    def test_wakes_subscribers_of_the_channel(self):
+        async def scenario():
+            bus = LocalNotificationBus()
+            subscription = await bus.subscribe([user_channel(1), BROADCAST_CHANNEL])
+            other = await bus.subscribe([user_channel(2)])
+
+            bus.publish_many([user_channel(1), BROADCAST_CHANNEL])
+            woken = await subscription.wait(1)
+            # Queued messages wake the subscriber once
+            again = await subscription.wait(0.01)
+            other_woken = await other.wait(0.01)
+
+            await subscription.close()
+            bus.publish_many([user_channel(1)])
+            closed = await subscription.wait(0.01)
+            return woken, again, other_woken, closed
+
+        assert async_to_sync(scenario)() == ({user_channel(1), BROADCAST_CHANNEL}, set(), set(), set())
+
+    def test_tracks_channels_in_use(self):
+        # RedisNotificationBus subscribes its shared connection to these channels
+        async def scenario():
+            bus = LocalNotificationBus()
+            first = await bus.subscribe([user_channel(1), BROADCAST_CHANNEL])
+            second = LocalSubscription(bus, [user_channel(2), BROADCAST_CHANNEL])
+            added = bus._add(second)
+            return added, bus._remove(first), bus._remove(second)
+
+        added, first_removed, second_removed = async_to_sync(scenario)()
+        assert added == [user_channel(2)]
+        assert first_removed == [user_channel(1)]
+        assert second_removed == [user_channel(2), BROADCAST_CHANNEL]
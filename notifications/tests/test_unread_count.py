@@ -0,0 +1,58 @@
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from notifications.services import NotificationService, unread_count_key
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def notifications(user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        return [NotificationService.create_notification(user, f'Aviso {i}', 'Mensaje') for i in range(3)]
+
+
+class TestUnreadCount:
+    def test_endpoint_reads_the_cached_counter(self, auth_client, notifications, django_assert_num_queries):
+        assert auth_client.get('/api/notifications/unread/count/').json() == {'unread': 3}
+
+        with django_assert_num_queries(0):
+            assert auth_client.get('/api/notifications/unread/count/').json() == {'unread': 3}
+
+    def test_counter_is_maintained(self, user, notifications, django_capture_on_commit_callbacks,
+                                   django_assert_num_queries):
+        assert NotificationService.unread_count(user) == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.create_notification(user, 'Nuevo', 'Mensaje')
+            notifications[0].mark_as_read()
+            notifications[0].mark_as_read()
+            NotificationService.bulk_archive_notifications(user, [notifications[0].id, notifications[1].id])
+        with django_assert_num_queries(0):
+            assert NotificationService.unread_count(user) == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.mark_all_as_read(user)
+        assert NotificationService.unread_count(user) == 0
+        assert cache.get(unread_count_key(user.pk)) == 0
+
+    def test_fan_out_and_broadcasts_are_counted(self, user, notifications, django_capture_on_commit_callbacks):
+        assert NotificationService.unread_count(user) == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationService.fan_out([user.id], 'Función demorada', 'Mensaje')
+            NotificationService.broadcast('Promo', 'Mensaje')
+        assert NotificationService.unread_count(user) == 5
+
+    def test_repair_fixes_drifted_counters(self, user, notifications, capsys):
+        other = CustomUser.objects.create_user(username='luis', email='luis@example.com', password='x')
+        NotificationService.unread_count(user)
+        cache.set(unread_count_key(user.pk), 42)
+
+        call_command('repair_unread_counts', '--batch-size', '1')
+
+        assert 'Checked 1 cached unread counters; fixed 1' in capsys.readouterr().out
+        assert cache.get(unread_count_key(user.pk)) == 3
+        assert cache.get(unread_count_key(other.pk)) is None
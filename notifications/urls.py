@@ -2,10 +2,12 @@ from django.urls import path
 from .views import (
     NotificationListView,
     UnreadNotificationsView,
+    UnreadCountView,
     MarkNotificationReadView,
     MarkAllReadView,
     ArchiveNotificationsView
 )
+from .streaming import notification_stream
 
 app_name = 'notifications'
 
@@ -16,6 +18,12 @@ urlpatterns = [
     # Listar notificaciones no leídas
     path('unread/', UnreadNotificationsView.as_view(), name='unread-notifications'),
     
+    # Cantidad de notificaciones no leídas (badge)
+    path('unread/count/', UnreadCountView.as_view(), name='unread-count'),
+    
+    # Stream de notificaciones nuevas (Server-Sent Events, servido por cine.asgi)
+    path('stream/', notification_stream, name='notification-stream'),
+    
     # Marcar una notificación específica como leída
     path('<int:notification_id>/mark-read/', MarkNotificationReadView.as_view(), name='mark-notification-read'),
     
@@ -3,38 +3,59 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.pagination import KeysetPagination
+from users.authentication import TokenClaimsAuthentication
 from .models import Notification
 from .services import NotificationService
 
 
 class NotificationListView(APIView):
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsAuthenticated]
+    ordering = ('-sent_at', '-id')
 
     def get(self, request):
         """
-        Get user's notifications
+        Get a page of the user's notifications, newest first ('results'), and the link to the next one ('next')
         """
         include_archived = request.GET.get('include_archived', '').lower() == 'true'
         notifications = NotificationService.get_user_notifications(
             request.user,
             include_archived=include_archived
         ).values('id', 'title', 'message', 'notification_type', 'status', 'sent_at', 'read_at')
-        
-        return Response(list(notifications))
+
+        paginator = KeysetPagination(ordering=self.ordering, page_size=20)
+        page = paginator.paginate_queryset(notifications, request, self)
+        return paginator.get_paginated_response(page)
 
 
 class UnreadNotificationsView(APIView):
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsAuthenticated]
+    ordering = ('-sent_at', '-id')
 
     def get(self, request):
         """
-        Get user's unread notifications
+        Get a page of the user's unread notifications, newest first ('results'), and the link to the next one ('next')
         """
         notifications = NotificationService.get_unread_notifications(
             request.user
         ).values('id', 'title', 'message', 'notification_type', 'sent_at')
-        
-        return Response(list(notifications))
+
+        paginator = KeysetPagination(ordering=self.ordering, page_size=20)
+        page = paginator.paginate_queryset(notifications, request, self)
+        return paginator.get_paginated_response(page)
+
+
+class UnreadCountView(APIView):
+    authentication_classes = [TokenClaimsAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Get the number of unread notifications (for the badge), from the cached counter
+        """
+        return Response({'unread': NotificationService.unread_count(request.user)})
 
 
 class MarkNotificationReadView(APIView):
@@ -0,0 +1,115 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+# Columnas del usuario que se guardan en la caché: las que usan los permisos
+AUTH_USER_CACHED_FIELDS = ('id', 'username', 'is_admin', 'is_customer', 'is_active', 'is_locked')
+
+
+def auth_user_cache_key(user_id):
+    return f'users:auth:{user_id}'
+
+
+class ReadOnlyUserError(RuntimeError):
+    """
+    Se intentó guardar o borrar el request.user de solo lectura (ver read_only_user).
+    """
+
+
+def _refuse_write(*args, **kwargs):
+    raise ReadOnlyUserError(
+        'request.user es de solo lectura con esta autenticación: leer el usuario de la base para modificarlo'
+    )
+
+
+def read_only_user(user_model, fields):
+    """
+    Usuario armado con algunas columnas, sin consultar la base.
+
+    Las columnas que no están en fields quedan diferidas (como con only()): se leen
+    de la base al accederlas, en lugar de tomar los valores por defecto del modelo.
+    save() y delete() lanzan ReadOnlyUserError, para no persistir datos cacheados.
+    """
+    # from_db espera las columnas en el orden del modelo
+    names = [field.attname for field in user_model._meta.concrete_fields if field.attname in fields]
+    user = user_model.from_db(None, names, [fields[name] for name in names])
+    user.save = user.delete = _refuse_write
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication que resuelve el usuario del token desde la caché.
+
+    Se guardan AUTH_USER_CACHE_TIMEOUT segundos solo las columnas de
+    AUTH_USER_CACHED_FIELDS (nunca el hash de la contraseña ni los intentos
+    fallidos), así que la mayoría de los requests autenticados no consultan la
+    tabla de usuarios.
+
+    request.user es siempre de solo lectura (read_only_user): las columnas en caché
+    pueden tener hasta AUTH_USER_CACHE_TIMEOUT segundos de antigüedad, las demás se
+    leen de la base al accederlas, y save() / delete() lanzan ReadOnlyUserError,
+    así que las vistas que modifican al usuario deben leerlo de la base. La entrada se
+    invalida al guardar o eliminar el usuario (users.signals), lo que incluye el
+    bloqueo, el desbloqueo, la desactivación y el cambio de perfil.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        key = auth_user_cache_key(user_id)
+        fields = cache.get(key)
+        if fields is None:
+            user = super().get_user(validated_token)
+            fields = {field: getattr(user, field) for field in AUTH_USER_CACHED_FIELDS}
+            cache.set(key, fields, settings.AUTH_USER_CACHE_TIMEOUT)
+        elif not fields['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return read_only_user(self.user_model, fields)
+
+
+class TokenClaimsAuthentication(CachedJWTAuthentication):
+    """
+    Autenticación sin consultas para endpoints de solo lectura.
+
+    En los métodos seguros (GET, HEAD, OPTIONS) confía en la firma del token de
+    acceso y arma el usuario con el id del token, sin leer la base ni la caché:
+    sirve para vistas que solo usan request.user para filtrar los datos del propio
+    usuario (mis reservas, mis notificaciones). El usuario es de solo lectura y solo
+    trae el id: cualquier otra columna se lee de la base al accederla, y save() /
+    delete() lanzan ReadOnlyUserError. Un usuario desactivado conserva
+    ese acceso de lectura hasta que vence su token de acceso. Los demás métodos
+    se autentican como en CachedJWTAuthentication.
+    """
+
+    def authenticate(self, request):
+        if request.method not in SAFE_METHODS:
+            return super().authenticate(request)
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return self.get_token_user(validated_token), validated_token
+
+    def get_token_user(self, validated_token):
+        """
+        Usuario de solo lectura con la clave primaria tomada de los claims del token.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        return read_only_user(self.user_model, {api_settings.USER_ID_FIELD: user_id})
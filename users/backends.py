@@ -1,59 +1,60 @@
-from datetime import timedelta
-
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
-from django.core.exceptions import PermissionDenied
-from django.utils.timezone import now
 from rest_framework.exceptions import AuthenticationFailed
 
 from users.models import CustomUser
+from users.services import LoginProtectionService
 
 
 class CustomAuthBackend(ModelBackend):
     def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Autentica al usuario aplicando la protección contra fuerza bruta.
+
+        Es el único punto donde se verifican contraseñas (LoginView y los
+        endpoints de tokens JWT pasan por aquí). Los intentos de un usuario o IP
+        que superaron su límite se rechazan antes de consultar la base y de
+        calcular el hash; los intentos fallidos se cuentan en la caché y solo se
+        escribe en la base al bloquear o desbloquear al usuario.
+        """
+        ip = LoginProtectionService.client_ip(request)
+        LoginProtectionService.check(username, ip)
+
         try:
             user = CustomUser.objects.get(username=username)
-            print(f"Usuario encontrado: {username}")  # Debug
-            print(f"Contraseña recibida: {password}")  # Debug
-            print(f"Hash almacenado: {user.password}")  # Debug
+        except CustomUser.DoesNotExist:
+            LoginProtectionService.register_failure(username, ip)
+            raise AuthenticationFailed("Usuario no encontrado")
 
-            # Verificar si el usuario está bloqueado
+        # Verificar si el usuario está bloqueado
+        if user.is_locked:
+            user.unlock()  # Intenta desbloquear si el tiempo ha pasado
             if user.is_locked:
-                user.unlock()  # Intenta desbloquear si el tiempo ha pasado
-                if user.is_locked:
-                    raise AuthenticationFailed({
-                        'error': "Usuario bloqueado.",
-                        'locked_until': user.lockout_time + timedelta(minutes=10)
-                    })
-
-            # Verificar contraseña
-            is_valid = user.check_password(password)
-            print(f"Resultado de check_password: {is_valid}")  # Debug
-            
-            if is_valid:
-                if not user.is_active:
-                    raise AuthenticationFailed("Tu cuenta está desactivada.")
-                
-                # Reset intentos fallidos si la autenticación es exitosa
-                user.reset_failed_attempts()
-                return user
-            else:
-                # Incrementar intentos fallidos
-                user.increment_failed_attempts()
-                attempts_left = 3 - user.failed_attempts
+                LoginProtectionService.register_failure(username, ip)
                 raise AuthenticationFailed({
-                    'error': 'Contraseña incorrecta.',
-                    'attempts_left': attempts_left
+                    'error': "Usuario bloqueado.",
+                    'locked_until': user.locked_until
                 })
+            LoginProtectionService.reset(username)
 
-        except CustomUser.DoesNotExist:
-            raise AuthenticationFailed("Usuario no encontrado")
-        except Exception as e:
-            print(f"Error en autenticación: {str(e)}")  # Debug
-            raise AuthenticationFailed(str(e))
+        # Verificar contraseña
+        if not user.check_password(password):
+            attempts = LoginProtectionService.register_failure(username, ip, user)
+            raise AuthenticationFailed({
+                'error': 'Contraseña incorrecta.',
+                'attempts_left': max(settings.LOGIN_MAX_FAILED_ATTEMPTS - attempts, 0)
+            })
+
+        if not user.is_active:
+            raise AuthenticationFailed("Tu cuenta está desactivada.")
+
+        # Reset intentos fallidos si la autenticación es exitosa
+        LoginProtectionService.reset(username)
+        return user
 
     def get_user(self, user_id):
         try:
             user = CustomUser.objects.get(pk=user_id)
             return user if user.is_active else None
         except CustomUser.DoesNotExist:
-            return None
\ No newline at end of file
+            return None
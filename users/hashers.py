@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.exceptions import ImproperlyConfigured
+
+
+class TunableHasherMixin:
+    """
+    Toma los parámetros de costo del hasher de settings.PASSWORD_HASHER_PARAMS.
+
+    Los parámetros se indexan por algoritmo, p. ej. {'scrypt': {'work_factor': 2 ** 15}}.
+    Como el algoritmo no cambia, los hashes existentes se siguen verificando y,
+    si se hicieron con otros parámetros, Django los recalcula al iniciar sesión
+    (check_password guarda el hash nuevo). Los parámetros también se pueden pasar
+    al constructor (ver el comando benchmark_password_hashers).
+    """
+
+    def __init__(self, **params):
+        configured = getattr(settings, 'PASSWORD_HASHER_PARAMS', {}).get(self.algorithm, {})
+        for name, value in {**configured, **params}.items():
+            if name.startswith('_') or not hasattr(self, name):
+                raise ImproperlyConfigured(f'Parámetro desconocido para el hasher {self.algorithm}: {name}')
+            setattr(self, name, value)
+
+    @property
+    def params(self):
+        return {name: getattr(self, name) for name in self.tunable_params}
+
+
+class TunedPBKDF2PasswordHasher(TunableHasherMixin, hashers.PBKDF2PasswordHasher):
+    tunable_params = ('iterations',)
+
+
+class TunedScryptPasswordHasher(TunableHasherMixin, hashers.ScryptPasswordHasher):
+    tunable_params = ('work_factor', 'block_size', 'parallelism')
+    # Límite de memoria de hashlib.scrypt (usa 128 * work_factor * block_size bytes),
+    # no una reserva: el límite por defecto de OpenSSL (32 MiB) no admite work_factor 2 ** 15
+    maxmem = 256 * 1024 * 1024
+
+
+class TunedArgon2PasswordHasher(TunableHasherMixin, hashers.Argon2PasswordHasher):
+    """
+    Requiere argon2-cffi (dependencia opcional, no está en requirements.txt).
+    """
+    tunable_params = ('time_cost', 'memory_cost', 'parallelism')
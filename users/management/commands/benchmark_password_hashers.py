@@ -0,0 +1,91 @@
+import math
+import statistics
+import time
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+
+from users.hashers import TunedArgon2PasswordHasher, TunedPBKDF2PasswordHasher, TunedScryptPasswordHasher
+
+HASHERS = {
+    hasher.algorithm: hasher
+    for hasher in (TunedPBKDF2PasswordHasher, TunedScryptPasswordHasher, TunedArgon2PasswordHasher)
+}
+
+# Candidate parameters per algorithm, from cheapest to most expensive
+CANDIDATES = {
+    'pbkdf2_sha256': [{'iterations': n} for n in (260000, 390000, 600000, 870000, 1200000)],
+    'scrypt': [{'work_factor': 2 ** n, 'block_size': 8, 'parallelism': 1} for n in (13, 14, 15, 16)],
+    'argon2': [
+        {'time_cost': time_cost, 'memory_cost': memory_cost, 'parallelism': 8}
+        for time_cost, memory_cost in ((2, 19456), (2, 65536), (3, 65536), (2, 102400), (4, 102400))
+    ],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures how long hashing one password takes with candidate parameters of each '
+        'password hasher on this machine, to pick PASSWORD_HASHER_PARAMS for a login latency budget'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--algorithm', action='append', choices=sorted(HASHERS),
+            help='Algorithm to benchmark (repeatable; all of them by default)'
+        )
+        parser.add_argument('--rounds', type=int, default=20, help='Hashes timed per candidate')
+        parser.add_argument(
+            '--target-ms', type=float,
+            help='Hashing budget per login; suggests the most expensive parameters whose p99 fits'
+        )
+
+    def handle(self, *args, **options):
+        if options['rounds'] < 1:
+            raise CommandError('--rounds must be positive')
+
+        default_algorithm = get_hasher('default').algorithm
+        for algorithm in options['algorithm'] or sorted(HASHERS):
+            current = HASHERS[algorithm]().params
+            marker = ' (default hasher)' if algorithm == default_algorithm else ''
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{algorithm}{marker}'))
+
+            suggested = None
+            for params in CANDIDATES[algorithm]:
+                try:
+                    timings = self.measure(HASHERS[algorithm](**params), options['rounds'])
+                except ValueError as e:
+                    # Optional library not installed (argon2-cffi)
+                    self.stdout.write(self.style.WARNING(f'  skipped: {e}'))
+                    break
+                median, p99 = statistics.median(timings), timings[math.ceil(len(timings) * 0.99) - 1]
+                configured = ' *' if params == current else ''
+                self.stdout.write(
+                    f'  {params}: median {median:.1f} ms, p99 {p99:.1f} ms, '
+                    f'{1000 / median:.1f} hashes/s per core{configured}'
+                )
+                if options['target_ms'] is not None and p99 <= options['target_ms']:
+                    suggested = params
+            else:
+                self.suggest(algorithm, suggested, options['target_ms'])
+        self.stdout.write('* current PASSWORD_HASHER_PARAMS')
+
+    def suggest(self, algorithm, suggested, target_ms):
+        if target_ms is None:
+            return
+        if suggested is None:
+            self.stdout.write(self.style.WARNING(f'  No candidate fits {target_ms} ms'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"  Suggested: PASSWORD_HASHER_PARAMS['{algorithm}'] = {suggested}"))
+
+    def measure(self, hasher, rounds):
+        """
+        Sorted milliseconds per hash, after one warm-up hash.
+        """
+        hasher.encode('benchmark-password', hasher.salt())
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            hasher.encode('benchmark-password', hasher.salt())
+            timings.append((time.perf_counter() - started) * 1000)
+        return sorted(timings)
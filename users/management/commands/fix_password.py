@@ -1,3 +1,4 @@
+from django.contrib.auth.hashers import identify_hasher, is_password_usable
 from django.core.management.base import BaseCommand
 from users.models import CustomUser
 
@@ -5,13 +6,27 @@ class Command(BaseCommand):
     help = 'Fixes password hashing for all users'
 
     def handle(self, *args, **options):
-        users = CustomUser.objects.all()
+        users = CustomUser.objects.only('id', 'username', 'password').iterator()
         for user in users:
-            # Si la contraseña no está hasheada (no comienza con pbkdf2_sha256$)
-            if not user.password.startswith('pbkdf2_sha256$'):
+            # Si la contraseña no está hasheada con ninguno de PASSWORD_HASHERS
+            if not self.is_hashed(user.password):
                 # Guardamos la contraseña actual
                 current_password = user.password
                 # Establecemos la contraseña nuevamente (esto la hasheará)
                 user.set_password(current_password)
-                user.save()
-                self.stdout.write(self.style.SUCCESS(f'Password fixed for user {user.username}')) 
\ No newline at end of file
+                user.save(update_fields=['password'])
+                self.stdout.write(self.style.SUCCESS(f'Password fixed for user {user.username}'))
+
+    @staticmethod
+    def is_hashed(password):
+        """
+        True si el valor es un hash de algún hasher configurado (pbkdf2, scrypt, argon2...)
+        o una contraseña marcada como inutilizable.
+        """
+        if not is_password_usable(password):
+            return True
+        try:
+            identify_hasher(password)
+        except ValueError:
+            return False
+        return True
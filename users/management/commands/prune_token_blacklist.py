@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from users.services import TokenBlacklistService
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes expired refresh tokens and their blacklist entries in primary-key batches, '
+        'then rebuilds the blacklist Bloom filter (normally run daily by celery beat)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Tokens deleted per batch')
+        parser.add_argument('--pause', type=float, help='Seconds to sleep between batches')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        if options['pause'] is not None and options['pause'] < 0:
+            raise CommandError('--pause cannot be negative')
+
+        def progress(outstanding, blacklisted):
+            self.stdout.write(f'Deleted {outstanding} tokens ({blacklisted} blacklisted)')
+
+        outstanding, blacklisted = TokenBlacklistService.prune(
+            batch_size=options['batch_size'], pause=options['pause'], progress=progress
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Pruned {outstanding} expired tokens ({blacklisted} blacklisted); blacklist filter rebuilt'
+        ))
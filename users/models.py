@@ -1,4 +1,5 @@
 from datetime import timezone, timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.db import models
 from django.contrib.auth.models import AbstractUser
@@ -25,25 +26,21 @@ class CustomUser(AbstractUser):
     
 
     def lock(self):
+        """ Bloquea el usuario (ver users.services.LoginProtectionService) """
         self.is_locked = True
         self.lockout_time = timezone.now()
-        self.save()
+        self.save(update_fields=['is_locked', 'lockout_time', 'failed_attempts', 'updated_at'])
 
-
-    def increment_failed_attempts(self):
-        self.failed_attempts += 1
-        if self.failed_attempts >= 3:
-            self.lock()
-        self.save()
-
-    def reset_failed_attempts(self):
-        self.failed_attempts = 0
-        self.save()
+    @property
+    def locked_until(self):
+        if not self.lockout_time:
+            return None
+        return self.lockout_time + timedelta(minutes=settings.LOGIN_LOCKOUT_MINUTES)
 
     def unlock(self):
         """ Desbloquea el usuario después del tiempo de espera """
         if self.is_locked and self.lockout_time:
-            if timezone.now() > self.lockout_time + timedelta(minutes=15):
+            if timezone.now() > self.locked_until:
                 self.is_locked = False
                 self.failed_attempts = 0
-                self.save()
+                self.save(update_fields=['is_locked', 'failed_attempts', 'updated_at'])
@@ -1,12 +1,14 @@
-from datetime import timedelta
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt import serializers as jwt_serializers
 
 User = get_user_model()
 
+from .backends import CustomAuthBackend
 from .models import CustomUser
+from .tokens import RefreshToken
 
 class RegisterSerializer(serializers.Serializer):
     username = serializers.CharField(
@@ -84,38 +86,22 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(required=True, write_only=True)
 
     def validate(self, data):
+        """
+        Verifica las credenciales con CustomAuthBackend, que aplica el bloqueo por
+        intentos fallidos y la protección contra fuerza bruta.
+        """
         username = data.get('username')
         password = data.get('password')
 
         try:
-            user = CustomUser.objects.get(username=username)
-
-            if user.is_locked:
-                user.unlock()
-                if user.is_locked:
-                    raise serializers.ValidationError({
-                        'error':"Usuario bloqueado.",
-                        'locked_until': user.lockout_time + timedelta(minutes=10)
-                    })
-            
-            if not user.check_password(password):
-                user.increment_failed_attempts()
-                raise serializers.ValidationError({
-                    'error':'Contraseña incorrecta.',
-                    'attempts_left': 3 - user.failed_attempts
-                })
-            
-            if not user.is_active:
-                raise serializers.ValidationError('Tu cuenta está desactivada.')
-            
-            # Reset intentos fallidos si la autenticacion es exitosa
-            user.reset_failed_attempts()
-            return {
-                'user': user,
-                'username': username
-            }
-        except CustomUser.DoesNotExist:
-            raise serializers.ValidationError("Usuario no encontrado")
+            user = CustomAuthBackend().authenticate(self.context.get('request'), username=username, password=password)
+        except AuthenticationFailed as e:
+            raise serializers.ValidationError(e.detail)
+
+        return {
+            'user': user,
+            'username': username
+        }
         
         
 
@@ -145,4 +131,16 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ('id', 'username', 'email', 'is_admin', 'is_customer')
         read_only_fields = ('id', 'is_admin', 'is_customer')
 
-    
\ No newline at end of file
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    """
+    Emisión de tokens (api/token/) sin registrar el OutstandingToken, como LoginView (ver users.tokens)
+    """
+    token_class = RefreshToken
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """
+    Refresh de tokens que consulta la lista negra con el filtro de Bloom (ver users.tokens)
+    """
+    token_class = RefreshToken
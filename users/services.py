@@ -0,0 +1,225 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.exceptions import Throttled
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from core.batches import delete_in_batches
+from core.bloom import BloomFilter
+
+
+class LoginProtectionService:
+    """
+    Protección contra fuerza bruta para todos los puntos de inicio de sesión.
+
+    Cuenta los intentos fallidos por nombre de usuario y por IP de origen con
+    contadores de ventana deslizante en la caché (Redis), y rechaza los intentos
+    que superan el límite antes de consultar la base o calcular el hash de la
+    contraseña. Además bloquea la cuenta (en la base) al alcanzar
+    LOGIN_MAX_FAILED_ATTEMPTS intentos fallidos.
+
+    La ventana deslizante se aproxima con dos ventanas fijas: los intentos de la
+    ventana anterior cuentan en proporción al tiempo que falta para que salgan
+    de la ventana actual. Son dos claves por identificador, sin listas ni scripts.
+    """
+
+    @staticmethod
+    def client_ip(request):
+        """
+        IP de origen del request; LOGIN_CLIENT_IP_HEADER permite usar el header
+        del proxy de confianza (se toma la primera IP de la lista).
+        """
+        if request is None:
+            return None
+        header = getattr(settings, 'LOGIN_CLIENT_IP_HEADER', 'REMOTE_ADDR')
+        value = request.META.get(header) or request.META.get('REMOTE_ADDR')
+        return value.split(',')[0].strip() if value else None
+
+    @staticmethod
+    def check(username, ip):
+        """
+        Rechaza el intento (429) si el usuario o la IP superaron su límite de fallos.
+        """
+        limits = LoginProtectionService._limits(username, ip)
+        failures = LoginProtectionService._counts([key for key, _ in limits])
+        for (key, limit), count in zip(limits, failures):
+            if count >= limit:
+                raise Throttled(
+                    wait=LoginProtectionService._wait(),
+                    detail='Demasiados intentos fallidos de inicio de sesión. Intenta nuevamente más tarde.'
+                )
+
+    @staticmethod
+    def register_failure(username, ip, user=None):
+        """
+        Cuenta un intento fallido; bloquea al usuario si alcanza el máximo de intentos.
+
+        Returns:
+            int: Intentos fallidos recientes del usuario
+        """
+        keys = [key for key, _ in LoginProtectionService._limits(username, ip)]
+        window = LoginProtectionService._window()
+        index = int(time.time() // window)
+        for key in keys:
+            current = f'{key}:{index}'
+            # Cada ventana se necesita hasta que deja de ser la anterior
+            cache.add(current, 0, window * 2)
+            try:
+                cache.incr(current)
+            except ValueError:
+                cache.set(current, 1, window * 2)
+
+        attempts = int(LoginProtectionService._counts(keys[:1])[0])
+        if user is not None:
+            user.failed_attempts = attempts
+            if attempts >= settings.LOGIN_MAX_FAILED_ATTEMPTS and not user.is_locked:
+                user.lock()
+        return attempts
+
+    @staticmethod
+    def reset(username):
+        """
+        Olvida los intentos fallidos del usuario (no los de la IP).
+        """
+        key = LoginProtectionService._key('user', username)
+        index = int(time.time() // LoginProtectionService._window())
+        cache.delete_many([f'{key}:{index}', f'{key}:{index - 1}'])
+
+    @staticmethod
+    def _limits(username, ip):
+        limits = [(LoginProtectionService._key('user', username), settings.LOGIN_USERNAME_MAX_FAILURES)]
+        if ip:
+            limits.append((LoginProtectionService._key('ip', ip), settings.LOGIN_IP_MAX_FAILURES))
+        return limits
+
+    @staticmethod
+    def _key(scope, identifier):
+        digest = hashlib.md5(str(identifier or '').lower().encode()).hexdigest()
+        return f'login:failures:{scope}:{digest}'
+
+    @staticmethod
+    def _window():
+        return settings.LOGIN_LOCKOUT_MINUTES * 60
+
+    @staticmethod
+    def _wait():
+        window = LoginProtectionService._window()
+        return window - time.time() % window
+
+    @staticmethod
+    def _counts(keys):
+        """
+        Intentos en la ventana deslizante para cada clave, con una sola lectura a la caché.
+        """
+        window = LoginProtectionService._window()
+        now = time.time()
+        index = int(now // window)
+        previous_weight = 1 - (now % window) / window
+        found = cache.get_many([f'{key}:{i}' for key in keys for i in (index, index - 1)])
+        return [
+            found.get(f'{key}:{index}', 0) + found.get(f'{key}:{index - 1}', 0) * previous_weight
+            for key in keys
+        ]
+
+
+class TokenBlacklistService:
+    """
+    Lista negra de refresh tokens (app token_blacklist de simplejwt).
+
+    Cada refresh consulta si el token está en la lista negra. Un filtro de Bloom
+    en Redis con los jti de los tokens bloqueados responde antes: si dice que no
+    está (el caso normal) no se consulta la base; solo una coincidencia probable
+    (o un filtro aún no construido) llega a la tabla. Un filtro sin construir se
+    reconstruye en el primer refresh que lo encuentra (rebuild_filter_once).
+
+    prune() borra por lotes los tokens vencidos (ya no sirven para refrescar) y
+    reconstruye el filtro con los bloqueados que siguen vigentes.
+    """
+
+    bloom = BloomFilter(
+        'users:token_blacklist:bloom',
+        capacity=settings.TOKEN_BLACKLIST_BLOOM_CAPACITY,
+        error_rate=settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE
+    )
+
+    # Solo un worker reconstruye el filtro faltante; este es el máximo que puede tardar
+    REBUILD_LOCK_KEY = 'users:token_blacklist:bloom:rebuilding'
+    REBUILD_LOCK_TIMEOUT = 60 * 5
+
+    @staticmethod
+    def is_blacklisted(jti):
+        built, might_contain = TokenBlacklistService.bloom.check(jti)
+        if not built:
+            TokenBlacklistService.rebuild_filter_once()
+        elif not might_contain:
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    @staticmethod
+    def rebuild_filter_once():
+        """
+        Reconstruye el filtro si ningún otro worker lo está haciendo.
+
+        Se llama al encontrar el filtro sin construir (después de un deploy o de que
+        Redis lo pierda), para no esperar a la tarea diaria: el primer request lo
+        reconstruye y los demás consultan la base mientras tanto.
+        """
+        if not cache.add(TokenBlacklistService.REBUILD_LOCK_KEY, 1, TokenBlacklistService.REBUILD_LOCK_TIMEOUT):
+            return
+        try:
+            TokenBlacklistService.rebuild_filter()
+        finally:
+            cache.delete(TokenBlacklistService.REBUILD_LOCK_KEY)
+
+    @staticmethod
+    def rebuild_filter():
+        """
+        Reconstruye el filtro con los jti bloqueados de tokens no vencidos.
+        """
+        started_at = timezone.now()
+        jtis = BlacklistedToken.objects.filter(
+            token__expires_at__gt=started_at
+        ).values_list('token__jti', flat=True)
+        TokenBlacklistService.bloom.rebuild(jtis.iterator(chunk_size=settings.TOKEN_BLACKLIST_PRUNE_BATCH_SIZE))
+
+        # Los bloqueados mientras se reconstruía se agregaron al filtro anterior
+        recent = BlacklistedToken.objects.filter(blacklisted_at__gte=started_at).values_list('token__jti', flat=True)
+        TokenBlacklistService.bloom.add(*recent)
+
+    @staticmethod
+    def prune(batch_size=None, pause=None, progress=None):
+        """
+        Borra los tokens vencidos (y su entrada en la lista negra) en lotes por clave primaria.
+
+        Cada lote es una transacción corta sobre un rango de ids, con una pausa
+        entre lotes (ver core.batches); al terminar reconstruye el filtro.
+
+        Args:
+            batch_size (int): Tokens por lote (TOKEN_BLACKLIST_PRUNE_BATCH_SIZE por defecto)
+            pause (float): Segundos de espera entre lotes (TOKEN_BLACKLIST_PRUNE_PAUSE por defecto)
+            progress (callable): Se llama tras cada lote con los totales borrados hasta el momento
+
+        Returns:
+            tuple: (tokens borrados, entradas de la lista negra borradas)
+        """
+        batch_size = batch_size or settings.TOKEN_BLACKLIST_PRUNE_BATCH_SIZE
+        pause = settings.TOKEN_BLACKLIST_PRUNE_PAUSE if pause is None else pause
+        now = timezone.now()
+
+        def totals(per_model):
+            return per_model.get(OutstandingToken._meta.label, 0), per_model.get(BlacklistedToken._meta.label, 0)
+
+        # Las filas se crean al bloquear tokens (users.tokens.RefreshToken), así que los
+        # ids crecen aproximadamente con el vencimiento: el recorrido por clave primaria
+        # encuentra primero los vencidos sin necesitar un índice en expires_at
+        _, per_model = delete_in_batches(
+            OutstandingToken.objects.filter(expires_at__lte=now), batch_size, pause,
+            progress=None if progress is None else lambda _, per_model: progress(*totals(per_model))
+        )
+        outstanding, blacklisted = totals(per_model)
+
+        TokenBlacklistService.rebuild_filter()
+        return outstanding, blacklisted
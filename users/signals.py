@@ -1,24 +1,37 @@
 from django.contrib.auth.signals import user_login_failed
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.utils.timezone import now
-from django.conf import settings
+
+from core.cache import bump_tag_versions
+from users.authentication import auth_user_cache_key
 from users.models import CustomUser
+from users.services import LoginProtectionService
 
-MAX_FAILED_ATTEMPS = 5
 
 @receiver(user_login_failed)
-def login_failed_handler(sender, credentials, **kwargs):
-    username = credentials.get('username')
-    try:
-        user = CustomUser.objects.get(username=username)
+def login_failed_handler(sender, credentials, request=None, **kwargs):
+    """
+    Cuenta los intentos fallidos informados por django.contrib.auth.authenticate.
+
+    CustomAuthBackend registra sus propios fallos (y rechaza con una excepción,
+    por lo que no dispara este signal); este handler cubre los demás casos, con
+    los mismos contadores y límites.
+    """
+    LoginProtectionService.register_failure(credentials.get('username'), LoginProtectionService.client_ip(request))
 
-        # Incrementar el contador de intentos fallidos
-        user.failed_attemps += 1
 
-        if user.failed_attemps >= MAX_FAILED_ATTEMPS:
-            user.is_locked = True
-            user.lockout_time = now()
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_user_caches(sender, instance, **kwargs):
+    """
+    Invalida el usuario cacheado por CachedJWTAuthentication (bloqueo, desactivación,
+    perfil...) y las respuestas del perfil cacheadas con el tag 'user:<id>'.
 
-        user.save()
-    except CustomUser.DoesNotExist:
-        pass
\ No newline at end of file
+    Se hace al confirmar la transacción para que otro request no vuelva a cachear
+    los datos anteriores mientras tanto.
+    """
+    key = auth_user_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+    # Respuestas cacheadas del perfil (ProfileView, UserMeView)
+    bump_tag_versions(f'user:{instance.pk}')
@@ -0,0 +1,12 @@
+from celery import shared_task
+
+from .services import TokenBlacklistService
+
+
+@shared_task
+def prune_token_blacklist_task():
+    """
+    Tarea periódica que borra los refresh tokens vencidos (OutstandingToken y su entrada en
+    BlacklistedToken) y reconstruye el filtro de la lista negra
+    """
+    return TokenBlacklistService.prune()
@@ -0,0 +1,110 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed, Throttled
+from rest_framework.test import APIClient
+
+from users.backends import CustomAuthBackend
+from users.models import CustomUser
+from users.services import LoginProtectionService
+
+pytestmark = pytest.mark.django_db
+
+
+def login(password, username='ana'):
+    return CustomAuthBackend().authenticate(None, username=username, password=password)
+
+
+class TestLoginLockout:
+    def test_successful_login_does_not_write(self, user, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert login('secreta123') == user
+
+    def test_failures_are_counted_in_cache(self, user, django_assert_num_queries):
+        with django_assert_num_queries(1), pytest.raises(AuthenticationFailed) as error:
+            login('mala')
+        assert error.value.detail['attempts_left'] == '2'
+
+        login('secreta123')
+        with pytest.raises(AuthenticationFailed) as error:
+            login('mala')
+        assert error.value.detail['attempts_left'] == '2'
+
+    def test_locks_after_max_attempts_with_one_write(self, user, django_assert_num_queries):
+        for _ in range(2):
+            with pytest.raises(AuthenticationFailed):
+                login('mala')
+
+        with django_assert_num_queries(2), pytest.raises(AuthenticationFailed):
+            login('mala')
+
+        user.refresh_from_db()
+        assert user.is_locked
+        assert user.failed_attempts == 3
+        with pytest.raises(AuthenticationFailed) as error:
+            login('secreta123')
+        assert error.value.detail['locked_until'] == str(user.locked_until)
+
+    def test_unlocks_after_lockout_period(self, user):
+        CustomUser.objects.filter(pk=user.pk).update(
+            is_locked=True, failed_attempts=3,
+            lockout_time=timezone.now() - datetime.timedelta(minutes=16)
+        )
+
+        assert login('secreta123') == user
+        user.refresh_from_db()
+        assert not user.is_locked
+        assert user.failed_attempts == 0
+
+
+class TestBruteForceProtection:
+    @pytest.fixture(autouse=True)
+    def limits(self, settings):
+        settings.LOGIN_USERNAME_MAX_FAILURES = 5
+        settings.LOGIN_IP_MAX_FAILURES = 8
+
+    def test_username_limit_rejects_before_lookup_and_hashing(self, user, django_assert_num_queries):
+        for _ in range(5):
+            LoginProtectionService.register_failure('ana', None)
+
+        with mock.patch.object(CustomUser, 'check_password') as check_password:
+            with django_assert_num_queries(0), pytest.raises(Throttled):
+                login('secreta123')
+        check_password.assert_not_called()
+
+    def test_unknown_usernames_are_counted(self, django_assert_num_queries):
+        for _ in range(5):
+            with pytest.raises(AuthenticationFailed):
+                login('mala', username='nadie')
+
+        with django_assert_num_queries(0), pytest.raises(Throttled):
+            login('mala', username='NADIE')
+
+    def test_ip_limit_spans_usernames(self, user):
+        client = APIClient(REMOTE_ADDR='10.0.0.7')
+        for i in range(8):
+            response = client.post('/api/users/login/', {'username': f'user{i}', 'password': 'x'})
+            assert response.status_code == 400
+
+        response = client.post('/api/users/login/', {'username': 'ana', 'password': 'secreta123'})
+        assert response.status_code == 429
+        assert 'Retry-After' in response
+
+        other = APIClient(REMOTE_ADDR='10.0.0.8')
+        response = other.post('/api/users/login/', {'username': 'ana', 'password': 'secreta123'})
+        assert response.status_code == 200
+
+    def test_login_view_reports_attempts_left(self, user):
+        response = APIClient().post('/api/users/login/', {'username': 'ana', 'password': 'mala'})
+        assert response.status_code == 400
+        assert response.data['attempts_left'] == ['2']
+
+    def test_token_endpoint_is_protected(self, user):
+        client = APIClient()
+        for _ in range(5):
+            LoginProtectionService.register_failure('ana', '127.0.0.1')
+
+        response = client.post('/api/token/', {'username': 'ana', 'password': 'secreta123'})
+        assert response.status_code == 429
@@ -0,0 +1,85 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient, APIRequestFactory
+
+from users.authentication import (
+    CachedJWTAuthentication, ReadOnlyUserError, TokenClaimsAuthentication, auth_user_cache_key
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestCachedJWTAuthentication:
+    url = '/api/notifications/mark-all-read/'
+
+    def test_user_is_read_once(self, auth_client, django_assert_num_queries):
+        # User lookup + the update
+        with django_assert_num_queries(2):
+            assert auth_client.post(self.url).status_code == 200
+        with django_assert_num_queries(1):
+            assert auth_client.post(self.url).status_code == 200
+
+    def test_save_invalidates_cached_user(self, auth_client, user, django_capture_on_commit_callbacks,
+                                          django_assert_num_queries):
+        auth_client.post(self.url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.email = 'ana.perez@example.com'
+            user.save()
+        assert cache.get(auth_user_cache_key(user.pk)) is None
+        with django_assert_num_queries(2):
+            auth_client.post(self.url)
+
+    def test_only_permission_fields_are_cached(self, auth_client, user):
+        auth_client.post(self.url)
+
+        assert cache.get(auth_user_cache_key(user.pk)) == {
+            'id': user.pk, 'username': 'ana', 'is_admin': False, 'is_customer': True,
+            'is_active': True, 'is_locked': False,
+        }
+
+    def test_profile_update_does_not_save_the_cached_user(self, auth_client, user):
+        auth_client.post(self.url)
+
+        assert auth_client.put('/api/users/profile/', {'email': 'ana.perez@example.com'}).status_code == 200
+        user.refresh_from_db()
+        assert user.email == 'ana.perez@example.com'
+        assert user.check_password('secreta123')
+
+    def test_deactivated_user_is_rejected(self, auth_client, user, django_capture_on_commit_callbacks):
+        auth_client.post(self.url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.is_active = False
+            user.save()
+        assert auth_client.post(self.url).status_code == 401
+
+    @pytest.mark.parametrize('authentication', [CachedJWTAuthentication, TokenClaimsAuthentication])
+    def test_user_is_read_only_and_loads_missing_fields(self, authentication, user, token):
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        for _ in range(2):
+            # Cache miss, then hit
+            request_user, _ = authentication().authenticate(request)
+
+            assert request_user.email == 'ana@example.com'
+            assert request_user.is_staff is False
+            with pytest.raises(ReadOnlyUserError):
+                request_user.save()
+            with pytest.raises(ReadOnlyUserError):
+                request_user.delete()
+
+
+class TestTokenClaimsAuthentication:
+    def test_read_only_endpoint_does_not_load_user(self, auth_client, django_assert_num_queries):
+        # Only the first read after the cache was emptied loads the latest broadcast id
+        auth_client.get('/api/notifications/list/')
+
+        # Only the notifications query
+        with django_assert_num_queries(1):
+            response = auth_client.get('/api/notifications/list/')
+        assert response.status_code == 200
+
+    def test_invalid_token_is_rejected(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer invalido')
+        assert client.get('/api/notifications/list/').status_code == 401
@@ -0,0 +1,72 @@
+import pytest
+from django.contrib.auth.hashers import get_hasher
+from django.core.management import call_command
+
+from users.backends import CustomAuthBackend
+from users.hashers import TunedScryptPasswordHasher
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def fast_hashers(settings):
+    settings.PASSWORD_HASHER_PARAMS = {
+        'pbkdf2_sha256': {'iterations': 1000},
+        'scrypt': {'work_factor': 2 ** 4, 'block_size': 8, 'parallelism': 1},
+    }
+    # Reassigning PASSWORD_HASHERS resets Django's cached hasher instances
+    settings.PASSWORD_HASHERS = list(settings.PASSWORD_HASHERS)
+    return settings
+
+
+class TestTunedHashers:
+    def test_parameters_come_from_settings(self, fast_hashers):
+        assert get_hasher('pbkdf2_sha256').iterations == 1000
+        assert get_hasher('scrypt').params == {'work_factor': 16, 'block_size': 8, 'parallelism': 1}
+        assert TunedScryptPasswordHasher(work_factor=2 ** 5).work_factor == 32
+
+    def test_login_rehashes_with_current_parameters(self, fast_hashers):
+        user = CustomUser.objects.create_user(username='ana', email='ana@example.com', password='secreta123')
+        assert user.password.startswith('pbkdf2_sha256$1000$')
+
+        fast_hashers.PASSWORD_HASHER_PARAMS = {'pbkdf2_sha256': {'iterations': 2000}}
+        fast_hashers.PASSWORD_HASHERS = list(fast_hashers.PASSWORD_HASHERS)
+        CustomAuthBackend().authenticate(None, username='ana', password='secreta123')
+
+        user.refresh_from_db()
+        assert user.password.startswith('pbkdf2_sha256$2000$')
+
+    def test_login_migrates_to_preferred_hasher(self, fast_hashers):
+        user = CustomUser.objects.create_user(username='ana', email='ana@example.com')
+        user.password = get_hasher('scrypt').encode('secreta123', 'salt1234salt1234')
+        user.save()
+
+        CustomAuthBackend().authenticate(None, username='ana', password='secreta123')
+
+        user.refresh_from_db()
+        assert user.password.startswith('pbkdf2_sha256$')
+
+
+class TestFixPassword:
+    def test_leaves_hashes_of_any_configured_hasher(self, fast_hashers):
+        hashed = get_hasher('scrypt').encode('secreta123', 'salt1234salt1234')
+        scrypt_user = CustomUser.objects.create_user(username='ana', email='ana@example.com')
+        CustomUser.objects.filter(pk=scrypt_user.pk).update(password=hashed)
+        plain_user = CustomUser.objects.create_user(username='luis', email='luis@example.com')
+        CustomUser.objects.filter(pk=plain_user.pk).update(password='texto-plano')
+
+        call_command('fix_password')
+
+        scrypt_user.refresh_from_db()
+        plain_user.refresh_from_db()
+        assert scrypt_user.password == hashed
+        assert plain_user.check_password('texto-plano')
+
+
+def test_benchmark_command(capsys):
+    call_command('benchmark_password_hashers', '--algorithm', 'scrypt', '--rounds', '1', '--target-ms', '100000')
+
+    out = capsys.readouterr().out
+    assert "'work_factor': 16384" in out
+    assert "Suggested: PASSWORD_HASHER_PARAMS['scrypt']" in out
@@ -0,0 +1,41 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize('url', ['/api/users/me/', '/api/users/profile/'])
+class TestCachedProfile:
+    def test_payload_is_cached_per_user(self, auth_client, url, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            first = auth_client.get(url)
+        with django_assert_num_queries(0):
+            second = auth_client.get(url)
+        assert first.status_code == second.status_code == 200
+        assert second.json() == {
+            'id': first.data['id'], 'username': 'ana', 'email': 'ana@example.com',
+            'is_admin': False, 'is_customer': True,
+        }
+
+        other = CustomUser.objects.create_user(username='luis', email='luis@example.com', password='secreta123')
+        other_client = APIClient()
+        other_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(other)}')
+        assert other_client.get(url).json()['username'] == 'luis'
+
+    def test_profile_update_invalidates_payload(self, auth_client, url, django_capture_on_commit_callbacks):
+        auth_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = auth_client.put('/api/users/profile/', {'username': 'ana.perez'})
+        assert response.status_code == 200
+
+        assert auth_client.get(url).json()['username'] == 'ana.perez'
+
+    def test_conditional_get(self, auth_client, url):
+        etag = auth_client.get(url)['ETag']
+
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from users.services import TokenBlacklistService
+from users.tokens import RefreshToken
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_bloom():
+    TokenBlacklistService.bloom.clear()
+
+
+def refresh(token):
+    return APIClient().post('/api/token/refresh/', {'refresh': str(token)})
+
+
+class TestBlacklistFilter:
+    def test_logout_blacklists_refresh_token(self, user):
+        TokenBlacklistService.rebuild_filter()
+        token = RefreshToken.for_user(user)
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.post('/api/users/logout/', {'refresh': str(token)})
+        assert response.status_code == 200
+        assert refresh(token).status_code == 401
+
+    def test_refresh_skips_database_when_filter_rules_out_token(self, user, django_assert_num_queries):
+        token = RefreshToken.for_user(user)
+        TokenBlacklistService.rebuild_filter()
+
+        with django_assert_num_queries(0):
+            response = refresh(token)
+        assert response.status_code == 200
+
+    def test_issuing_tokens_does_not_write_outstanding_tokens(self, user, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            token = RefreshToken.for_user(user)
+        assert not OutstandingToken.objects.exists()
+
+        token.blacklist()
+        assert BlacklistedToken.objects.get().token.jti == token['jti']
+
+    def test_token_endpoint_does_not_write_outstanding_tokens(self, user):
+        response = APIClient().post('/api/token/', {'username': 'ana', 'password': 'secreta123'})
+
+        assert response.status_code == 200
+        assert not OutstandingToken.objects.exists()
+        assert refresh(response.json()['refresh']).status_code == 200
+
+    def test_missing_filter_is_rebuilt_on_first_refresh(self, user, django_assert_num_queries):
+        blacklisted = RefreshToken.for_user(user)
+        blacklisted.blacklist()
+        TokenBlacklistService.bloom.clear()
+
+        # Rebuild (two queries) and the database check
+        with django_assert_num_queries(3):
+            assert refresh(blacklisted).status_code == 401
+        with django_assert_num_queries(0):
+            assert refresh(RefreshToken.for_user(user)).status_code == 200
+
+    def test_database_is_checked_while_another_worker_rebuilds(self, user, django_assert_num_queries):
+        token = RefreshToken.for_user(user)
+        token.blacklist()
+        TokenBlacklistService.bloom.clear()
+        cache.add(TokenBlacklistService.REBUILD_LOCK_KEY, 1)
+
+        with django_assert_num_queries(1):
+            assert refresh(token).status_code == 401
+        assert not TokenBlacklistService.bloom.check(token['jti'])[0]
+
+
+class TestPrune:
+    def create_token(self, user, jti, expires_in, blacklisted=False):
+        token = OutstandingToken.objects.create(
+            user=user, jti=jti, token=jti, expires_at=timezone.now() + datetime.timedelta(days=expires_in)
+        )
+        if blacklisted:
+            BlacklistedToken.objects.create(token=token)
+        return token
+
+    def test_deletes_expired_tokens_in_batches(self, user):
+        for i in range(5):
+            self.create_token(user, f'expired-{i}', -1, blacklisted=i % 2 == 0)
+        live = self.create_token(user, 'live', 1, blacklisted=True)
+        batches = []
+
+        deleted = TokenBlacklistService.prune(batch_size=2, pause=0, progress=lambda *totals: batches.append(totals))
+
+        assert deleted == (5, 3)
+        assert batches == [(2, 1), (4, 2), (5, 3)]
+        assert list(OutstandingToken.objects.all()) == [live]
+        assert TokenBlacklistService.bloom.might_contain('live')
+        assert not TokenBlacklistService.bloom.might_contain('expired-0')
+
+    def test_command(self, user, capsys):
+        self.create_token(user, 'expired', -1)
+
+        call_command('prune_token_blacklist', '--pause', '0')
+
+        assert 'Pruned 1 expired tokens' in capsys.readouterr().out
+        assert not OutstandingToken.objects.exists()
@@ -0,0 +1,31 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt import tokens
+
+from users.services import TokenBlacklistService
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+    RefreshToken que consulta la lista negra a través del filtro de Bloom de
+    TokenBlacklistService y lo mantiene al bloquear tokens.
+
+    Los tokens emitidos no se registran en OutstandingToken (el login no escribe
+    en la base): la fila se crea recién al bloquearlo, así que la tabla solo tiene
+    los tokens bloqueados y no sirve para listar las sesiones abiertas.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        # Se saltea BlacklistMixin.for_user, que inserta el OutstandingToken
+        return super(tokens.BlacklistMixin, cls).for_user(user)
+
+    def check_blacklist(self):
+        if TokenBlacklistService.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        TokenBlacklistService.bloom.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
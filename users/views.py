@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.generics import get_object_or_404
 from django.contrib.auth import get_user_model
 from .serializers import UserSerializer, ProfileSerializer
 #from .models import Profile
@@ -16,7 +16,10 @@ from datetime import timedelta
 
 User = get_user_model()
 
+from core.decorators import cache_response, conditional_response
+from users.authentication import TokenClaimsAuthentication
 from users.serializers import RegisterSerializer, LoginSerializer
+from users.tokens import RefreshToken
 
 
 class RegisterView(APIView):
@@ -51,7 +54,7 @@ class LoginView(APIView):
         genera tokens JWT (access y refresh).
         Si las credenciales son inválidas, retorna los errores correspondientes.
         """
-        serializer = LoginSerializer(data=request.data)
+        serializer = LoginSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             user = serializer.validated_data['user']
             refresh = RefreshToken.for_user(user)
@@ -70,16 +73,22 @@ class LoginView(APIView):
 
 
 class ProfileView(APIView):
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @conditional_response(tags=('user:{user}',), vary_on_params=())
+    @cache_response(timeout=60 * 60, key_prefix='user_profile', tags=('user:{user}',), vary_on_params=())
     def get(self, request):
         """
         Endpoint para obtener el perfil del usuario autenticado.
         
         Retorna los datos del perfil del usuario actual.
         Requiere autenticación.
+        La respuesta se cachea por usuario y se invalida al guardar el usuario
+        (tag 'user:<id>'); al recalcularla solo se leen las columnas del serializer.
         """
-        serializer = ProfileSerializer(request.user)
+        user = get_object_or_404(User.objects.only(*ProfileSerializer.Meta.fields), pk=request.user.pk)
+        serializer = ProfileSerializer(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def put(self, request):
@@ -89,10 +98,13 @@ class ProfileView(APIView):
         Recibe los datos a actualizar y aplica los cambios si son válidos.
         Requiere autenticación.
         """
+        # request.user puede venir de la caché de autenticación, con solo algunas columnas
+        user = get_object_or_404(User, pk=request.user.pk)
         serializer = ProfileSerializer(
-            request.user,
+            user,
             data=request.data,
-            partial=True
+            partial=True,
+            context={'request': request}
         )
         if serializer.is_valid():
             serializer.save()
@@ -129,8 +141,17 @@ class LogoutView(APIView):
 
 
 class UserMeView(generics.RetrieveAPIView):
+    authentication_classes = [TokenClaimsAuthentication]
     permission_classes = [IsAuthenticated]
     serializer_class = UserSerializer
 
+    @conditional_response(tags=('user:{user}',), vary_on_params=())
+    @cache_response(timeout=60 * 60, key_prefix='user_me', tags=('user:{user}',), vary_on_params=())
+    def get(self, request, *args, **kwargs):
+        """
+        Endpoint con los datos del usuario autenticado, cacheado por usuario (ver ProfileView.get).
+        """
+        return super().get(request, *args, **kwargs)
+
     def get_object(self):
-        return self.request.user
\ No newline at end of file
+        return get_object_or_404(User.objects.only(*UserSerializer.Meta.fields), pk=self.request.user.pk)
\ No newline at end of file